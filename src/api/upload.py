@@ -22,32 +22,122 @@ Per RULES.md §10:
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import multiprocessing
 import os
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
 import aiohttp
-from fastapi import FastAPI, File, Request, UploadFile, HTTPException
+import anyio.to_thread
+from fastapi import APIRouter, FastAPI, File, Request, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 logger = logging.getLogger("voiceops.api")
 
-from src.audio.normalizer import AudioValidationError, AudioNormalizationError
-from src.pipeline import run_pipeline
+from src.audio.normalizer import (
+    ALLOWED_EXTENSIONS,
+    AudioNormalizationError,
+    AudioValidationError,
+)
+from src.audio.vad import warmup_vad
+from src.json_codec import dumps as json_dumps
+from src.pipeline import run_pipeline, run_post, run_preprocess
 from src.phase_validator import PhaseVerificationError
 
 WEBHOOK_URL: str | None = os.getenv("WEBHOOK_URL")
 
+# Batched webhook delivery. When enabled, results are queued and a
+# background task POSTs them as a JSON array of up to WEBHOOK_BATCH_SIZE
+# items, waiting at most WEBHOOK_BATCH_TIMEOUT_SECONDS to fill a batch.
+# The endpoint then returns the pipeline output without waiting on the
+# webhook. Disabled by default: the inline POST returns the webhook's
+# JSON reply to the caller, which batching cannot do.
+WEBHOOK_BATCHING: bool = os.getenv("WEBHOOK_BATCHING", "0") == "1"
+WEBHOOK_BATCH_SIZE: int = int(os.getenv("WEBHOOK_BATCH_SIZE", "20"))
+WEBHOOK_BATCH_TIMEOUT_SECONDS: float = float(
+    os.getenv("WEBHOOK_BATCH_TIMEOUT_SECONDS", "0.5")
+)
+
+# Size of each read from the uploaded file. The upload is consumed in
+# fixed-size pieces so the request handler never asks Starlette for the
+# whole body in one call.
+UPLOAD_READ_CHUNK_BYTES: int = int(os.getenv("UPLOAD_READ_CHUNK_BYTES", str(1 << 20)))
+
+# Largest accepted upload. Checked against Content-Length before the body
+# is read, and again while streaming in case the header is absent or wrong.
+MAX_UPLOAD_BYTES: int = int(os.getenv("MAX_UPLOAD_BYTES", str(512 * 1024 * 1024)))
+
+# In-process LRU of pipeline results keyed by a SHA-256 of the upload.
+# Re-submitting identical audio (retries, QA replays) skips the pipeline.
+# Off by default (RESULT_CACHE_SIZE=0): cached results are held in process
+# memory and replayed even after prompts or models change. Set a size to
+# enable it.
+RESULT_CACHE_SIZE: int = int(os.getenv("RESULT_CACHE_SIZE", "0"))
+RESULT_CACHE_TTL_SECONDS: float = float(os.getenv("RESULT_CACHE_TTL_SECONDS", "3600"))
+
+# Content types accepted alongside audio/*. Many HTTP clients label any
+# file upload as a generic binary stream.
+_GENERIC_CONTENT_TYPES: frozenset[str] = frozenset({"application/octet-stream"})
+
+# Worker threads available to run_pipeline (per uvicorn worker process).
+# The pipeline spends most of its time blocked on STT / LLM network I/O,
+# so the pool is sized well above the CPU count.
+THREAD_POOL_SIZE: int = int(
+    os.getenv("THREAD_POOL_SIZE", str(max(32, (os.cpu_count() or 1) * 4)))
+)
+
+# Worker processes for the CPU-bound Phase 1 audio work (decode, resample,
+# quality analysis), keeping it off the GIL shared with the event loop and
+# the I/O-bound phases. Off by default (CPU_POOL_SIZE=0 runs everything on
+# a thread): each uvicorn worker would otherwise spawn cpu_count processes.
+CPU_POOL_SIZE: int = int(os.getenv("CPU_POOL_SIZE", "0"))
+
+# Load and run Silero VAD once at startup so the first request does not
+# pay for the torch import, torch.hub load and first-call kernel setup.
+VAD_WARMUP: bool = os.getenv("VAD_WARMUP", "1") == "1"
+
 
 # ---------------------------------------------------------------------------
 # Application
 # ---------------------------------------------------------------------------
 
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered through src.json_codec (orjson when available)."""
+
+    def render(self, content) -> bytes:
+        return json_dumps(content)
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Start shared resources before serving; release them in reverse."""
+    await _configure_thread_pool()
+    await _start_cpu_pool()
+    await _warm_vad()
+    await _open_http_session()
+    await _start_webhook_drainer()
+    try:
+        yield
+    finally:
+        await _stop_webhook_drainer()
+        await _close_http_session()
+        await _stop_cpu_pool()
+
+
 app = FastAPI(
     title="VoiceOps",
     description="Call-centric risk & fraud intelligence — audio analysis endpoint.",
     version="1.0.0",
+    default_response_class=FastJSONResponse,
+    lifespan=_lifespan,
 )
 
 app.add_middleware(
@@ -59,13 +149,259 @@ app.add_middleware(
 )
 
 
+async def _configure_thread_pool() -> None:
+    """
+    Install a THREAD_POOL_SIZE executor as the loop's default executor.
+
+    asyncio.to_thread() dispatches onto the default executor, whose stock
+    size (min(32, cpu_count + 4)) would otherwise cap how many analyses can
+    run concurrently. Starlette's own threadpool limiter is raised to match.
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE, thread_name_prefix="voiceops")
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
+    logger.info("Default thread pool configured: %d workers", THREAD_POOL_SIZE)
+
+
+def _init_cpu_worker(level: int) -> None:
+    """
+    Configure logging in a Phase 1 worker. Spawned processes start with no
+    handlers, so Phase 1 log lines would otherwise be dropped.
+    """
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s | %(name)s | %(levelname)s | %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
+async def _start_cpu_pool() -> None:
+    """Create the Phase 1 process pool (spawned — the server is threaded)."""
+    if CPU_POOL_SIZE <= 0:
+        return
+    app.state.cpu_pool = ProcessPoolExecutor(
+        max_workers=CPU_POOL_SIZE,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_cpu_worker,
+        initargs=(logging.getLogger().getEffectiveLevel(),),
+    )
+    logger.info("CPU process pool configured: %d workers", CPU_POOL_SIZE)
+
+
+async def _stop_cpu_pool() -> None:
+    """Shut down the Phase 1 process pool."""
+    pool = getattr(app.state, "cpu_pool", None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _warm_vad() -> None:
+    """Pre-load Silero VAD on a worker thread (best-effort)."""
+    if VAD_WARMUP:
+        await asyncio.to_thread(warmup_vad)
+
+
+async def _open_http_session() -> None:
+    """Create the shared aiohttp session used for webhook delivery."""
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60),
+    )
+
+
+async def _close_http_session() -> None:
+    """Close the shared aiohttp session and its pooled connections."""
+    session = getattr(app.state, "http", None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """
+    Return the shared aiohttp session, creating it if startup did not run
+    (e.g. when the app is driven without its lifespan).
+    """
+    session = getattr(app.state, "http", None)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60),
+        )
+        app.state.http = session
+    return session
+
+
+# ---------------------------------------------------------------------------
+# Batched webhook delivery
+# ---------------------------------------------------------------------------
+
+
+async def _start_webhook_drainer() -> None:
+    """Create the webhook queue and spawn its drainer when batching is on."""
+    if not (WEBHOOK_URL and WEBHOOK_BATCHING):
+        return
+    app.state.wh_queue = asyncio.Queue()
+    app.state.wh_task = asyncio.create_task(_webhook_drainer(app.state.wh_queue))
+
+
+async def _stop_webhook_drainer() -> None:
+    """Flush queued results and stop the drainer task."""
+    queue = getattr(app.state, "wh_queue", None)
+    task = getattr(app.state, "wh_task", None)
+    if queue is None or task is None:
+        return
+    await queue.join()
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def _collect_webhook_batch(queue: asyncio.Queue) -> list[dict]:
+    """
+    Block for the first queued result, then gather more until the batch
+    holds WEBHOOK_BATCH_SIZE items or WEBHOOK_BATCH_TIMEOUT_SECONDS elapse.
+    """
+    batch = [await queue.get()]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + WEBHOOK_BATCH_TIMEOUT_SECONDS
+    while len(batch) < WEBHOOK_BATCH_SIZE:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+async def _webhook_drainer(queue: asyncio.Queue) -> None:
+    """Background task: POST queued results to WEBHOOK_URL in batches."""
+    while True:
+        batch = await _collect_webhook_batch(queue)
+        try:
+            async with _get_http_session().post(
+                WEBHOOK_URL,
+                data=json_dumps(batch),
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as resp:
+                logger.info(
+                    "Webhook batch POST to %s — %d item(s), status %d",
+                    WEBHOOK_URL, len(batch), resp.status,
+                )
+        except Exception as exc:
+            logger.error("Webhook batch POST failed (%d item(s)): %s", len(batch), exc)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+# ---------------------------------------------------------------------------
+# Upload helpers
+# ---------------------------------------------------------------------------
+
+
+async def _read_upload(audio_file: UploadFile) -> tuple[bytearray, str]:
+    """
+    Read the uploaded file in UPLOAD_READ_CHUNK_BYTES pieces.
+
+    The pieces are appended to a single growable buffer instead of
+    materialising one large ``bytes`` object from ``UploadFile.read()``.
+    The returned bytearray is bytes-like and is accepted by every
+    downstream consumer (io.BytesIO, wave, pydub).
+
+    Returns:
+        (buffer, sha256 hex digest of the content). The digest is
+        computed while reading, so no second pass over the data is needed.
+    """
+    buffer = bytearray()
+    hasher = hashlib.sha256()
+    while True:
+        chunk = await audio_file.read(UPLOAD_READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        if len(buffer) + len(chunk) > MAX_UPLOAD_BYTES:
+            raise _upload_too_large()
+        hasher.update(chunk)
+        buffer += chunk
+    return buffer, hasher.hexdigest()
+
+
+def _upload_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"Upload exceeds the maximum size of {MAX_UPLOAD_BYTES} bytes.",
+    )
+
+
+async def _run_pipeline(audio_bytes: bytearray, filename: str) -> dict:
+    """
+    Run the pipeline off the event loop.
+
+    With a CPU pool configured, Phase 1 runs in a worker process and
+    Phases 2 → 8 on a thread; otherwise the whole pipeline runs on a thread.
+    """
+    cpu_pool = getattr(app.state, "cpu_pool", None)
+    if cpu_pool is None:
+        return await asyncio.to_thread(run_pipeline, audio_bytes, filename)
+
+    loop = asyncio.get_running_loop()
+    normalized_audio, audio_quality = await loop.run_in_executor(
+        cpu_pool, run_preprocess, audio_bytes, filename,
+    )
+    return await asyncio.to_thread(run_post, normalized_audio, audio_quality)
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+# key -> (stored_at monotonic seconds, final_output)
+_result_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+
+
+def _result_cache_key(digest: str, filename: str) -> str:
+    """Cache key: content digest plus extension (it selects the decoder)."""
+    _, _, ext = filename.rpartition(".")
+    return f"{digest}:{ext.lower()}"
+
+
+def _result_cache_get(key: str) -> dict | None:
+    """Return a cached result and mark it most-recently used, or None."""
+    entry = _result_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, result = entry
+    if time.monotonic() - stored_at > RESULT_CACHE_TTL_SECONDS:
+        del _result_cache[key]
+        return None
+    _result_cache.move_to_end(key)
+    return result
+
+
+def _result_cache_put(key: str, result: dict) -> None:
+    """Store a result, evicting the least-recently used entry when full."""
+    if RESULT_CACHE_SIZE <= 0:
+        return
+    _result_cache[key] = (time.monotonic(), result)
+    _result_cache.move_to_end(key)
+    while len(_result_cache) > RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+
+
 # ---------------------------------------------------------------------------
 # Endpoint
 # ---------------------------------------------------------------------------
 
 
-@app.post("/api/v1/analyze-call")
-async def analyze_call(audio_file: UploadFile = File(...)):
+router = APIRouter()
+
+
+@router.post("/api/v1/analyze-call")
+async def analyze_call(request: Request, audio_file: UploadFile = File(...)):
     """
     Accept an audio file and run the full VoiceOps pipeline
     (Phase 1 → Phase 8).
@@ -73,6 +409,7 @@ async def analyze_call(audio_file: UploadFile = File(...)):
     Returns the FINAL STRUCTURED JSON per RULES.md §10.
 
     Args:
+        request: Incoming request (used for the Content-Length size check).
         audio_file: Uploaded audio file (.wav, .mp3, or .m4a).
 
     Returns:
@@ -86,19 +423,52 @@ async def analyze_call(audio_file: UploadFile = File(...)):
 
     logger.info("Audio file received: %s", audio_file.filename)
 
+    # Guard: file type must be supported (checked before reading the body)
+    ext = os.path.splitext(audio_file.filename)[1].lower()
+    if ext not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=415,
+            detail=(
+                f"Unsupported audio type '{ext or audio_file.filename}'. "
+                f"Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+            ),
+        )
+    content_type = (audio_file.content_type or "").split(";")[0].strip().lower()
+    if content_type and not (
+        content_type.startswith("audio/") or content_type in _GENERIC_CONTENT_TYPES
+    ):
+        raise HTTPException(
+            status_code=415,
+            detail=f"Unsupported content type '{content_type}'. Expected an audio file.",
+        )
+
+    # Guard: declared size must be within bounds
+    try:
+        content_length = int(request.headers.get("content-length", "0"))
+    except ValueError:
+        content_length = 0
+    if content_length > MAX_UPLOAD_BYTES:
+        raise _upload_too_large()
+
     # Read raw bytes
     try:
-        audio_bytes = await audio_file.read()
+        audio_bytes, digest = await _read_upload(audio_file)
+    except HTTPException:
+        raise
     except Exception:
         raise HTTPException(status_code=400, detail="Failed to read uploaded file.")
 
     logger.info("File size: %.2f KB", len(audio_bytes) / 1024)
 
+    cache_key = _result_cache_key(digest, audio_file.filename)
+    final_output = _result_cache_get(cache_key)
+    if final_output is not None:
+        logger.info("Result cache hit (%s) — skipping pipeline.", digest[:12])
+        return await _deliver(final_output)
+
     # Run full pipeline (Phase 1 → Phase 8)
     try:
-        final_output = await asyncio.to_thread(
-            run_pipeline, audio_bytes, audio_file.filename
-        )
+        final_output = await _run_pipeline(audio_bytes, audio_file.filename)
     except AudioValidationError as exc:
         raise HTTPException(status_code=422, detail=str(exc))
     except AudioNormalizationError as exc:
@@ -120,31 +490,50 @@ async def analyze_call(audio_file: UploadFile = File(...)):
         )
 
     logger.info("Full pipeline complete — returning final structured JSON.")
+    _result_cache_put(cache_key, final_output)
 
+    return await _deliver(final_output)
+
+
+async def _deliver(final_output: dict) -> FastJSONResponse:
+    """
+    Forward the final JSON to the webhook (if configured) and build the
+    endpoint response.
+    """
     # POST final JSON to the configured webhook endpoint
     webhook_response = None
-    if WEBHOOK_URL:
+    queue = getattr(app.state, "wh_queue", None)
+    if WEBHOOK_URL and queue is not None:
+        await queue.put(final_output)
+    elif WEBHOOK_URL:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    WEBHOOK_URL,
-                    json=final_output,
-                    headers={"Content-Type": "application/json"},
-                    timeout=aiohttp.ClientTimeout(total=30),
-                ) as resp:
-                    logger.info(
-                        "Webhook POST to %s — status %d", WEBHOOK_URL, resp.status,
-                    )
+            async with _get_http_session().post(
+                WEBHOOK_URL,
+                data=json_dumps(final_output),
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as resp:
+                logger.info(
+                    "Webhook POST to %s — status %d", WEBHOOK_URL, resp.status,
+                )
+                content_type = resp.headers.get("Content-Type", "")
+                if 200 <= resp.status < 300 and content_type.startswith("application/json"):
                     try:
                         webhook_response = await resp.json()
                     except Exception:
                         logger.warning("Webhook did not return valid JSON (status %d), skipping.", resp.status)
+                else:
+                    # Nothing usable in the body — don't download it
+                    resp.release()
         except Exception as exc:
             logger.error("Webhook POST failed: %s", exc)
     else:
         logger.debug("WEBHOOK_URL not configured — skipping POST.")
 
     if webhook_response is not None:
-        return JSONResponse(status_code=200, content=webhook_response)
+        return FastJSONResponse(status_code=200, content=webhook_response)
+
+    return FastJSONResponse(status_code=200, content=final_output)
+
 
-    return JSONResponse(status_code=200, content=final_output)
+app.include_router(router)
@@ -0,0 +1,92 @@
+"""
+src/audio/_quality_kernels.py
+==============================
+Optional Numba kernels for the audio quality heuristics — VoiceOps Phase 1
+
+Responsibility:
+    - Provide single-pass, loop-level kernels for the frame statistics
+      and autocorrelation peak search used by ``src/audio/quality.py``
+    - Compile them with ``numba.njit`` when numba is installed
+
+When numba is unavailable the functions are left as plain Python and
+``NUMBA_AVAILABLE`` is False; ``quality.py`` then keeps its vectorized
+NumPy path (the plain-Python loops are only used for testing parity).
+
+This module does NOT:
+    - Decode audio or classify quality levels
+    - Call LLMs or external APIs
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional — quality.py falls back to NumPy
+    njit = None
+
+NUMBA_AVAILABLE: bool = njit is not None
+
+
+def _jit(fn):
+    if njit is None:
+        return fn
+    return njit(cache=True, fastmath=True, boundscheck=False)(fn)
+
+
+# ---------------------------------------------------------------------------
+# Kernels
+# ---------------------------------------------------------------------------
+
+
+@_jit
+def frame_rms_zcr(pcm, frame_size):
+    """
+    Per-frame RMS energy and zero-crossing rate in one pass.
+
+    Args:
+        pcm: Contiguous 1-D float32 samples.
+        frame_size: Samples per frame; a trailing partial frame is dropped.
+
+    Returns:
+        (rms, zcr) — float64 arrays of length ``len(pcm) // frame_size``.
+    """
+    n_frames = pcm.shape[0] // frame_size
+    rms = np.empty(n_frames, dtype=np.float64)
+    zcr = np.empty(n_frames, dtype=np.float64)
+    for i in range(n_frames):
+        base = i * frame_size
+        energy = 0.0
+        crossings = 0
+        prev_neg = pcm[base] < 0.0
+        for j in range(frame_size):
+            x = pcm[base + j]
+            energy += x * x
+            neg = x < 0.0
+            if neg != prev_neg:
+                crossings += 1
+            prev_neg = neg
+        rms[i] = np.sqrt(energy / frame_size)
+        zcr[i] = crossings / frame_size
+    return rms, zcr
+
+
+@_jit
+def autocorr_peak(window, start, end):
+    """
+    Index of the largest autocorrelation value over lags ``[start, end)``.
+
+    Only the lags the naturalness heuristic searches are computed, using
+    direct dot products. The result is relative to *start*, matching
+    ``np.argmax(autocorr[start:end])``.
+    """
+    n = window.shape[0]
+    best_idx = 0
+    best_val = -np.inf
+    for lag in range(start, end):
+        acc = 0.0
+        for j in range(n - lag):
+            acc += window[j] * window[j + lag]
+        if acc > best_val:
+            best_val = acc
+            best_idx = lag - start
+    return best_idx
@@ -0,0 +1,47 @@
+"""
+src/audio/_wav.py
+==================
+WAV header builder — VoiceOps Phase 1 (internal)
+
+Responsibility:
+    - Build the canonical 44-byte RIFF/WAVE header for a PCM payload, so
+      the normalizer and the chunker can wrap PCM bytes without going
+      through the wave module
+
+This module does NOT:
+    - Read, decode or resample audio
+    - Copy or modify PCM data
+"""
+
+import struct
+
+
+def make_wav_header(
+    n_channels: int,
+    sampwidth: int,
+    sample_rate: int,
+    data_len: int,
+) -> bytes:
+    """
+    Build the canonical 44-byte RIFF/WAVE header for a PCM payload.
+
+    Byte-identical to what wave.Wave_write emits for the same parameters,
+    without going through the wave module for every chunk.
+    """
+    block_align = n_channels * sampwidth
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_len,
+        b"WAVE",
+        b"fmt ",
+        16,                          # fmt chunk size
+        1,                           # WAVE_FORMAT_PCM
+        n_channels,
+        sample_rate,
+        sample_rate * block_align,   # byte rate
+        block_align,
+        sampwidth * 8,               # bits per sample
+        b"data",
+        data_len,
+    )
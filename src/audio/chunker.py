@@ -25,12 +25,19 @@ This module does NOT:
 
 import io
 import logging
+import math
 import wave
-from typing import List, Tuple
+from typing import Iterator, Tuple
 
 import numpy as np
 
-from src.audio.vad import find_silence_gaps, chunk_has_speech
+from src.audio._wav import make_wav_header
+from src.audio.vad import (
+    SILENT_RMS_THRESHOLD,
+    chunk_has_speech_from_frames,
+    compute_vad_frames,
+    find_silence_gaps_from_frames,
+)
 
 logger = logging.getLogger("voiceops.audio.chunker")
 
@@ -60,6 +67,24 @@ def chunk_audio(
     """
     Split normalized WAV audio into overlapping, VAD-aware chunks.
 
+    Eager wrapper around chunk_audio_iter — see it for argument, return
+    and error details.
+    """
+    return list(chunk_audio_iter(audio_bytes, chunk_duration, overlap))
+
+
+def chunk_audio_iter(
+    audio_bytes: bytes,
+    chunk_duration: float = DEFAULT_CHUNK_DURATION_SEC,
+    overlap: float = DEFAULT_OVERLAP_SEC,
+) -> Iterator[dict]:
+    """
+    Split normalized WAV audio into overlapping, VAD-aware chunks,
+    yielding each chunk as soon as it is built.
+
+    Consumers (the STT layer) can start work on early chunks while later
+    ones are still being wrapped.
+
     Chunks are preferentially split at silence boundaries (detected via
     Silero VAD) to avoid cutting mid-utterance — the primary cause of
     Deepgram returning empty results for a chunk.
@@ -72,8 +97,8 @@ def chunk_audio(
         chunk_duration: Target duration of each chunk in seconds (20–30).
         overlap:        Overlap between consecutive chunks in seconds (2–3).
 
-    Returns:
-        List of chunk dicts, each containing:
+    Yields:
+        Chunk dicts in chunk_id order, each containing:
             - chunk_id    (int):   Sequential chunk index starting at 0
             - audio_bytes (bytes): Standalone WAV file bytes for the chunk
             - offset      (float): Start time of this chunk in the original
@@ -112,43 +137,61 @@ def chunk_audio(
         chunk_duration, overlap,
     )
 
-    # ------------------------------------------------------------------
-    # Convert raw PCM to float32 numpy array for VAD
-    # ------------------------------------------------------------------
     dtype_map = {1: np.int8, 2: np.int16, 4: np.int32}
-    np_dtype = dtype_map.get(sampwidth, np.int16)
-    pcm_float = np.frombuffer(raw_pcm, dtype=np_dtype).astype(np.float32)
-
     norm_map = {1: 128.0, 2: 32768.0, 4: 2147483648.0}
-    pcm_float = pcm_float / norm_map.get(sampwidth, 32768.0)
-
-    # Mix to mono if needed (shouldn't happen after Phase 1, but safety)
-    if n_channels > 1:
-        pcm_float = pcm_float.reshape(-1, n_channels).mean(axis=1)
+    np_dtype = dtype_map.get(sampwidth, np.int16)
+    full_scale = norm_map.get(sampwidth, 32768.0)
+    pcm_int = np.frombuffer(raw_pcm, dtype=np_dtype)
 
     # ------------------------------------------------------------------
-    # Short audio — return as a single chunk (no splitting needed)
+    # Short audio — return as a single chunk (no splitting needed).
+    # Only an energy gate is applied; STT handles the rest, so neither
+    # the float32 conversion nor Silero is needed here.
     # ------------------------------------------------------------------
     if total_duration <= _MAX_CHUNK_DURATION_SEC:
         logger.info(
             "Audio (%.1fs) fits in a single chunk — no splitting.", total_duration
         )
-        speech = chunk_has_speech(pcm_float, sample_rate=sample_rate)
-        return [
-            {
-                "chunk_id": 0,
-                "audio_bytes": audio_bytes,
-                "offset": 0.0,
-                "duration": round(total_duration, 3),
-                "has_speech": speech,
-            }
-        ]
+        if pcm_int.size:
+            energy = np.einsum("i,i->", pcm_int, pcm_int, dtype=np.float64)
+            rms = math.sqrt(energy / pcm_int.size) / full_scale
+        else:
+            rms = 0.0
+        yield {
+            "chunk_id": 0,
+            "audio_bytes": audio_bytes,
+            "offset": 0.0,
+            "duration": round(total_duration, 3),
+            "has_speech": rms >= SILENT_RMS_THRESHOLD,
+        }
+        return
+
+    # ------------------------------------------------------------------
+    # Convert raw PCM to float32 numpy array for VAD
+    # ------------------------------------------------------------------
+    # Cast and scale in a single pass into one float32 buffer
+    scale = np.float32(1.0 / full_scale)
+    pcm_float = np.empty(pcm_int.shape, dtype=np.float32)
+    np.multiply(pcm_int, scale, out=pcm_float, casting="unsafe")
+
+    # Mix to mono if needed (shouldn't happen after Phase 1, but safety)
+    if n_channels > 1:
+        pcm_float = np.mean(
+            pcm_float.reshape(-1, n_channels), axis=1, dtype=np.float32,
+        )
 
     # ------------------------------------------------------------------
     # Detect silence gaps across the full audio for intelligent splitting
     # ------------------------------------------------------------------
-    silence_gaps = find_silence_gaps(
-        pcm_float, sample_rate=sample_rate, min_silence_duration_ms=300,
+    # The VAD timeline is computed once and reused for the per-chunk
+    # speech flags below. A clip the energy pre-filter finds silent gets
+    # an all-silence timeline without running Silero.
+    vad_frames = compute_vad_frames(
+        pcm_float, sample_rate=sample_rate, skip_silent=True,
+    )
+    silence_gaps = find_silence_gaps_from_frames(
+        vad_frames, len(pcm_float),
+        sample_rate=sample_rate, min_silence_duration_ms=300,
     )
     logger.info(
         "VAD found %d silence gaps in %.1fs of audio.", len(silence_gaps), total_duration,
@@ -171,54 +214,53 @@ def chunk_audio(
     # ------------------------------------------------------------------
     # Build chunk boundaries with overlap
     # ------------------------------------------------------------------
+    # Every chunk after the first starts overlap_frames before its split
+    # point; all per-chunk offsets are computed in one vectorised pass.
     overlap_frames = int(overlap * sample_rate)
-    boundaries: list[Tuple[int, int]] = []
-    prev = 0
-    for sp in split_samples:
-        boundaries.append((prev, sp))
-        # Next chunk starts overlap_frames before the split point
-        prev = max(0, sp - overlap_frames)
-    boundaries.append((prev, n_frames))  # final chunk
+    splits = np.asarray(split_samples, dtype=np.int64)
+    starts = np.concatenate(([0], np.maximum(0, splits - overlap_frames)))
+    ends = np.append(splits, n_frames)
+
+    byte_starts = (starts * frame_byte_size).tolist()
+    byte_ends = (ends * frame_byte_size).tolist()
+    offsets = np.round(starts / sample_rate, 3).tolist()
+    durations = np.round((ends - starts) / sample_rate, 3).tolist()
 
     # ------------------------------------------------------------------
     # Extract chunks & run per-chunk VAD
     # ------------------------------------------------------------------
-    chunks: list[dict] = []
-    for idx, (start_frame, end_frame) in enumerate(boundaries):
-        chunk_raw = raw_pcm[start_frame * frame_byte_size : end_frame * frame_byte_size]
-        chunk_wav = _frames_to_wav(chunk_raw, n_channels, sampwidth, sample_rate)
-
-        offset_sec = round(start_frame / sample_rate, 3)
-        dur_sec = round((end_frame - start_frame) / sample_rate, 3)
-
-        # Per-chunk speech detection
-        chunk_pcm = pcm_float[start_frame:end_frame]
-        speech = chunk_has_speech(chunk_pcm, sample_rate=sample_rate)
-
+    speech_flags = [
+        chunk_has_speech_from_frames(vad_frames, start, end, sample_rate=sample_rate)
+        for start, end in zip(starts.tolist(), ends.tolist())
+    ]
+
+    raw_mv = memoryview(raw_pcm)
+    for idx, (b_start, b_end, offset_sec, dur_sec) in enumerate(
+        zip(byte_starts, byte_ends, offsets, durations)
+    ):
+        chunk_wav = _frames_to_wav(raw_mv[b_start:b_end], n_channels, sampwidth, sample_rate)
+
+        speech = speech_flags[idx]
         if not speech:
             logger.info(
                 "Chunk %d (%.1fs–%.1fs) has no speech — will be skipped by STT.",
                 idx, offset_sec, offset_sec + dur_sec,
             )
 
-        chunks.append(
-            {
-                "chunk_id": idx,
-                "audio_bytes": chunk_wav,
-                "offset": offset_sec,
-                "duration": dur_sec,
-                "has_speech": speech,
-            }
-        )
+        yield {
+            "chunk_id": idx,
+            "audio_bytes": chunk_wav,
+            "offset": offset_sec,
+            "duration": dur_sec,
+            "has_speech": speech,
+        }
 
-    speech_count = sum(1 for c in chunks if c["has_speech"])
+    speech_count = sum(speech_flags)
     logger.info(
         "Chunking complete: %d total chunks (%d with speech, %d silent).",
-        len(chunks), speech_count, len(chunks) - speech_count,
+        len(speech_flags), speech_count, len(speech_flags) - speech_count,
     )
 
-    return chunks
-
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -326,11 +368,11 @@ def _frames_to_wav(
     sampwidth: int,
     sample_rate: int,
 ) -> bytes:
-    """Wrap raw PCM frames into a standalone WAV byte buffer."""
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(n_channels)
-        wf.setsampwidth(sampwidth)
-        wf.setframerate(sample_rate)
-        wf.writeframes(raw_pcm)
-    return buf.getvalue()
+    """
+    Wrap raw PCM frames into a standalone WAV byte buffer.
+
+    *raw_pcm* may be a memoryview slice of the full clip; its bytes are
+    copied exactly once, into the returned buffer.
+    """
+    header = make_wav_header(n_channels, sampwidth, sample_rate, len(raw_pcm))
+    return b"".join((header, raw_pcm))
@@ -17,16 +17,34 @@ No storage, embedding, or downstream processing occurs here.
 """
 
 import io
+import logging
 
+import numpy as np
 from pydub import AudioSegment
 from pydub.exceptions import CouldntDecodeError
 
+from src.audio._wav import make_wav_header
+
+# Optional fast path for .wav inputs: libsndfile decode/encode plus
+# libsamplerate resampling, skipping pydub's ffmpeg subprocess.
+try:
+    import soundfile
+except ImportError:
+    soundfile = None
+
+try:
+    import samplerate
+except ImportError:
+    samplerate = None
+
+logger = logging.getLogger("voiceops.audio.normalizer")
+
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-ALLOWED_EXTENSIONS = {".wav", ".mp3", ".m4a"}
+ALLOWED_EXTENSIONS = frozenset({".wav", ".mp3", ".m4a"})
 TARGET_SAMPLE_RATE = 16000  # Hz
 TARGET_CHANNELS = 1  # mono
 MAX_DURATION_SECONDS = 1800  # 30 minutes — safety limit
@@ -53,17 +71,23 @@ class AudioNormalizationError(Exception):
 # ---------------------------------------------------------------------------
 
 
-def validate_extension(filename: str) -> None:
+def validate_extension(filename: str, ext: str | None = None) -> None:
     """
     Check that the file extension is .wav, .mp3, or .m4a.
 
+    Args:
+        filename: Original filename.
+        ext:      Extension already extracted from *filename* (lowercase,
+                  with the dot); computed here when omitted.
+
     Raises:
         AudioValidationError: If the extension is not allowed.
     """
     if not filename:
         raise AudioValidationError("Filename is missing.")
 
-    ext = _extract_extension(filename)
+    if ext is None:
+        ext = _extract_extension(filename)
     if ext not in ALLOWED_EXTENSIONS:
         raise AudioValidationError(
             f"Unsupported file type '{ext}'. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
@@ -127,14 +151,19 @@ def normalize(audio_bytes: bytes, filename: str) -> bytes:
         AudioValidationError:    On any validation failure.
         AudioNormalizationError: On unexpected processing failure.
     """
-    # 1. Extension check
-    validate_extension(filename)
+    # 1. Extension check (extension extracted once, reused for decode)
+    ext = _extract_extension(filename) if filename else ""
+    validate_extension(filename, ext)
 
     # 2. Empty-file check
     validate_not_empty(audio_bytes)
 
     # 3. Decode
-    ext = _extract_extension(filename)
+    if ext == ".wav":
+        fast = _normalize_wav_fast(audio_bytes)
+        if fast is not None:
+            return fast
+
     try:
         audio = AudioSegment.from_file(io.BytesIO(audio_bytes), format=ext.lstrip("."))
     except CouldntDecodeError:
@@ -155,6 +184,17 @@ def normalize(audio_bytes: bytes, filename: str) -> bytes:
 
     # 7. Export as WAV bytes
     try:
+        if audio.sample_width > 1:
+            # Header + PCM in one allocation of the final size: skips the
+            # wave writer and the growing BytesIO behind audio.export().
+            # 8-bit audio still goes through export(), which re-biases
+            # samples to unsigned as WAV requires.
+            raw_pcm = audio.raw_data
+            header = make_wav_header(
+                audio.channels, audio.sample_width, audio.frame_rate, len(raw_pcm),
+            )
+            return b"".join((header, raw_pcm))
+
         buffer = io.BytesIO()
         audio.export(buffer, format=OUTPUT_FORMAT)
         return buffer.getvalue()
@@ -162,6 +202,70 @@ def normalize(audio_bytes: bytes, filename: str) -> bytes:
         raise AudioNormalizationError(f"Failed to export normalized audio: {exc}")
 
 
+# ---------------------------------------------------------------------------
+# WAV fast path
+# ---------------------------------------------------------------------------
+
+
+def _normalize_wav_fast(audio_bytes: bytes) -> bytes | None:
+    """
+    Normalize WAV input with soundfile (+ samplerate) instead of pydub.
+
+    Returns None when the optional libraries are unavailable, when the
+    input needs resampling but ``samplerate`` is missing, or when
+    libsndfile cannot decode it — the caller then takes the pydub path,
+    which owns the corrupt-file error reporting.
+
+    Raises:
+        AudioValidationError: If the decoded duration is zero or exceeds
+            MAX_DURATION_SECONDS.
+    """
+    if soundfile is None:
+        return None
+
+    try:
+        info = soundfile.info(io.BytesIO(audio_bytes))
+    except Exception as exc:
+        logger.debug("soundfile could not read WAV header (%s) — using pydub.", exc)
+        return None
+
+    if info.samplerate != TARGET_SAMPLE_RATE and samplerate is None:
+        return None
+
+    # Duration check before decoding the payload
+    duration_seconds = info.frames / info.samplerate if info.samplerate else 0.0
+    if duration_seconds > MAX_DURATION_SECONDS:
+        raise AudioValidationError(
+            f"Audio duration ({duration_seconds:.1f}s) exceeds the "
+            f"maximum allowed ({MAX_DURATION_SECONDS}s)."
+        )
+    if duration_seconds == 0:
+        raise AudioValidationError("Audio file has zero duration.")
+
+    try:
+        data, sr = soundfile.read(
+            io.BytesIO(audio_bytes), dtype="float32", always_2d=True,
+        )
+    except Exception as exc:
+        logger.debug("soundfile could not decode WAV (%s) — using pydub.", exc)
+        return None
+
+    # Mono downmix (average of channels, as pydub's set_channels(1))
+    mono = data[:, 0] if data.shape[1] == 1 else data.mean(axis=1, dtype=np.float32)
+
+    if sr != TARGET_SAMPLE_RATE:
+        mono = samplerate.resample(mono, TARGET_SAMPLE_RATE / sr, "sinc_medium")
+
+    try:
+        buffer = io.BytesIO()
+        soundfile.write(
+            buffer, mono, TARGET_SAMPLE_RATE, subtype="PCM_16", format="WAV",
+        )
+        return buffer.getvalue()
+    except Exception as exc:
+        raise AudioNormalizationError(f"Failed to export normalized audio: {exc}")
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -169,7 +273,5 @@ def normalize(audio_bytes: bytes, filename: str) -> bytes:
 
 def _extract_extension(filename: str) -> str:
     """Return lowercase file extension including the dot, e.g. '.wav'."""
-    dot_index = filename.rfind(".")
-    if dot_index == -1:
-        return ""
-    return filename[dot_index:].lower()
+    _, dot, ext = filename.rpartition(".")
+    return f".{ext.lower()}" if dot else ""
@@ -21,10 +21,23 @@ This module does NOT:
 
 import io
 import logging
+import struct
 import wave
 
 import numpy as np
 
+try:
+    import soundfile
+except ImportError:  # optional — falls back to the stdlib ``wave`` decoder
+    soundfile = None
+
+try:
+    import numpy_rms
+except ImportError:  # optional — einsum RMS is used instead
+    numpy_rms = None
+
+from src.audio import _quality_kernels
+
 logger = logging.getLogger("voiceops.audio.quality")
 
 
@@ -40,17 +53,46 @@ _NOISE_THRESHOLD_MEDIUM: float = 0.03
 _STABILITY_THRESHOLD_LOW: float = 1.5
 _STABILITY_THRESHOLD_MEDIUM: float = 0.8
 
+# Frame length for the noise / stability heuristics (100 ms at 16 kHz)
+_FRAME_SIZE: int = 1600
+
+# Vectorized popcount (NumPy >= 2.0); older NumPy unpacks bits instead
+_bitwise_count = getattr(np, "bitwise_count", None)
+
 # Speech naturalness: based on pitch regularity heuristics
 # High autocorrelation regularity → suspicious (robotic/TTS)
 _NATURALNESS_REGULARITY_THRESHOLD: float = 0.92
 
 
-def analyze_audio_quality(audio_bytes: bytes) -> dict[str, str]:
+# ---------------------------------------------------------------------------
+# WAV decoding
+# ---------------------------------------------------------------------------
+
+# Sample width (bytes) → integer dtype / full-scale divisor
+_PCM_DTYPES: dict[int, type] = {1: np.int8, 2: np.int16, 4: np.int32}
+_PCM_FULL_SCALE: dict[int, float] = {1: 128.0, 2: 32768.0, 4: 2147483648.0}
+
+# How far into the file to look for the "data" chunk
+_WAV_HEADER_SCAN_BYTES: int = 4096
+
+# Header size of a canonical PCM WAV (the normalizer's output) and the
+# 16-bit full-scale divisor used by the assume_pcm16 fast path
+_CANONICAL_HEADER_BYTES: int = 44
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def analyze_audio_quality(
+    audio_bytes: bytes,
+    assume_pcm16: bool = True,
+) -> dict[str, str]:
     """
     Analyze audio quality from normalized WAV bytes.
 
     Args:
-        audio_bytes: Normalized audio (mono 16 kHz WAV bytes).
+        audio_bytes:  Normalized audio (mono 16 kHz WAV bytes).
+        assume_pcm16: Try the canonical 44-byte-header PCM16 decoder
+                      first (the normalizer's usual output); other WAV
+                      layouts still fall back to the general decoder.
 
     Returns:
         Dict with keys:
@@ -59,7 +101,9 @@ def analyze_audio_quality(audio_bytes: bytes) -> dict[str, str]:
             - speech_naturalness: "normal" | "suspicious"
     """
     try:
-        pcm_float = _wav_to_float32(audio_bytes)
+        pcm_float = _wav_to_float32_pcm16(audio_bytes) if assume_pcm16 else None
+        if pcm_float is None:
+            pcm_float = _wav_to_float32(audio_bytes)
     except Exception as exc:
         logger.warning("Audio quality analysis failed: %s — returning defaults.", exc)
         return {
@@ -68,8 +112,10 @@ def analyze_audio_quality(audio_bytes: bytes) -> dict[str, str]:
             "speech_naturalness": "normal",
         }
 
-    noise_level = _estimate_noise_level(pcm_float)
-    call_stability = _estimate_call_stability(pcm_float)
+    # Noise and stability share one framed pass over the PCM
+    frame_rms, frame_zcr = _frame_stats(pcm_float)
+    noise_level = _estimate_noise_level(frame_rms)
+    call_stability = _estimate_call_stability(frame_zcr)
     speech_naturalness = _estimate_speech_naturalness(pcm_float)
 
     result = {
@@ -87,45 +133,193 @@ def analyze_audio_quality(audio_bytes: bytes) -> dict[str, str]:
 # ---------------------------------------------------------------------------
 
 
+def _wav_to_float32_pcm16(audio_bytes: bytes) -> np.ndarray | None:
+    """
+    Decode a canonical PCM16 WAV (44-byte header, ``data`` at offset 36).
+
+    No chunk walk and no dtype dispatch: one header check, one int16 view
+    and one fused int16→float32 scale. Returns None for any other layout.
+    """
+    if (
+        len(audio_bytes) < _CANONICAL_HEADER_BYTES
+        or audio_bytes[:4] != b"RIFF"
+        or audio_bytes[8:16] != b"WAVEfmt "
+        or audio_bytes[36:40] != b"data"
+    ):
+        return None
+
+    (audio_format,) = struct.unpack_from("<H", audio_bytes, 20)
+    (bits,) = struct.unpack_from("<H", audio_bytes, 34)
+    if audio_format != 1 or bits != 16:
+        return None
+
+    (data_size,) = struct.unpack_from("<I", audio_bytes, 40)
+    count = min(data_size, len(audio_bytes) - _CANONICAL_HEADER_BYTES) // 2
+    pcm_i16 = np.frombuffer(
+        audio_bytes, dtype="<i2", count=count, offset=_CANONICAL_HEADER_BYTES,
+    )
+    out = np.empty(count, dtype=np.float32)
+    np.multiply(pcm_i16, _PCM16_SCALE, out=out, casting="unsafe")
+    return out
+
+
 def _wav_to_float32(audio_bytes: bytes) -> np.ndarray:
     """Convert WAV bytes to float32 numpy array normalized to [-1.0, 1.0]."""
+    payload = _parse_pcm_wav(audio_bytes)
+    if payload is not None:
+        # Canonical PCM WAV (the normalizer's output): view the samples in
+        # place — no wave reader, no bytes copy of the payload
+        data_offset, data_size, sampwidth = payload
+        pcm_int = np.frombuffer(
+            audio_bytes,
+            dtype=_PCM_DTYPES[sampwidth],
+            count=data_size // sampwidth,
+            offset=data_offset,
+        )
+        return _scale_to_float32(pcm_int, sampwidth)
+
+    if soundfile is not None:
+        # libsndfile decodes straight to float32 — no intermediate int array
+        pcm, _ = soundfile.read(
+            io.BytesIO(audio_bytes), dtype="float32", always_2d=False,
+        )
+        if pcm.ndim > 1:
+            pcm = pcm.mean(axis=1, dtype=np.float32)
+        return pcm
+
     buf = io.BytesIO(audio_bytes)
     with wave.open(buf, "rb") as wf:
         n_frames = wf.getnframes()
         sampwidth = wf.getsampwidth()
         raw_pcm = wf.readframes(n_frames)
 
-    dtype_map = {1: np.int8, 2: np.int16, 4: np.int32}
-    np_dtype = dtype_map.get(sampwidth, np.int16)
-    pcm = np.frombuffer(raw_pcm, dtype=np_dtype).astype(np.float32)
+    np_dtype = _PCM_DTYPES.get(sampwidth, np.int16)
+    pcm_int = np.frombuffer(raw_pcm, dtype=np_dtype)
+    return _scale_to_float32(pcm_int, sampwidth)
+
 
-    norm_map = {1: 128.0, 2: 32768.0, 4: 2147483648.0}
-    pcm = pcm / norm_map.get(sampwidth, 32768.0)
+def _scale_to_float32(pcm_int: np.ndarray, sampwidth: int) -> np.ndarray:
+    """Cast and scale integer PCM in a single pass into one float32 buffer."""
+    scale = np.float32(1.0 / _PCM_FULL_SCALE.get(sampwidth, 32768.0))
+    pcm = np.empty(pcm_int.shape, dtype=np.float32)
+    np.multiply(pcm_int, scale, out=pcm, casting="unsafe")
     return pcm
 
 
-def _estimate_noise_level(pcm: np.ndarray) -> str:
+def _parse_pcm_wav(audio_bytes: bytes) -> tuple[int, int, int] | None:
     """
-    Estimate background noise level using RMS energy of low-energy frames.
+    Walk the RIFF chunks of an integer-PCM WAV.
 
-    Splits audio into short frames, takes the bottom 20% by energy as
-    'silence/noise' frames, and classifies based on their RMS.
+    Returns:
+        ``(data_offset, data_size, sampwidth)`` for a plain PCM file whose
+        ``data`` chunk starts within the first _WAV_HEADER_SCAN_BYTES, or
+        None for anything else (compressed/float/extensible formats,
+        truncated headers) so the caller can fall back to a full decoder.
+    """
+    if len(audio_bytes) < 12 or audio_bytes[:4] != b"RIFF" or audio_bytes[8:12] != b"WAVE":
+        return None
+
+    sampwidth = None
+    pos = 12
+    limit = min(len(audio_bytes), _WAV_HEADER_SCAN_BYTES)
+    while pos + 8 <= limit:
+        chunk_id = audio_bytes[pos : pos + 4]
+        (chunk_size,) = struct.unpack_from("<I", audio_bytes, pos + 4)
+        body = pos + 8
+
+        if chunk_id == b"fmt ":
+            if chunk_size < 16 or body + 16 > len(audio_bytes):
+                return None
+            audio_format, _channels, _rate, _byte_rate, _align, bits = (
+                struct.unpack_from("<HHIIHH", audio_bytes, body)
+            )
+            if audio_format != 1 or bits % 8 or bits // 8 not in _PCM_DTYPES:
+                return None
+            sampwidth = bits // 8
+        elif chunk_id == b"data":
+            if sampwidth is None:
+                return None
+            # Streaming writers may leave the size unset; clamp to the buffer
+            data_size = min(chunk_size, len(audio_bytes) - body)
+            return body, data_size - data_size % sampwidth, sampwidth
+
+        pos = body + chunk_size + (chunk_size & 1)  # chunks are word-aligned
+
+    return None
+
+
+def _frame_stats(
+    pcm: np.ndarray, frame_size: int = _FRAME_SIZE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Per-frame RMS energy and zero-crossing rate from one framed view.
+
+    Returns:
+        (rms, zcr) — two 1-D arrays of length ``len(pcm) // frame_size``.
     """
-    frame_size = 1600  # 100ms at 16kHz
+    if _quality_kernels.NUMBA_AVAILABLE:
+        return _quality_kernels.frame_rms_zcr(np.ascontiguousarray(pcm), frame_size)
+
     n_frames = len(pcm) // frame_size
+    frames = pcm[: n_frames * frame_size].reshape(n_frames, frame_size)
+
+    if numpy_rms is not None:
+        # C/SIMD windowed RMS over the framed span
+        rms = numpy_rms.rms(
+            np.ascontiguousarray(frames).reshape(1, -1), window_size=frame_size,
+        )[0]
+    else:
+        # einsum avoids a temporary frames**2
+        rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame_size)
+
+    zcr = _frame_zero_crossings(frames) / frame_size
+    return rms, zcr
+
+
+def _frame_zero_crossings(frames: np.ndarray) -> np.ndarray:
+    """
+    Count sign changes along each row of *frames*.
+
+    Sign bits are packed 8 per byte, each byte is XORed with the row
+    shifted left by one bit (carrying in the next byte's top bit), and
+    set bits are popcounted — so the comparison and the count scan an
+    eighth of the bytes a bool diff would.
+    """
+    frame_size = frames.shape[1]
+    packed = np.packbits(np.signbit(frames), axis=1)
+
+    carry = np.zeros_like(packed)
+    carry[:, :-1] = packed[:, 1:] >> 7
+    flips = packed ^ ((packed << 1) | carry)
+
+    # Only bit pairs (j, j+1) inside the frame count — drop the last
+    # sample's comparison against padding
+    flips &= _pair_mask(packed.shape[1] * 8, frame_size)
+
+    if _bitwise_count is not None:
+        return _bitwise_count(flips).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(flips, axis=1).sum(axis=1, dtype=np.int64)
+
+
+def _pair_mask(n_bits: int, frame_size: int) -> np.ndarray:
+    """Packed mask selecting bit positions 0 .. frame_size - 2."""
+    return np.packbits(np.arange(n_bits) < frame_size - 1)
+
+
+def _estimate_noise_level(frame_rms: np.ndarray) -> str:
+    """
+    Estimate background noise level using RMS energy of low-energy frames.
+
+    Takes per-frame RMS energies (see ``_frame_stats``), treats the bottom
+    20% as 'silence/noise' frames, and classifies based on their RMS.
+    """
+    n_frames = len(frame_rms)
     if n_frames < 2:
         return "medium"
 
-    frame_energies = []
-    for i in range(n_frames):
-        frame = pcm[i * frame_size : (i + 1) * frame_size]
-        rms = np.sqrt(np.mean(frame ** 2))
-        frame_energies.append(rms)
-
-    frame_energies.sort()
-    # Bottom 20% of frames approximate noise floor
-    noise_frames = frame_energies[: max(1, n_frames // 5)]
-    avg_noise_rms = np.mean(noise_frames)
+    # Bottom 20% of frames approximate noise floor (partition, not full sort)
+    k = max(1, n_frames // 5)
+    avg_noise_rms = np.partition(frame_rms, k)[:k].mean()
 
     if avg_noise_rms >= _NOISE_THRESHOLD_HIGH:
         return "high"
@@ -134,31 +328,22 @@ def _estimate_noise_level(pcm: np.ndarray) -> str:
     return "low"
 
 
-def _estimate_call_stability(pcm: np.ndarray) -> str:
+def _estimate_call_stability(frame_zcr: np.ndarray) -> str:
     """
     Estimate call stability using zero-crossing rate variability.
 
-    Unstable calls show high variance in ZCR across frames (dropouts,
-    digital artifacts, codec glitches).
+    Takes per-frame zero-crossing rates (see ``_frame_stats``). Unstable
+    calls show high variance in ZCR across frames (dropouts, digital
+    artifacts, codec glitches).
     """
-    frame_size = 1600
-    n_frames = len(pcm) // frame_size
-    if n_frames < 3:
+    if len(frame_zcr) < 3:
         return "medium"
 
-    zcr_values = []
-    for i in range(n_frames):
-        frame = pcm[i * frame_size : (i + 1) * frame_size]
-        zc = np.sum(np.abs(np.diff(np.sign(frame))) > 0)
-        zcr = zc / len(frame)
-        zcr_values.append(zcr)
-
-    zcr_arr = np.array(zcr_values)
-    mean_zcr = np.mean(zcr_arr)
+    mean_zcr = np.mean(frame_zcr)
     if mean_zcr == 0:
         return "low"
 
-    cv = np.std(zcr_arr) / mean_zcr  # coefficient of variation
+    cv = np.std(frame_zcr) / mean_zcr  # coefficient of variation
 
     if cv >= _STABILITY_THRESHOLD_LOW:
         return "low"
@@ -180,20 +365,34 @@ def _estimate_speech_naturalness(pcm: np.ndarray) -> str:
     if n_windows < 2:
         return "normal"
 
+    # Zero-padded FFT length: >= 2N-1 so the circular correlation is linear
+    nfft = 1 << (2 * window_size - 1).bit_length()
+    max_lag = 800  # Max ~50ms (20 Hz)
+
+    search_start = 32  # skip first 2ms after lag 0
+    use_kernel = _quality_kernels.NUMBA_AVAILABLE
+
     peak_positions = []
     for i in range(min(n_windows, 10)):  # Sample up to 10 windows
         window = pcm[i * window_size : (i + 1) * window_size]
-        # Autocorrelation of the window
-        autocorr = np.correlate(window, window, mode="full")
-        autocorr = autocorr[len(autocorr) // 2 :]  # positive lags only
+        if use_kernel:
+            # Compiled direct search over only the lags we need
+            peak_positions.append(_quality_kernels.autocorr_peak(
+                np.ascontiguousarray(window), search_start, max_lag,
+            ))
+            continue
+
+        # Autocorrelation of the window (positive lags only) via FFT —
+        # O(N log N) instead of np.correlate's O(N^2)
+        spectrum = np.fft.rfft(window, nfft)
+        autocorr = np.fft.irfft(spectrum * spectrum.conj(), nfft)[:max_lag]
 
         # Normalize
         if autocorr[0] > 0:
             autocorr = autocorr / autocorr[0]
 
-        # Find first peak after lag 0 (skip first 2ms = 32 samples)
-        search_start = 32
-        search_end = min(len(autocorr), 800)  # Max ~50ms (20 Hz)
+        # Find first peak after lag 0
+        search_end = min(len(autocorr), max_lag)
         if search_end <= search_start:
             continue
 
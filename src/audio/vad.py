@@ -7,6 +7,8 @@ Responsibility:
     - Detect speech vs silence regions in normalized audio
     - Provide silence gap locations for intelligent chunk boundary selection
     - Pre-filter chunks that contain no meaningful speech
+    - Compute a per-window speech probability timeline once per clip so
+      silence gaps and per-chunk speech flags can share it
     - Uses Silero VAD (lightweight, no GPU required)
 
 Per RULES.md §3.1:
@@ -21,6 +23,9 @@ This module does NOT:
 """
 
 import logging
+import math
+import os
+import threading
 from typing import List, Tuple
 
 import numpy as np
@@ -28,19 +33,34 @@ import numpy as np
 logger = logging.getLogger("voiceops.audio.vad")
 
 # ---------------------------------------------------------------------------
-# Module-level model cache (singleton — avoids reloading on every request)
+# Model cache (one instance per thread — avoids reloading on every request)
 # ---------------------------------------------------------------------------
+# Silero VAD keeps recurrent state inside the model object and resets it
+# per call, so one instance cannot be shared by concurrent callers. Each
+# thread lazily gets its own copy; torch.hub serves later loads from its
+# on-disk cache.
 
-_vad_model = None
+_thread_local = threading.local()
 _get_speech_timestamps_fn = None
 
+# Intra-op threads torch may use for VAD. Silero is tiny; letting every
+# concurrent call fan out over all cores only oversubscribes the CPU.
+_TORCH_NUM_THREADS: int = int(os.environ.get("VAD_TORCH_THREADS", "1"))
+_torch_configured = False
+
+# Opt-in int8 dynamic quantization of the VAD model's Linear/LSTM layers.
+# Off by default: silence-gap accuracy must be checked on real calls
+# before enabling, and the model stays FP32 if quantization fails.
+_VAD_QUANTIZE: bool = os.environ.get("VAD_QUANTIZE", "0") == "1"
+
 
 def _load_vad_model():
-    """Lazy-load and cache Silero VAD model."""
-    global _vad_model, _get_speech_timestamps_fn
+    """Lazy-load and cache the calling thread's Silero VAD model."""
+    global _get_speech_timestamps_fn, _torch_configured
 
-    if _vad_model is not None:
-        return _vad_model, _get_speech_timestamps_fn
+    model = getattr(_thread_local, "model", None)
+    if model is not None:
+        return model, _get_speech_timestamps_fn
 
     try:
         import torch
@@ -49,21 +69,85 @@ def _load_vad_model():
             "torch is required for VAD. Install with: pip install torch"
         ) from exc
 
-    logger.info("Loading Silero VAD model (first request, will be cached)...")
+    if not _torch_configured:
+        torch.set_num_threads(_TORCH_NUM_THREADS)
+        _torch_configured = True
+
+    logger.info("Loading Silero VAD model (first request on this thread, will be cached)...")
 
     model, utils = torch.hub.load(
         repo_or_dir="snakers4/silero-vad",
         model="silero_vad",
         trust_repo=True,
     )
+    model.eval()
+    if _VAD_QUANTIZE:
+        model = _quantize_model(torch, model)
 
-    get_speech_timestamps = utils[0]
-
-    _vad_model = model
-    _get_speech_timestamps_fn = get_speech_timestamps
+    _thread_local.model = model
+    _get_speech_timestamps_fn = utils[0]
 
     logger.info("Silero VAD model loaded and cached.")
-    return _vad_model, _get_speech_timestamps_fn
+    return model, _get_speech_timestamps_fn
+
+
+def _quantize_model(torch, model):
+    """
+    Apply int8 dynamic quantization, falling back to the FP32 model.
+
+    The torch.hub Silero build is TorchScript, which quantize_dynamic
+    cannot rewrite; in that case the original model is returned unchanged.
+    """
+    try:
+        quantized = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8,
+        )
+    except Exception as exc:
+        logger.warning("VAD int8 quantization unavailable (%s) — using FP32.", exc)
+        return model
+
+    logger.info("Silero VAD model quantized to int8.")
+    return quantized
+
+
+def warmup_vad(sample_rate: int = 16000) -> bool:
+    """
+    Load the calling thread's Silero model and run it once on silence.
+
+    Meant for process startup: it moves the torch import, the torch.hub
+    load and torch's first-call kernel setup off the first request.
+    Models are per-thread, so threads that serve requests later still
+    build their own copy, but from the warm hub cache.
+
+    Returns:
+        True if the model loaded and ran, False if VAD is unavailable
+        (logged, never raised — startup must not fail on this).
+    """
+    try:
+        compute_vad_frames(np.zeros(sample_rate, dtype=np.float32), sample_rate)
+    except Exception as exc:
+        logger.warning("Silero VAD warm-up skipped: %s", exc)
+        return False
+
+    logger.info("Silero VAD warmed up.")
+    return True
+
+
+# Silero's fixed inference window (samples) per supported sample rate
+_VAD_WINDOW_SAMPLES: dict[int, int] = {16000: 512, 8000: 256}
+
+# Silero's hysteresis: speech ends only when probability drops this far
+# below the onset threshold
+_NEG_THRESHOLD_OFFSET: float = 0.15
+
+# Energy pre-filter for chunk_has_speech and compute_vad_frames: clips
+# quieter than this RMS are silent without asking the model (≈ −50 dBFS) ...
+SILENT_RMS_THRESHOLD: float = 0.003
+# ... and clips louder than this whose zero-crossing rate sits in the
+# voiced-speech band are treated as speech. Anything in between goes to
+# Silero.
+_LOUD_RMS_THRESHOLD: float = 0.05
+_SPEECH_ZCR_BAND: Tuple[float, float] = (0.02, 0.25)
 
 
 # ---------------------------------------------------------------------------
@@ -98,14 +182,15 @@ def detect_speech_segments(
 
     tensor = torch.from_numpy(pcm_samples).float()
 
-    speech_timestamps = get_speech_timestamps(
-        tensor,
-        model,
-        sampling_rate=sample_rate,
-        threshold=threshold,
-        min_speech_duration_ms=min_speech_duration_ms,
-        min_silence_duration_ms=min_silence_duration_ms,
-    )
+    with torch.inference_mode():
+        speech_timestamps = get_speech_timestamps(
+            tensor,
+            model,
+            sampling_rate=sample_rate,
+            threshold=threshold,
+            min_speech_duration_ms=min_speech_duration_ms,
+            min_silence_duration_ms=min_silence_duration_ms,
+        )
 
     logger.debug("VAD detected %d speech segments.", len(speech_timestamps))
     return speech_timestamps
@@ -134,7 +219,14 @@ def find_silence_gaps(
         min_silence_duration_ms=min_silence_duration_ms,
     )
 
-    total_samples = len(pcm_samples)
+    return _gaps_from_segments(speech_segments, len(pcm_samples))
+
+
+def _gaps_from_segments(
+    speech_segments: List[dict],
+    total_samples: int,
+) -> List[Tuple[int, int]]:
+    """Invert speech segments into chronologically ordered silence gaps."""
     gaps: List[Tuple[int, int]] = []
 
     if not speech_segments:
@@ -176,6 +268,15 @@ def chunk_has_speech(
     Returns:
         True if the chunk has speech above the threshold duration.
     """
+    # A clip shorter than the minimum can never qualify
+    if len(pcm_samples) * 1000 < min_speech_duration_ms * sample_rate:
+        return False
+
+    gated = _energy_gate(pcm_samples)
+    if gated is not None:
+        logger.debug("Energy pre-filter decided has_speech=%s without VAD.", gated)
+        return gated
+
     segments = detect_speech_segments(
         pcm_samples,
         sample_rate=sample_rate,
@@ -195,3 +296,200 @@ def chunk_has_speech(
         )
 
     return has
+
+
+def _energy_gate(pcm_samples: np.ndarray) -> bool | None:
+    """
+    Cheap RMS / zero-crossing screen run before the neural VAD.
+
+    Returns False for near-silent audio, True for loud audio with a
+    speech-like zero-crossing rate, or None when Silero has to decide.
+    """
+    n = len(pcm_samples)
+    if n == 0:
+        return False
+
+    rms = math.sqrt(float(np.dot(pcm_samples, pcm_samples)) / n)
+    if rms < SILENT_RMS_THRESHOLD:
+        return False
+
+    if rms > _LOUD_RMS_THRESHOLD:
+        signs = np.signbit(pcm_samples)
+        zcr = np.count_nonzero(signs[1:] != signs[:-1]) / n
+        lo, hi = _SPEECH_ZCR_BAND
+        if lo <= zcr <= hi:
+            return True
+
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Cached VAD timeline (one model pass per clip)
+# ---------------------------------------------------------------------------
+
+
+def compute_vad_frames(
+    pcm_samples: np.ndarray,
+    sample_rate: int = 16000,
+    skip_silent: bool = False,
+) -> np.ndarray:
+    """
+    Run Silero VAD once over the whole clip and return its per-window
+    speech probabilities.
+
+    The returned timeline can be consumed by find_silence_gaps_from_frames
+    and chunk_has_speech_from_frames, so the chunker never runs the model
+    twice over the same samples.
+
+    Args:
+        pcm_samples: 1-D float32 numpy array, normalized to [-1.0, 1.0].
+        sample_rate: Sample rate (must be 8000 or 16000).
+        skip_silent: Return an all-zero timeline without running Silero
+                     when the energy pre-filter finds the clip silent.
+
+    Returns:
+        1-D float32 array with one probability per Silero window
+        (512 samples at 16 kHz, 256 at 8 kHz). The last partial window is
+        zero-padded.
+    """
+    window = _vad_window(sample_rate)
+    if skip_silent and _energy_gate(pcm_samples) is False:
+        logger.debug("Energy pre-filter found the clip silent — VAD skipped.")
+        return np.zeros(-(-len(pcm_samples) // window), dtype=np.float32)
+
+    import torch
+
+    model, _ = _load_vad_model()
+    model.reset_states()
+
+    tensor = torch.from_numpy(pcm_samples).float()
+    n_windows = -(-len(tensor) // window)
+    probs = np.empty(n_windows, dtype=np.float32)
+
+    with torch.inference_mode():
+        for i in range(n_windows):
+            piece = tensor[i * window : (i + 1) * window]
+            if len(piece) < window:
+                piece = torch.nn.functional.pad(piece, (0, window - len(piece)))
+            probs[i] = model(piece, sample_rate).item()
+
+    logger.debug("VAD timeline computed: %d windows.", n_windows)
+    return probs
+
+
+def speech_segments_from_frames(
+    frames: np.ndarray,
+    sample_rate: int = 16000,
+    total_samples: int | None = None,
+    threshold: float = 0.35,
+    min_speech_duration_ms: int = 250,
+    min_silence_duration_ms: int = 300,
+) -> List[dict]:
+    """
+    Turn a VAD probability timeline into speech segments.
+
+    Applies the same onset/offset hysteresis as Silero's
+    get_speech_timestamps (without its edge padding).
+
+    Returns:
+        List of dicts with ``start`` and ``end`` keys (sample indices,
+        relative to the first frame).
+    """
+    window = _vad_window(sample_rate)
+    if total_samples is None:
+        total_samples = len(frames) * window
+
+    neg_threshold = threshold - _NEG_THRESHOLD_OFFSET
+    min_speech_samples = sample_rate * min_speech_duration_ms / 1000
+    min_silence_samples = sample_rate * min_silence_duration_ms / 1000
+
+    segments: List[dict] = []
+    triggered = False
+    seg_start = 0
+    temp_end = 0
+
+    for i, prob in enumerate(frames):
+        pos = i * window
+        if prob >= threshold:
+            temp_end = 0
+            if not triggered:
+                triggered = True
+                seg_start = pos
+            continue
+        if prob < neg_threshold and triggered:
+            if not temp_end:
+                temp_end = pos
+            if pos - temp_end < min_silence_samples:
+                continue
+            if temp_end - seg_start > min_speech_samples:
+                segments.append({"start": seg_start, "end": temp_end})
+            triggered = False
+            temp_end = 0
+
+    if triggered and total_samples - seg_start > min_speech_samples:
+        segments.append({"start": seg_start, "end": total_samples})
+
+    return segments
+
+
+def find_silence_gaps_from_frames(
+    frames: np.ndarray,
+    total_samples: int,
+    sample_rate: int = 16000,
+    min_silence_duration_ms: int = 300,
+) -> List[Tuple[int, int]]:
+    """
+    find_silence_gaps counterpart that reads a precomputed VAD timeline
+    (see compute_vad_frames) instead of running the model.
+    """
+    segments = speech_segments_from_frames(
+        frames,
+        sample_rate=sample_rate,
+        total_samples=total_samples,
+        min_silence_duration_ms=min_silence_duration_ms,
+    )
+    return _gaps_from_segments(segments, total_samples)
+
+
+def chunk_has_speech_from_frames(
+    frames: np.ndarray,
+    start_sample: int,
+    end_sample: int,
+    sample_rate: int = 16000,
+    min_speech_duration_ms: int = 500,
+) -> bool:
+    """
+    chunk_has_speech counterpart that reads a precomputed VAD timeline.
+
+    Args:
+        frames:                 Full-clip timeline from compute_vad_frames.
+        start_sample:           First sample of the chunk.
+        end_sample:             One past the last sample of the chunk.
+        sample_rate:            Sample rate.
+        min_speech_duration_ms: Minimum total speech to qualify.
+
+    Returns:
+        True if the chunk has speech above the threshold duration.
+    """
+    window = _vad_window(sample_rate)
+    first = start_sample // window
+    last = -(-end_sample // window)
+    segments = speech_segments_from_frames(
+        frames[first:last],
+        sample_rate=sample_rate,
+        total_samples=end_sample - first * window,
+        min_speech_duration_ms=min_speech_duration_ms,
+    )
+
+    total_speech_samples = sum(s["end"] - s["start"] for s in segments)
+    return (total_speech_samples / sample_rate) * 1000 >= min_speech_duration_ms
+
+
+def _vad_window(sample_rate: int) -> int:
+    """Silero window size for *sample_rate*; raises for unsupported rates."""
+    try:
+        return _VAD_WINDOW_SAMPLES[sample_rate]
+    except KeyError:
+        raise ValueError(
+            f"Silero VAD supports 8000 or 16000 Hz, got {sample_rate}"
+        ) from None
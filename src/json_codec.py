@@ -0,0 +1,60 @@
+"""
+src/json_codec.py
+==================
+Shared JSON encode/decode helpers — VoiceOps
+
+Uses ``orjson`` when it is installed and falls back to the standard
+library otherwise, so callers get the fast path without making orjson a
+hard requirement.
+
+Usage::
+
+    from src.json_codec import dumps, loads, JSONDecodeError
+
+    body = dumps(final_output)          # -> bytes (UTF-8)
+    parsed = loads(raw_llm_reply)       # str or bytes
+
+This module does NOT:
+    - Validate or reshape any payload
+    - Change any analytical behaviour of the pipeline
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+if orjson is not None:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError / ValueError
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize *obj* to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def loads(data: str | bytes | bytearray | memoryview) -> Any:
+        """Parse JSON from str or bytes."""
+        return orjson.loads(data)
+
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize *obj* to compact UTF-8 JSON bytes."""
+        return json.dumps(
+            obj, ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+        ).encode("utf-8")
+
+    def loads(data: str | bytes | bytearray | memoryview) -> Any:
+        """Parse JSON from str or bytes."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
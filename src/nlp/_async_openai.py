@@ -0,0 +1,83 @@
+"""
+src/nlp/_async_openai.py
+=========================
+Async OpenAI client and batchers — VoiceOps Phase 6 (internal)
+
+Responsibility:
+    - Hand out the AsyncOpenAI client shared by the async variants of the
+      NLP modules (intent, contradictions, entity extraction)
+    - Hand out each module's micro-batcher (src.nlp._batcher)
+
+Both hold state bound to the event loop they were first used on
+(connections, futures, timers), so a client created under one
+``asyncio.run()`` fails under the next with "Event loop is closed".
+Every value here is therefore kept per running loop; values of loops
+that have since closed are dropped on the next lookup.
+
+Usage::
+
+    _batchers = LoopLocal(lambda: Batcher(max_batch=32, concurrency=8))
+
+    client = get_async_openai()
+    raw = await _batchers.get().run(cache_key, factory)
+
+This module does NOT:
+    - Build prompts or parse responses
+    - Rate-limit or retry (see src.openai_retry)
+"""
+
+import asyncio
+import os
+import threading
+from typing import Callable, Generic, TypeVar
+
+from openai import AsyncOpenAI
+
+from src.openai_transport import get_async_client
+
+T = TypeVar("T")
+
+
+class LoopLocal(Generic[T]):
+    """
+    One lazily built value per running event loop.
+
+    Parameters
+    ----------
+    factory : Callable[[], T]
+        Builds the value; called on the loop it is built for.
+    """
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self._factory = factory
+        self._values: dict[asyncio.AbstractEventLoop, T] = {}
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        """Return the running loop's value, building it on first use."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            value = self._values.get(loop)
+            if value is None:
+                for stale in [other for other in self._values if other.is_closed()]:
+                    del self._values[stale]
+                value = self._values[loop] = self._factory()
+        return value
+
+    def clear(self) -> None:
+        """Forget every value (tests, or after changing configuration)."""
+        with self._lock:
+            self._values.clear()
+
+
+_clients: LoopLocal[AsyncOpenAI] = LoopLocal(
+    lambda: AsyncOpenAI(
+        api_key=os.environ.get("OPENAI_API_KEY"),
+        http_client=get_async_client(),
+    )
+)
+
+
+def get_async_openai() -> AsyncOpenAI:
+    """Return the running loop's shared AsyncOpenAI client."""
+    return _clients.get()
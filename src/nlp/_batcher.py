@@ -0,0 +1,127 @@
+"""
+src/nlp/_batcher.py
+====================
+Async request micro-batcher — VoiceOps Phase 6 (internal)
+
+Responsibility:
+    - Collect async OpenAI requests submitted within a short window
+      (``max_wait_ms``) or until ``max_batch`` are pending
+    - Coalesce requests with the same key (identical prompt) into one call
+      whose result every caller receives
+    - Issue the batch concurrently with ``asyncio.gather`` under a bounded
+      ``asyncio.Semaphore``
+
+Usage::
+
+    batcher = Batcher(max_batch=32, max_wait_ms=10, concurrency=8)
+    raw = await batcher.run(cache_key, lambda: _request_async(user_message))
+
+A Batcher belongs to the event loop it was created on.
+
+This module does NOT:
+    - Call OpenAI or build prompts (callers pass the request factory)
+    - Rate-limit (callers gate inside their request factory)
+    - Cache completed results (see src.nlp._llm_cache)
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Hashable
+
+logger = logging.getLogger("voiceops.nlp.batcher")
+
+
+class Batcher:
+    """
+    Window-based micro-batcher for async request factories.
+
+    Parameters
+    ----------
+    max_batch : int
+        Pending requests that trigger an immediate flush.
+    max_wait_ms : float
+        Longest a request waits for the batch to fill.
+    concurrency : int
+        Requests in flight at once across all batches.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 32,
+        max_wait_ms: float = 10.0,
+        concurrency: int = 8,
+    ) -> None:
+        if max_batch < 1 or concurrency < 1:
+            raise ValueError(
+                f"max_batch and concurrency must be >= 1, "
+                f"got {max_batch} and {concurrency}"
+            )
+        self.loop = asyncio.get_running_loop()
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+        self._pending: dict[Hashable, tuple[asyncio.Future, Callable[[], Awaitable[Any]]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    # ---- public API ------------------------------------------------------
+
+    async def run(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Submit *factory* under *key* and await its result.
+
+        Callers that submit the same key within one window share a single
+        ``factory()`` call. Cancelling one caller does not cancel the
+        shared request.
+        """
+        entry = self._pending.get(key)
+        if entry is None:
+            future = self.loop.create_future()
+            self._pending[key] = (future, factory)
+            if len(self._pending) >= self._max_batch:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = self.loop.call_later(self._max_wait, self._flush)
+        else:
+            future = entry[0]
+        return await asyncio.shield(future)
+
+    # ---- internal helpers ------------------------------------------------
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        logger.debug("Flushing batch of %d request(s).", len(batch))
+        task = self.loop.create_task(self._run_batch(list(batch.values())))
+        # Hold a reference so the batch is not garbage-collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list) -> None:
+        await asyncio.gather(*(self._run_one(future, factory) for future, factory in batch))
+
+    async def _run_one(
+        self,
+        future: asyncio.Future,
+        factory: Callable[[], Awaitable[Any]],
+    ) -> None:
+        async with self._semaphore:
+            try:
+                result = await factory()
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+                return
+        if not future.done():
+            future.set_result(result)
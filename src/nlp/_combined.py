@@ -0,0 +1,229 @@
+"""
+src/nlp/_combined.py
+=====================
+Combined CUSTOMER analysis — VoiceOps Phase 6 (internal)
+
+Responsibility:
+    - Ask OpenAI for contradiction detection AND entity extraction in a
+      single round-trip over the same numbered CUSTOMER utterances
+    - Memoize the raw reply (via src.nlp._llm_cache) so that
+      detect_contradictions and extract_entities share one call; only a
+      reply that decodes to an object with all three keys is cached
+
+Enabled with NLP_COMBINED_CALL=1. Each public module still validates its
+own field with its own parser (_parse_contradiction_response /
+_parse_entity_response), which ignore the other task's keys.
+
+This module does NOT:
+    - Filter utterances by speaker (callers pass CUSTOMER texts)
+    - Validate field values or reshape the model's reply
+    - Compute risk, sentiment or intent
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Callable
+
+from openai import OpenAI
+
+from src.json_codec import JSONDecodeError, loads as json_loads
+from src.nlp import _llm_cache
+from src.nlp._utt_utils import clamp_texts, collapse_repeats
+from src.openai_retry import chat_completions_with_retry
+from src.openai_transport import get_sync_client
+
+logger = logging.getLogger("voiceops.nlp.combined")
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Off by default: the merged prompt must be checked against the separate
+# prompts on real calls before it replaces them.
+COMBINED_ENABLED: bool = os.environ.get("NLP_COMBINED_CALL", "0") == "1"
+
+# Keys a reply must carry before it is cached
+_REQUIRED_KEYS: tuple[str, ...] = (
+    "contradictions_detected", "payment_commitment", "amount_mentioned",
+)
+
+
+# ---------------------------------------------------------------------------
+# OpenAI prompt — contradictions + entities
+# ---------------------------------------------------------------------------
+
+_COMBINED_SYSTEM_PROMPT: str = (
+    "You analyze CUSTOMER speech from a single recorded Indian financial "
+    "services call (e.g., debt collection, loan inquiries, payment "
+    "discussions, balance inquiries). Perform two independent tasks.\n\n"
+    "OUTPUT:\n"
+    "- Return ONLY a valid JSON object with exactly three keys: "
+    '"contradictions_detected", "payment_commitment", "amount_mentioned".\n'
+    "- Do NOT include any other keys, explanations, reasoning, or text.\n"
+    "- Do NOT infer risk, fraud, sentiment, or intent.\n\n"
+    "TASK 1 — contradictions_detected (boolean):\n"
+    "- true when the customer makes statements that are logically "
+    "inconsistent with each other within this same call, e.g.\n"
+    '  "I never received any loan" followed by "I already paid part of it";\n'
+    '  "I will pay tomorrow" followed by "I have no money at all".\n'
+    "- Changing topic, expressing frustration alongside a promise, or "
+    "refining earlier details is NOT a contradiction.\n"
+    "- With a single statement, this is false.\n\n"
+    "TASK 2a — payment_commitment:\n"
+    '- One of "today", "tomorrow", "this_week", "next_week", "this_month", '
+    '"next_month", "specific_date", "unspecified", or null.\n'
+    "- null means no payment timeline was mentioned; \"unspecified\" means "
+    "a payment was promised without a timeframe.\n\n"
+    "TASK 2b — amount_mentioned:\n"
+    "- A number for any monetary amount the customer mentions (payments, "
+    "balances, loans, EMIs, settlements, dues), or null.\n"
+    "- Numeric value only. Convert Indian number words: lakh/lac = 100000, "
+    "crore = 10000000, hazaar/hazar/thousand = 1000 "
+    "(e.g., '2 lakh 50 thousand' = 250000).\n"
+    "- If several amounts are mentioned, use the most recent or most "
+    "specific one.\n\n"
+    "EXAMPLE OUTPUT:\n"
+    '{"contradictions_detected": false, "payment_commitment": "next_week", '
+    '"amount_mentioned": 400000}\n'
+)
+
+# Routes calls sharing the (static) system prompt to the same OpenAI
+# prompt-cache shard; bump the suffix whenever the prompt text changes.
+_PROMPT_CACHE_KEY: str = "voiceops-combined-v1"
+
+# Strict structured output covering both tasks' fields, so the per-task
+# parsers can read their keys without defensive validation.
+_RESPONSE_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "combined_customer_result",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "contradictions_detected": {"type": "boolean"},
+                "payment_commitment": {
+                    "type": ["string", "null"],
+                    "enum": [
+                        "today", "tomorrow", "this_week", "next_week",
+                        "this_month", "next_month", "specific_date",
+                        "unspecified", None,
+                    ],
+                },
+                "amount_mentioned": {"type": ["number", "null"]},
+            },
+            "required": [
+                "contradictions_detected", "payment_commitment", "amount_mentioned",
+            ],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+# ---------------------------------------------------------------------------
+# OpenAI client (lazy-loaded singleton)
+# ---------------------------------------------------------------------------
+
+_client: OpenAI | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> OpenAI:
+    """Lazily create the shared OpenAI client (thread-safe)."""
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenAI(
+                    api_key=os.environ.get("OPENAI_API_KEY"),
+                    http_client=get_sync_client(),
+                )
+    return _client
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def analyze(
+    customer_texts: list[str],
+    before_call: Callable[[], None] | None = None,
+    on_rate_limit: Callable[[], None] | None = None,
+    on_success: Callable[[], None] | None = None,
+) -> str:
+    """
+    Return the raw combined JSON reply for *customer_texts*.
+
+    Args:
+        customer_texts: Non-empty CUSTOMER texts in chronological order.
+        before_call:    Invoked right before the API request on a cache
+                        miss (e.g. a rate limiter's acquire).
+        on_rate_limit, on_success:
+                        Forwarded to chat_completions_with_retry.
+
+    Returns:
+        The model's raw JSON string (possibly empty).
+
+    Raises:
+        openai.OpenAIError: If the OpenAI API call fails (not cached).
+    """
+    user_message = "\n".join(
+        f"{i}. {text}"
+        for i, text in enumerate(
+            clamp_texts(collapse_repeats(customer_texts)), start=1,
+        )
+    )
+
+    cache_key = _llm_cache.make_key("gpt-4o-mini", _COMBINED_SYSTEM_PROMPT, user_message)
+    raw = _llm_cache.get(cache_key)
+    if raw is not None:
+        logger.debug("Combined analysis cache hit.")
+        return raw
+
+    if before_call is not None:
+        before_call()
+
+    logger.info(
+        "Running combined contradiction + entity analysis over %d CUSTOMER "
+        "utterance(s).",
+        len(customer_texts),
+    )
+
+    response = chat_completions_with_retry(
+        _get_client(),
+        on_rate_limit=on_rate_limit,
+        on_success=on_success,
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": _COMBINED_SYSTEM_PROMPT},
+            {"role": "user", "content": user_message},
+        ],
+        temperature=0.0,
+        max_tokens=110,
+        response_format=_RESPONSE_FORMAT,
+        # Passed via extra_body so older SDKs (openai>=1.0) accept it
+        extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY},
+    )
+    raw = response.choices[0].message.content or ""
+    logger.debug("Raw combined response: %s", raw)
+
+    if _is_complete(raw):
+        _llm_cache.set(cache_key, raw)
+    else:
+        logger.warning("Combined reply is incomplete — not cached.")
+
+    return raw
+
+
+def _is_complete(raw: str) -> bool:
+    """True if *raw* decodes to a JSON object carrying every required key."""
+    try:
+        data = json_loads(raw)
+    except JSONDecodeError:
+        return False
+    return isinstance(data, dict) and all(key in data for key in _REQUIRED_KEYS)
@@ -0,0 +1,150 @@
+"""
+src/nlp/_llm_cache.py
+======================
+Deterministic LLM response cache — VoiceOps (internal)
+
+Responsibility:
+    - Memoize results of temperature-0 OpenAI calls keyed by a SHA-256 of
+      (model, system prompt, user message, temperature)
+    - In-process LRU with a TTL; optionally shared through Redis when
+      LLM_CACHE_REDIS_URL is set and the ``redis`` package is installed
+
+Usage::
+
+    from src.nlp import _llm_cache
+
+    key = _llm_cache.make_key("gpt-4o-mini", _SYSTEM_PROMPT, user_message)
+    hit = _llm_cache.get(key)
+    if hit is None:
+        ...  # call the model
+        _llm_cache.set(key, result)
+
+Configuration (env):
+    LLM_CACHE_SIZE       — in-process entries (default 4096; 0 disables)
+    LLM_CACHE_TTL        — seconds an entry stays valid (default 86400)
+    LLM_CACHE_REDIS_URL  — optional shared backend
+
+This module does NOT:
+    - Call OpenAI or decide what is cacheable
+    - Validate cached values (store only validated results)
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from src.json_codec import dumps as json_dumps, loads as json_loads
+
+try:
+    import redis
+except ImportError:  # optional shared backend
+    redis = None
+
+logger = logging.getLogger("voiceops.nlp.llm_cache")
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+LLM_CACHE_SIZE: int = int(os.environ.get("LLM_CACHE_SIZE", "4096"))
+LLM_CACHE_TTL: float = float(os.environ.get("LLM_CACHE_TTL", "86400"))
+LLM_CACHE_REDIS_URL: str | None = os.environ.get("LLM_CACHE_REDIS_URL")
+
+_REDIS_PREFIX: str = "voiceops:llm:"
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+_memory: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+_redis_client = None
+
+
+def _get_redis():
+    """Lazily connect to Redis; None when not configured or unavailable."""
+    global _redis_client
+
+    if _redis_client is None and LLM_CACHE_REDIS_URL and redis is not None:
+        _redis_client = redis.Redis.from_url(LLM_CACHE_REDIS_URL)
+    return _redis_client
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def make_key(
+    model: str,
+    system: str,
+    user: str,
+    temperature: float = 0.0,
+) -> str:
+    """SHA-256 over the inputs that fully determine a temperature-0 reply."""
+    payload = {"model": model, "sys": system, "user": user, "t": temperature}
+    return hashlib.sha256(json_dumps(dict(sorted(payload.items())))).hexdigest()
+
+
+def get(key: str) -> Any | None:
+    """Return the cached value for *key*, or None on a miss/expiry."""
+    if LLM_CACHE_SIZE > 0:
+        now = time.monotonic()
+        with _memory_lock:
+            entry = _memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    _memory.move_to_end(key)
+                    return value
+                del _memory[key]
+
+    client = _get_redis()
+    if client is not None:
+        try:
+            raw = client.get(_REDIS_PREFIX + key)
+        except Exception as exc:
+            logger.warning("LLM cache Redis read failed: %s", exc)
+            return None
+        if raw is not None:
+            value = json_loads(raw)
+            _remember(key, value, LLM_CACHE_TTL)
+            return value
+
+    return None
+
+
+def set(key: str, value: Any, ttl: float | None = None) -> None:
+    """Store a JSON-serializable *value* under *key* for *ttl* seconds."""
+    ttl = LLM_CACHE_TTL if ttl is None else ttl
+    _remember(key, value, ttl)
+
+    client = _get_redis()
+    if client is not None:
+        try:
+            client.set(_REDIS_PREFIX + key, json_dumps(value), ex=max(1, int(ttl)))
+        except Exception as exc:
+            logger.warning("LLM cache Redis write failed: %s", exc)
+
+
+def clear() -> None:
+    """Drop all in-process entries (Redis is left untouched)."""
+    with _memory_lock:
+        _memory.clear()
+
+
+def _remember(key: str, value: Any, ttl: float) -> None:
+    if LLM_CACHE_SIZE <= 0:
+        return
+    with _memory_lock:
+        _memory[key] = (time.monotonic() + ttl, value)
+        _memory.move_to_end(key)
+        while len(_memory) > LLM_CACHE_SIZE:
+            _memory.popitem(last=False)
@@ -0,0 +1,64 @@
+"""
+src/nlp/_procpool.py
+=====================
+Shared worker-process pool — VoiceOps Phase 4 (internal)
+
+Responsibility:
+    - Run a per-text function (normalize_text, redact_pii) over the texts
+      of a very long transcript in worker processes
+    - Keep ONE lazily spawned pool for the package, so the normalizer and
+      the redactor do not each spawn workers that re-import it
+
+``re`` holds the GIL while matching, so threads cannot speed this up;
+only processes can. A text takes microseconds, so the pickling
+round-trip only pays off for very long transcripts.
+
+Configuration (env):
+    NLP_WORKERS        — worker processes (default 0: always in-process)
+    NLP_PARALLEL_MIN   — fewer texts than this always run in-process
+                         (default 2048)
+
+This module does NOT:
+    - Know what the functions it runs do
+    - Change any result (outputs keep the input order)
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+_WORKERS: int = int(os.environ.get("NLP_WORKERS", "0"))
+_PARALLEL_MIN_TEXTS: int = int(os.environ.get("NLP_PARALLEL_MIN", "2048"))
+_CHUNKSIZE: int = 256
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Lazily create the process pool (spawned — callers are threaded)."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _pool
+
+
+def map_texts(fn: Callable[[str], str], texts: list[str]) -> list[str]:
+    """
+    ``[fn(text) for text in texts]``, in worker processes when enabled and
+    *texts* is long enough.
+
+    Args:
+        fn: A module-level (picklable) function.
+        texts: Input texts.
+    """
+    if _WORKERS > 0 and len(texts) >= _PARALLEL_MIN_TEXTS:
+        return list(_get_pool().map(fn, texts, chunksize=_CHUNKSIZE))
+    return [fn(text) for text in texts]
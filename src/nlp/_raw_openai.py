@@ -0,0 +1,148 @@
+"""
+src/nlp/_raw_openai.py
+=======================
+Raw HTTP chat-completions client — VoiceOps Phase 6 (internal)
+
+Responsibility:
+    - POST chat-completion requests straight to the OpenAI REST API with
+      httpx and decode the reply with src.json_codec, skipping the SDK's
+      typed response models
+    - Retry with the policy in src.openai_retry (call_with_retry)
+
+Enabled with VOICEOPS_RAW_OPENAI=1; the SDK path stays the default.
+Requests go over the shared src.openai_transport client (HTTP/2 when
+``h2`` is installed), the same pool the SDK clients use.
+
+Usage::
+
+    from src.nlp import _raw_openai
+
+    if _raw_openai.RAW_ENABLED:
+        content = _raw_openai.complete(model="gpt-4o-mini", messages=[...])
+
+This module does NOT:
+    - Stream responses
+    - Build prompts or parse the model's JSON content
+"""
+
+import logging
+import os
+from typing import Any, Callable
+
+import httpx
+
+from src.json_codec import dumps as json_dumps, loads as json_loads
+from src.openai_retry import call_with_retry
+from src.openai_transport import get_sync_client
+
+logger = logging.getLogger("voiceops.nlp.raw_openai")
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+RAW_ENABLED: bool = os.environ.get("VOICEOPS_RAW_OPENAI", "0") == "1"
+
+_BASE_URL: str = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1")
+_TIMEOUT = httpx.Timeout(30.0)
+
+
+# ---------------------------------------------------------------------------
+# Errors
+# ---------------------------------------------------------------------------
+# Named like the SDK's exceptions so src.openai_retry classifies them the
+# same way (type name / status_code).
+
+
+class APIStatusError(Exception):
+    """Non-2xx reply from the API."""
+
+    def __init__(self, status_code: int, body: str) -> None:
+        super().__init__(f"OpenAI API returned {status_code}: {body[:200]}")
+        self.status_code = status_code
+
+
+class RateLimitError(APIStatusError):
+    """HTTP 429."""
+
+
+class APIConnectionError(Exception):
+    """Transport failure before a reply was received."""
+
+
+class APITimeoutError(APIConnectionError):
+    """Request timed out."""
+
+
+# ---------------------------------------------------------------------------
+# HTTP client
+# ---------------------------------------------------------------------------
+# The shared transport client is URL- and auth-agnostic; this is the only
+# request-specific state.
+
+
+def _headers() -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {os.environ.get('OPENAI_API_KEY', '')}",
+        "Content-Type": "application/json",
+    }
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def chat_raw(**kwargs: Any) -> dict[str, Any]:
+    """
+    One POST to ``/chat/completions``; returns the decoded reply.
+
+    Accepts the SDK's keyword arguments; ``extra_body`` is merged into
+    the request body as the SDK does.
+
+    Raises:
+        RateLimitError / APIStatusError: On a non-2xx reply.
+        APITimeoutError / APIConnectionError: On transport failure.
+    """
+    body = dict(kwargs)
+    body.update(body.pop("extra_body", None) or {})
+
+    try:
+        response = get_sync_client().post(
+            f"{_BASE_URL}/chat/completions",
+            content=json_dumps(body),
+            headers=_headers(),
+            timeout=_TIMEOUT,
+        )
+    except httpx.TimeoutException as exc:
+        raise APITimeoutError(str(exc)) from exc
+    except httpx.TransportError as exc:
+        raise APIConnectionError(str(exc)) from exc
+
+    if response.status_code == 429:
+        raise RateLimitError(429, response.text)
+    if response.status_code >= 400:
+        raise APIStatusError(response.status_code, response.text)
+    return json_loads(response.content)
+
+
+def complete(
+    *,
+    on_rate_limit: Callable[[], None] | None = None,
+    on_success: Callable[[], None] | None = None,
+    **kwargs: Any,
+) -> str:
+    """
+    :func:`chat_raw` with retry; returns the first choice's content.
+
+    Args:
+        on_rate_limit, on_success: Forwarded to call_with_retry.
+        **kwargs: Chat-completion parameters (model, messages, ...).
+    """
+    reply = call_with_retry(
+        lambda: chat_raw(**kwargs),
+        on_rate_limit=on_rate_limit,
+        on_success=on_success,
+    )
+    return reply["choices"][0]["message"]["content"] or ""
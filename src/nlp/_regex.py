@@ -0,0 +1,85 @@
+"""
+src/nlp/_regex.py
+==================
+Pattern compiler — VoiceOps Phase 4/6 (internal)
+
+Responsibility:
+    - Compile the word-list patterns of the normalizer and the obligation
+      classifier, and the PII patterns of the redactor, with RE2
+      (``google-re2``) when it is installed, falling back to the standard
+      ``re`` module
+    - Compile lower-cased, case-sensitive variants for text that callers
+      lower-case once (``re``'s IGNORECASE case-folds at every step and
+      is 3–4x slower on these lists)
+
+RE2 matches with a DFA in linear time instead of ``re``'s backtracking.
+The lists are plain alternations and the PII patterns use only classes,
+groups and bounded repeats, all of which RE2 handles well. A pattern that
+RE2 rejects is compiled with ``re`` instead, so callers need no fallback
+of their own.
+
+Note: RE2's ``\\b``, ``\\w``, ``\\d`` and ``\\s`` are ASCII-only, whereas
+``re``'s are Unicode-aware. This only matters for markers next to
+non-ASCII letters and for non-ASCII digits (Phase 3 output is English).
+
+This module does NOT:
+    - Define any patterns (they stay in their owning modules)
+    - Change matching results for ASCII text
+"""
+
+import logging
+import re
+from typing import Any
+
+try:
+    import re2
+except ImportError:  # optional — standard re otherwise
+    re2 = None
+
+logger = logging.getLogger("voiceops.nlp.regex")
+
+RE2_AVAILABLE: bool = re2 is not None
+
+
+def _compile(pattern: str, flags: int, re2_prefix: str) -> Any:
+    """RE2 with inline *re2_prefix* flags, else ``re`` with *flags*."""
+    if re2 is not None:
+        try:
+            # Inline flag: RE2's Python binding takes options, not re flags
+            return re2.compile(re2_prefix + pattern)
+        except re2.error as exc:
+            logger.debug("RE2 rejected pattern (%s) — using re.", exc)
+    return re.compile(pattern, flags)
+
+
+def compile_cs(pattern: str) -> Any:
+    """
+    Compile *pattern* as is (case-sensitive), with RE2 when available.
+
+    The result supports the same API subset as :func:`compile_ci`.
+    """
+    return _compile(pattern, 0, "")
+
+
+def compile_ci(pattern: str) -> Any:
+    """
+    Compile *pattern* case-insensitively, with RE2 when available.
+
+    The result supports the ``search`` / ``findall`` / ``sub`` subset of
+    the ``re.Pattern`` API used in this package.
+    """
+    return _compile(pattern, re.IGNORECASE, "(?i)")
+
+
+def compile_lower(pattern: str) -> Any:
+    """
+    Compile *pattern* lower-cased and case-sensitive, for text the caller
+    has already passed through ``str.lower()``.
+
+    Raises:
+        ValueError: If *pattern* has an upper-case escape (``\\B``, ``\\S``,
+            ...), whose meaning lower-casing would change.
+    """
+    if re.search(r"\\[A-Z]", pattern):
+        raise ValueError(f"Pattern has an upper-case escape: {pattern!r}")
+    return _compile(pattern.lower(), 0, "")
@@ -0,0 +1,103 @@
+"""
+src/nlp/_utt_utils.py
+======================
+Shared utterance helpers — VoiceOps Phase 5/6 (internal)
+
+Responsibility:
+    - Extract the non-empty CUSTOMER texts from Phase 4 utterances, the
+      first step of every per-speaker NLP module (sentiment, intent,
+      contradictions, entities)
+    - Collapse repeated texts before they are numbered into an LLM prompt
+    - Clamp oversized text lists to their head and tail for LLM prompts
+
+This module does NOT:
+    - Call LLMs or external APIs
+    - Modify utterance dicts
+"""
+
+import sys
+from typing import Any
+
+# Phase 3 emits upper-case labels, so the exact (interned) comparison
+# almost always decides; only a same-length label is case-folded.
+_CUSTOMER: str = sys.intern("CUSTOMER")
+_CUSTOMER_LEN: int = len(_CUSTOMER)
+
+# Default prompt bounds for clamp_texts (callers may override via env)
+MAX_PROMPT_UTTERANCES: int = 80
+MAX_PROMPT_CHARS: int = 12000
+
+
+def filter_customer_texts(
+    utterances: list[dict[str, Any]],
+) -> list[str]:
+    """
+    Extract text from CUSTOMER utterances only.
+
+    The speaker match is case-insensitive; the exact-case comparison
+    runs first and other labels (e.g. "AGENT") are only upper-cased when
+    their length matches, so the usual labels allocate nothing.
+
+    Args:
+        utterances: Phase 4 output — list of utterance dicts with keys:
+            speaker, text, start_time, end_time.
+
+    Returns:
+        List of stripped customer text strings (non-empty only).
+    """
+    customer_texts: list[str] = []
+    for utt in utterances:
+        speaker = utt.get("speaker")
+        if speaker == _CUSTOMER or (
+            speaker and len(speaker) == _CUSTOMER_LEN and speaker.upper() == _CUSTOMER
+        ):
+            text = utt.get("text")
+            if text and (text := text.strip()):
+                customer_texts.append(text)
+    return customer_texts
+
+
+def collapse_repeats(texts: list[str]) -> list[str]:
+    """
+    Drop exact repeats, keeping first-occurrence order.
+
+    A text said more than once keeps a count suffix, e.g.
+    ``"okay (said 3x)"``, so the model still sees the emphasis without
+    paying input tokens for every copy.
+    """
+    counts: dict[str, int] = {}
+    for text in texts:
+        counts[text] = counts.get(text, 0) + 1
+    return [
+        text if count == 1 else f"{text} (said {count}x)"
+        for text, count in counts.items()
+    ]
+
+
+def clamp_texts(
+    texts: list[str],
+    max_utterances: int = MAX_PROMPT_UTTERANCES,
+    max_chars: int = MAX_PROMPT_CHARS,
+) -> list[str]:
+    """
+    Keep the first and last utterances of an oversized list.
+
+    When *texts* exceeds *max_utterances* entries or *max_chars* total
+    characters, the middle is replaced by a single ``"… [N omitted] …"``
+    marker. Equal head and tail sizes start at ``max_utterances // 2``
+    and are halved until they fit *max_chars*; a list that cannot be
+    shortened by dropping whole utterances is returned unchanged.
+    """
+    if len(texts) <= max_utterances and sum(map(len, texts)) <= max_chars:
+        return texts
+
+    keep = min(max_utterances, len(texts)) // 2
+    while keep > 1 and (
+        sum(map(len, texts[:keep])) + sum(map(len, texts[-keep:])) > max_chars
+    ):
+        keep //= 2
+
+    omitted = len(texts) - 2 * keep
+    if keep < 1 or omitted <= 0:
+        return texts
+    return texts[:keep] + [f"… [{omitted} omitted] …"] + texts[-keep:]
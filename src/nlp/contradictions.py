@@ -8,6 +8,7 @@ Responsibility:
     - Filter to CUSTOMER utterances only (per RULES.md §5)
     - Detect contradictions within the same call using OpenAI API
     - Return a boolean: true if contradictions detected, false otherwise
+    - Offer an async variant that micro-batches concurrent callers
 
 Per RULES.md §8.4 — Contradiction detection with binary output (true / false).
 
@@ -23,16 +24,28 @@ This module does NOT:
     - Track customers over time
 """
 
-import json
+import asyncio
+import itertools
 import logging
 import os
+import re
 import threading
 import time
 from typing import Any
 
 from openai import OpenAI
 
-from src.openai_retry import chat_completions_with_retry
+from src.json_codec import loads as json_loads
+from src.nlp import _combined, _llm_cache, _raw_openai
+from src.nlp._async_openai import LoopLocal, get_async_openai
+from src.nlp._batcher import Batcher
+from src.nlp._utt_utils import clamp_texts, collapse_repeats
+from src.nlp._utt_utils import filter_customer_texts as _filter_customer_utterances
+from src.openai_retry import (
+    async_chat_completions_with_retry,
+    chat_completions_with_retry,
+)
+from src.openai_transport import get_sync_client
 
 logger = logging.getLogger("voiceops.nlp.contradictions")
 
@@ -95,36 +108,61 @@ class _AdaptiveRateLimiter:
             self._tokens = min(self._tokens + new_tokens, float(self._burst))
             self._last_refill = now
 
-    # ---- public API ------------------------------------------------------
-
-    def acquire(self) -> None:
+    def _compute_wait(self) -> float:
         """
-        Block (if necessary) until a token is available, then consume one.
-
-        In the common case (tokens > 0) this returns **immediately**
-        with no sleep, so throughput is unaffected when the call rate
-        is well within budget.
+        Consume a token if one is available and return 0.0; otherwise
+        return the seconds to wait before calling ``_consume_after_wait``.
         """
         with self._lock:
             self._refill()
             if self._tokens >= 1.0:
                 self._tokens -= 1.0
-                return  # fast path — no wait
+                return 0.0  # fast path — no wait
             # Calculate how long until the next token is available
             deficit = 1.0 - self._tokens
-            wait = deficit * self._interval
+            interval = self._interval
+            wait = deficit * interval
 
-        # Sleep *outside* the lock so other threads aren't blocked
         logger.debug(
             "Rate limiter: waiting %.2fs for token (interval=%.2fs).",
-            wait, self._interval,
+            wait, interval,
         )
-        time.sleep(wait)
+        return wait
 
+    def _consume_after_wait(self) -> None:
         with self._lock:
             self._refill()
             self._tokens = max(self._tokens - 1.0, 0.0)
 
+    # ---- public API ------------------------------------------------------
+
+    def acquire(self) -> None:
+        """
+        Block (if necessary) until a token is available, then consume one.
+
+        In the common case (tokens > 0) this returns **immediately**
+        with no sleep, so throughput is unaffected when the call rate
+        is well within budget.
+        """
+        wait = self._compute_wait()
+        if wait:
+            # Sleep *outside* the lock so other threads aren't blocked
+            time.sleep(wait)
+            self._consume_after_wait()
+
+    async def acquire_async(self) -> None:
+        """
+        Async :meth:`acquire`: waits with ``asyncio.sleep`` so other
+        coroutines keep running while this one is throttled.
+
+        The threading lock is only held for the bucket arithmetic, never
+        across an await, so it is safe to share with sync callers.
+        """
+        wait = self._compute_wait()
+        if wait:
+            await asyncio.sleep(wait)
+            self._consume_after_wait()
+
     def report_success(self) -> None:
         """Signal a successful API call; gradually recover the rate."""
         with self._lock:
@@ -154,12 +192,157 @@ class _AdaptiveRateLimiter:
             )
 
 
+class _ShardedRateLimiter:
+    """
+    Split one RPM budget across independent per-thread sub-buckets.
+
+    Each calling thread is given the next shard index on its first call
+    (round-robin), so worker threads mostly contend on different locks.
+    Async callers all share the event-loop thread, so each
+    ``acquire_async`` call takes the next shard instead.
+    The RPM budget and the burst are split so that the shards add up to
+    the configured totals (at most ``burst`` shards, each with at least
+    one token). 429s and successes are global signals: every shard is
+    tightened on a 429 and counts towards recovery on a success.
+    """
+
+    def __init__(self, max_rpm: int, burst: int, shards: int) -> None:
+        if shards < 1:
+            raise ValueError(f"shards must be >= 1, got {shards}")
+        shards = min(shards, max(burst, 1))
+        self.shards = [
+            _AdaptiveRateLimiter(
+                max_rpm=max_rpm / shards,
+                burst=max(1, burst // shards + (i < burst % shards)),
+            )
+            for i in range(shards)
+        ]
+        self._next_index = itertools.count()
+        self._local = threading.local()
+
+    def _shard(self) -> _AdaptiveRateLimiter:
+        index = getattr(self._local, "index", None)
+        if index is None:
+            # itertools.count() is atomic under the GIL
+            index = self._local.index = next(self._next_index) % len(self.shards)
+        return self.shards[index]
+
+    def acquire(self) -> None:
+        self._shard().acquire()
+
+    async def acquire_async(self) -> None:
+        shard = self.shards[next(self._next_index) % len(self.shards)]
+        await shard.acquire_async()
+
+    def report_success(self) -> None:
+        for shard in self.shards:
+            shard.report_success()
+
+    def report_rate_limit(self) -> None:
+        for shard in self.shards:
+            shard.report_rate_limit()
+
+
+class _NullRateLimiter:
+    """No-op limiter for deployments whose RPM budget never binds."""
+
+    def acquire(self) -> None:
+        pass
+
+    async def acquire_async(self) -> None:
+        pass
+
+    def report_success(self) -> None:
+        pass
+
+    def report_rate_limit(self) -> None:
+        pass
+
+
+def _build_rate_limiter() -> "_AdaptiveRateLimiter | _ShardedRateLimiter | _NullRateLimiter":
+    max_rpm = int(os.environ.get("CONTRADICTION_MAX_RPM", "30"))
+    burst = int(os.environ.get("CONTRADICTION_BURST", "5"))
+    shards = int(os.environ.get("CONTRADICTION_SHARDS", "1"))
+    if max_rpm <= 0:
+        # Unlimited — openai_retry still backs off on a real 429
+        return _NullRateLimiter()
+    if shards > 1:
+        return _ShardedRateLimiter(max_rpm=max_rpm, burst=burst, shards=shards)
+    return _AdaptiveRateLimiter(max_rpm=max_rpm, burst=burst)
+
+
 # Module-level singleton — shared across all calls in this process.
 # Conservative baseline: 30 RPM with burst of 5.  Tune via env vars
-# CONTRADICTION_MAX_RPM / CONTRADICTION_BURST if needed.
-_rate_limiter = _AdaptiveRateLimiter(
-    max_rpm=int(os.environ.get("CONTRADICTION_MAX_RPM", "30")),
-    burst=int(os.environ.get("CONTRADICTION_BURST", "5")),
+# CONTRADICTION_MAX_RPM / CONTRADICTION_BURST if needed (MAX_RPM=0 turns
+# throttling off); set CONTRADICTION_SHARDS for many worker threads (capped
+# at CONTRADICTION_BURST so every shard holds at least one token).
+_rate_limiter = _build_rate_limiter()
+
+
+# Longer calls keep only their first/last utterances in the prompt
+_MAX_UTTERANCES: int = int(os.environ.get("CONTRADICTION_MAX_UTT", "80"))
+
+# Opt-in local screen (CONTRADICTION_HEURISTIC_SKIP=1): the model is only
+# called when one utterance contains a negation and a *different* one
+# talks about paying, owing or the loan. Off by default — the model
+# stays the ground truth.
+HEURISTIC_SKIP_ENABLED: bool = (
+    os.environ.get("CONTRADICTION_HEURISTIC_SKIP", "0") == "1"
+)
+
+# Opt-in (CONTRADICTION_STREAM=1): stream the reply and close the
+# connection as soon as the boolean has arrived (sync, separate call only).
+STREAM_ENABLED: bool = os.environ.get("CONTRADICTION_STREAM", "0") == "1"
+
+_STREAM_VERDICT_RE = re.compile(r'"contradictions_detected"\s*:\s*(true|false)')
+
+_NEG_RE = re.compile(
+    r"\b(?:no|not|never|nothing|don'?t|didn'?t|haven'?t|won'?t|can'?t|cannot)\b",
+    re.IGNORECASE,
+)
+_PAY_RE = re.compile(
+    r"\b(?:pay|paid|paying|payment|owe|money|received|contacted|amount|"
+    r"loan|emi|due|balance)\b",
+    re.IGNORECASE,
+)
+
+
+# ---------------------------------------------------------------------------
+# OpenAI client (lazy-loaded singleton)
+# ---------------------------------------------------------------------------
+# One client per process so calls share its HTTP connection pool instead
+# of paying client setup and a TLS handshake on every detection.
+
+_client: OpenAI | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> OpenAI:
+    """Lazily create the shared OpenAI client (thread-safe)."""
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenAI(
+                    api_key=os.environ.get("OPENAI_API_KEY"),
+                    http_client=get_sync_client(),
+                )
+    return _client
+
+
+# ---------------------------------------------------------------------------
+# Micro-batcher (detect_contradictions_async)
+# ---------------------------------------------------------------------------
+# The request is network-bound, so concurrent callers are batched and
+# issued together; identical prompts in a window share one call. There is
+# one batcher per event loop; the AsyncOpenAI client is shared through
+# src.nlp._async_openai.
+
+_CONCURRENCY: int = int(os.environ.get("CONTRADICTION_CONCURRENCY", "8"))
+
+_batchers: LoopLocal[Batcher] = LoopLocal(
+    lambda: Batcher(max_batch=32, max_wait_ms=10, concurrency=_CONCURRENCY)
 )
 
 
@@ -198,39 +381,41 @@ _SYSTEM_PROMPT: str = (
 )
 
 
+# Routes calls sharing the (static) system prompt to the same OpenAI
+# prompt-cache shard; bump the suffix whenever the prompt text changes.
+_PROMPT_CACHE_KEY: str = "voiceops-contradictions-v1"
+
+# Structured output: the model can only emit this exact object
+_RESPONSE_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "contradiction_result",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "contradictions_detected": {"type": "boolean"},
+            },
+            "required": ["contradictions_detected"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
-def _filter_customer_utterances(
-    utterances: list[dict[str, Any]],
-) -> list[str]:
-    """
-    Extract text from CUSTOMER utterances only.
-
-    Args:
-        utterances: Phase 4 output — list of utterance dicts with keys:
-            speaker, text, start_time, end_time.
-
-    Returns:
-        List of customer text strings (non-empty only).
-    """
-    customer_texts: list[str] = []
-    for utt in utterances:
-        if utt.get("speaker", "").upper() == "CUSTOMER":
-            text = utt.get("text", "").strip()
-            if text:
-                customer_texts.append(text)
-    return customer_texts
-
-
 def _build_user_message(customer_texts: list[str]) -> str:
     """
     Build the user message containing numbered CUSTOMER utterances.
 
     Numbering preserves chronological order and helps the model
-    identify which statements may contradict each other.
+    identify which statements may contradict each other. Exact repeats
+    are listed once, at their first position, with a count suffix; very
+    long calls keep only their first and last utterances (clamp_texts).
 
     Args:
         customer_texts: List of non-empty customer text strings.
@@ -238,16 +423,22 @@ def _build_user_message(customer_texts: list[str]) -> str:
     Returns:
         Numbered customer speech as a single user message.
     """
-    numbered = [
-        f"{i}. {text}" for i, text in enumerate(customer_texts, start=1)
-    ]
-    return "\n".join(numbered)
+    return "\n".join(
+        f"{i}. {text}"
+        for i, text in enumerate(
+            clamp_texts(collapse_repeats(customer_texts), _MAX_UTTERANCES), start=1,
+        )
+    )
 
 
 def _parse_contradiction_response(raw: str) -> bool:
     """
     Parse and validate the OpenAI response into a boolean.
 
+    The request pins the reply to _RESPONSE_FORMAT's strict schema, so a
+    well-formed reply is always ``{"contradictions_detected": <bool>}``;
+    anything else is reported through a single ValueError path.
+
     Args:
         raw: Raw JSON string from OpenAI completion.
 
@@ -258,16 +449,11 @@ def _parse_contradiction_response(raw: str) -> bool:
         ValueError: If response is not valid or contains disallowed values.
     """
     try:
-        parsed = json.loads(raw.strip())
-    except json.JSONDecodeError as exc:
-        raise ValueError(f"Contradiction response is not valid JSON: {raw!r}") from exc
-
-    if not isinstance(parsed, dict):
-        raise ValueError(f"Expected JSON object, got {type(parsed).__name__}")
-
-    value = parsed.get("contradictions_detected")
+        value = json_loads(raw)["contradictions_detected"]
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValueError(f"Invalid contradiction response: {raw!r}") from exc
 
-    if not isinstance(value, bool):
+    if type(value) is not bool:
         raise ValueError(
             f"'contradictions_detected' must be a boolean, "
             f"got {type(value).__name__}: {value!r}"
@@ -306,63 +492,206 @@ def detect_contradictions(
         ValueError: If OpenAI returns an invalid or unparseable response.
         openai.OpenAIError: If the OpenAI API call fails.
     """
-    # Step 1: Filter to CUSTOMER utterances only (per RULES.md §5)
+    # Steps 1-2: Filter to CUSTOMER utterances and build the message
+    prepared = _prepare(utterances)
+    if prepared is None:
+        return False
+    customer_texts, user_message = prepared
+
+    # Identical prompts at temperature 0 give identical answers — a cache
+    # hit skips the rate limiter and the network entirely
+    cache_key = None
+    if not _combined.COMBINED_ENABLED:
+        cache_key = _llm_cache.make_key("gpt-4o-mini", _SYSTEM_PROMPT, user_message)
+        cached = _llm_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Contradiction detection cache hit: %s", cached)
+            return cached["contradictions_detected"]
+
+    # Step 3: Call OpenAI API (with proactive rate limiting). 429s and
+    # successes inside the retry loop feed the limiter as they happen,
+    # not once the loop has given up.
+    if _combined.COMBINED_ENABLED:
+        # One call shared with extract_entities (memoized per texts)
+        raw_content = _combined.analyze(
+            customer_texts,
+            before_call=_rate_limiter.acquire,
+            **_limiter_hooks(),
+        )
+    else:
+        _rate_limiter.acquire()
+        if _raw_openai.RAW_ENABLED and not STREAM_ENABLED:
+            raw_content = _raw_openai.complete(
+                **_limiter_hooks(), **_request_kwargs(user_message),
+            )
+        else:
+            response = chat_completions_with_retry(
+                _get_client(),
+                **_limiter_hooks(),
+                **_request_kwargs(user_message),
+                **({"stream": True} if STREAM_ENABLED else {}),
+            )
+            if STREAM_ENABLED:
+                raw_content = _read_streamed_verdict(response)
+            else:
+                raw_content = response.choices[0].message.content or ""
+
+    # Steps 4-5: Parse, validate and return the boolean
+    return _finish(raw_content, cache_key)
+
+
+async def detect_contradictions_async(
+    utterances: list[dict[str, Any]],
+) -> bool:
+    """
+    Async variant of :func:`detect_contradictions`.
+
+    Concurrent callers are micro-batched (10 ms window, up to 32 requests)
+    and issued together under CONTRADICTION_CONCURRENCY; callers with an
+    identical prompt in the same window share one API call. Same return
+    value and exceptions as the sync function.
+    """
+    if _combined.COMBINED_ENABLED:
+        # The combined call is shared with the sync extract_entities
+        return await asyncio.to_thread(detect_contradictions, utterances)
+
+    prepared = _prepare(utterances)
+    if prepared is None:
+        return False
+    _, user_message = prepared
+
+    cache_key = _llm_cache.make_key("gpt-4o-mini", _SYSTEM_PROMPT, user_message)
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Contradiction detection cache hit: %s", cached)
+        return cached["contradictions_detected"]
+
+    raw_content = await _batchers.get().run(
+        cache_key, lambda: _request_async(user_message),
+    )
+    return _finish(raw_content, cache_key)
+
+
+# ---------------------------------------------------------------------------
+# Shared steps of the sync and async paths
+# ---------------------------------------------------------------------------
+
+
+def _prepare(
+    utterances: list[dict[str, Any]],
+) -> tuple[list[str], str] | None:
+    """Return (customer_texts, user_message), or None when no call is needed."""
+    # Filter to CUSTOMER utterances only (per RULES.md §5)
     customer_texts = _filter_customer_utterances(utterances)
 
     if not customer_texts:
         logger.warning(
             "No CUSTOMER utterances found — no contradictions possible."
         )
-        return False
+        return None
 
     if len(customer_texts) < 2:
         logger.info(
             "Only 1 CUSTOMER utterance — contradictions require at least 2."
         )
-        return False
+        return None
+
+    # One statement repeated cannot contradict itself — skip the model
+    # round-trip
+    if len(set(customer_texts)) == 1:
+        logger.info(
+            "CUSTOMER repeats one statement — no contradictions possible."
+        )
+        return None
 
-    # Step 2: Build user message with numbered utterances
-    user_message = _build_user_message(customer_texts)
+    if HEURISTIC_SKIP_ENABLED and not _has_candidate_pair(customer_texts):
+        logger.info(
+            "No negation/payment statement pair in CUSTOMER speech — "
+            "skipping contradiction model call."
+        )
+        return None
 
     logger.info(
         "Detecting contradictions across %d CUSTOMER utterance(s).",
         len(customer_texts),
     )
+    return customer_texts, _build_user_message(customer_texts)
+
+
+def _has_candidate_pair(customer_texts: list[str]) -> bool:
+    """True when a negated utterance could clash with another payment one."""
+    negated = [i for i, text in enumerate(customer_texts) if _NEG_RE.search(text)]
+    if not negated:
+        return False
+    paying = [i for i, text in enumerate(customer_texts) if _PAY_RE.search(text)]
+    return any(i != j for i in negated for j in paying)
+
+
+def _request_kwargs(user_message: str) -> dict[str, Any]:
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": user_message},
+        ],
+        "temperature": 0.0,  # Deterministic output for identical inputs
+        # The strict schema's reply is ~9 tokens
+        "max_tokens": 12,
+        "response_format": _RESPONSE_FORMAT,
+        # Passed via extra_body so older SDKs (openai>=1.0) accept it
+        "extra_body": {"prompt_cache_key": _PROMPT_CACHE_KEY},
+    }
+
+
+async def _request_async(user_message: str) -> str:
+    """One rate-limited AsyncOpenAI request; returns the raw reply."""
+    await _rate_limiter.acquire_async()
+    response = await async_chat_completions_with_retry(
+        get_async_openai(), **_limiter_hooks(), **_request_kwargs(user_message),
+    )
+    return response.choices[0].message.content or ""
 
-    # Step 3: Call OpenAI API (with proactive rate limiting)
-    _rate_limiter.acquire()
 
-    client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+def _read_streamed_verdict(stream: Any) -> str:
+    """
+    Consume a streamed reply only until the boolean is known.
 
+    Returns the canonical JSON object for the verdict, or whatever text
+    arrived if the stream ended without one (the parser then rejects it).
+    """
+    parts: list[str] = []
     try:
-        response = chat_completions_with_retry(
-            client,
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": _SYSTEM_PROMPT},
-                {"role": "user", "content": user_message},
-            ],
-            temperature=0.0,  # Deterministic output for identical inputs
-            max_tokens=30,
-        )
-        _rate_limiter.report_success()
-    except Exception as exc:
-        # If a 429 leaked through the proactive limiter, tighten the rate
-        # so subsequent calls are safer — then let openai_retry handle it.
-        exc_type = type(exc).__name__
-        status = getattr(exc, "status_code", None)
-        if exc_type == "RateLimitError" or status == 429:
-            _rate_limiter.report_rate_limit()
-        raise
-
-    raw_content = response.choices[0].message.content or ""
-
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+            match = _STREAM_VERDICT_RE.search("".join(parts))
+            if match:
+                return f'{{"contradictions_detected": {match.group(1)}}}'
+    finally:
+        # Drops the connection instead of waiting for the closing tokens
+        stream.close()
+    return "".join(parts)
+
+
+def _limiter_hooks() -> dict[str, Any]:
+    """Retry-loop callbacks that keep the rate limiter's AIMD state live."""
+    return {
+        "on_rate_limit": _rate_limiter.report_rate_limit,
+        "on_success": _rate_limiter.report_success,
+    }
+
+
+def _finish(raw_content: str, cache_key: str | None) -> bool:
+    """Parse *raw_content*, cache the result under *cache_key* and return it."""
     logger.debug("Raw contradiction response: %s", raw_content)
 
-    # Step 4: Parse and validate
     result = _parse_contradiction_response(raw_content)
+    if cache_key is not None:
+        _llm_cache.set(cache_key, {"contradictions_detected": result})
 
     logger.info("Contradiction detection complete: %s", result)
-
-    # Step 5: Return boolean
     return result
@@ -9,6 +9,7 @@ Responsibility:
     - Extract structured entities: payment_commitment and amount_mentioned
     - Uses OpenAI API for extraction (per RULES.md §6 — LLMs may interpret)
     - Returns structured entity dict for final JSON assembly
+    - Offers an async variant that micro-batches concurrent callers
 
 Per RULES.md §11:
     - nlp_insights.entities is owned by Phase 6
@@ -25,12 +26,26 @@ This module does NOT:
     - Store data or generate identifiers
 """
 
-import json
+import asyncio
 import logging
 import os
+import re
+import threading
 from typing import Any, Optional
 
-from src.openai_retry import chat_completions_with_retry
+from openai import OpenAI
+
+from src.json_codec import loads as json_loads
+from src.nlp import _combined, _llm_cache, _raw_openai
+from src.nlp._async_openai import LoopLocal, get_async_openai
+from src.nlp._batcher import Batcher
+from src.nlp._utt_utils import clamp_texts, collapse_repeats
+from src.nlp._utt_utils import filter_customer_texts as _filter_customer_utterances
+from src.openai_retry import (
+    async_chat_completions_with_retry,
+    chat_completions_with_retry,
+)
+from src.openai_transport import get_sync_client
 
 logger = logging.getLogger("voiceops.nlp.entity_extractor")
 
@@ -39,7 +54,7 @@ logger = logging.getLogger("voiceops.nlp.entity_extractor")
 # Valid payment_commitment values
 # ---------------------------------------------------------------------------
 
-_VALID_PAYMENT_COMMITMENTS: set[str] = {
+_VALID_PAYMENT_COMMITMENTS: frozenset[str] = frozenset({
     "today",
     "tomorrow",
     "this_week",
@@ -48,8 +63,91 @@ _VALID_PAYMENT_COMMITMENTS: set[str] = {
     "next_month",
     "specific_date",
     "unspecified",
+})
+
+
+# ---------------------------------------------------------------------------
+# Prompt bounds
+# ---------------------------------------------------------------------------
+
+# Longer calls keep only their first/last utterances in the prompt
+_MAX_UTTERANCES: int = int(os.environ.get("ENTITY_MAX_UTT", "80"))
+
+
+# ---------------------------------------------------------------------------
+# Local amount pre-pass
+# ---------------------------------------------------------------------------
+# Opt-in (ENTITY_AMOUNT_PREPASS=1): a single "<number> <unit>" amount with
+# no other digits and no talk of paying, giving or timing is answered
+# locally, without an API call. Otherwise a single match is passed to the
+# model as a hint; the model stays the ground truth.
+
+AMOUNT_PREPASS_ENABLED: bool = os.environ.get("ENTITY_AMOUNT_PREPASS", "0") == "1"
+
+_AMOUNT_RE = re.compile(
+    r"(?<![\d.])(\d+(?:\.\d+)?)\s*(lakh|lac|crore|cr|hazaar|hazar|thousand|k)\b",
+    re.IGNORECASE,
+)
+
+_AMOUNT_MULTIPLIERS: dict[str, float] = {
+    "lakh": 1e5,
+    "lac": 1e5,
+    "crore": 1e7,
+    "cr": 1e7,
+    "hazaar": 1e3,
+    "hazar": 1e3,
+    "thousand": 1e3,
+    "k": 1e3,
 }
 
+# Any of these may carry a payment_commitment, which only the model sets
+_COMMITMENT_RE = re.compile(
+    r"\b(?:pay|paid|paying|payment|transfer|deposit|send|settle|clear|"
+    r"give|do|can|by|i'll|promise|will|today|tomorrow|week|month|date|"
+    r"salary|monday|tuesday|wednesday|thursday|friday|saturday|sunday|"
+    r"de|dunga|dungi|denge|bhej|bhejunga|kal|parso|aaj|hafte|mahine|tak)\b",
+    re.IGNORECASE,
+)
+
+_DIGIT_RE = re.compile(r"\d")
+
+
+# ---------------------------------------------------------------------------
+# OpenAI client (lazy-loaded singleton)
+# ---------------------------------------------------------------------------
+# One client per process so calls share its HTTP connection pool instead
+# of paying client setup and a TLS handshake on every extraction.
+
+_client: OpenAI | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> OpenAI:
+    """Lazily create the shared OpenAI client (thread-safe)."""
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenAI(
+                    api_key=os.environ.get("OPENAI_API_KEY"),
+                    http_client=get_sync_client(),
+                )
+    return _client
+
+
+# ---------------------------------------------------------------------------
+# Micro-batcher (extract_entities_async)
+# ---------------------------------------------------------------------------
+# One batcher per event loop; the AsyncOpenAI client is shared through
+# src.nlp._async_openai.
+
+_CONCURRENCY: int = int(os.environ.get("ENTITY_CONCURRENCY", "8"))
+
+_batchers: LoopLocal[Batcher] = LoopLocal(
+    lambda: Batcher(max_batch=32, max_wait_ms=10, concurrency=_CONCURRENCY)
+)
+
 
 # ---------------------------------------------------------------------------
 # OpenAI prompt — entity extraction
@@ -99,70 +197,135 @@ _SYSTEM_PROMPT: str = (
     '{"payment_commitment": null, "amount_mentioned": null}\n'
 )
 
+# Routes calls sharing the (static) system prompt to the same OpenAI
+# prompt-cache shard; bump the suffix whenever the prompt text changes.
+_PROMPT_CACHE_KEY: str = "voiceops-entity-v1"
+
+# Strict structured output: the server guarantees the reply matches this
+# schema, so _parse_entity_response only has to read the two fields.
+_RESPONSE_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "entity_result",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "payment_commitment": {
+                    "type": ["string", "null"],
+                    "enum": [*sorted(_VALID_PAYMENT_COMMITMENTS), None],
+                },
+                "amount_mentioned": {"type": ["number", "null"]},
+            },
+            "required": ["payment_commitment", "amount_mentioned"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+_DEFAULT_ENTITIES: dict[str, Any] = {
+    "payment_commitment": None,
+    "amount_mentioned": None,
+}
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
-def _filter_customer_utterances(
-    utterances: list[dict[str, Any]],
-) -> list[str]:
-    """Extract text from CUSTOMER utterances only."""
-    customer_texts: list[str] = []
-    for utt in utterances:
-        if utt.get("speaker", "").upper() == "CUSTOMER":
-            text = utt.get("text", "").strip()
-            if text:
-                customer_texts.append(text)
-    return customer_texts
+def _amount_prepass(
+    customer_texts: list[str],
+) -> tuple[dict[str, Any] | None, float | None]:
+    """
+    Try to answer from a single regex-matched amount.
+
+    Returns:
+        (entities, None) when the local match fully answers the request,
+        (None, amount) when the model should be called with *amount* as a
+        hint, or (None, None) when there is no single clean match.
+    """
+    if not AMOUNT_PREPASS_ENABLED:
+        return None, None
+
+    joined = " ".join(customer_texts)
+    matches = list(_AMOUNT_RE.finditer(joined))
+    if len(matches) != 1:
+        return None, None
+
+    match = matches[0]
+    number, unit = match.groups()
+    # round() drops float noise such as 2.3 * 1e5 == 229999.99999999997
+    amount = round(float(number) * _AMOUNT_MULTIPLIERS[unit.lower()], 2)
+    # Unit-less figures ("EMI is 12000") are invisible to _AMOUNT_RE
+    rest = joined[: match.start()] + joined[match.end() :]
+    if _COMMITMENT_RE.search(joined) or _DIGIT_RE.search(rest):
+        return None, amount
+    return {"payment_commitment": None, "amount_mentioned": amount}, None
+
+
+def _build_user_message(
+    customer_texts: list[str],
+    amount_hint: float | None = None,
+) -> str:
+    message = "CUSTOMER utterances from the call:\n" + "\n".join(
+        f"[{i+1}] {text}"
+        for i, text in enumerate(
+            clamp_texts(collapse_repeats(customer_texts), _MAX_UTTERANCES)
+        )
+    )
+    if amount_hint is not None:
+        message += f"\n\nAmount detected in the text: {amount_hint:.0f}"
+    return message
+
+
+def _request_kwargs(user_message: str) -> dict[str, Any]:
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": user_message},
+        ],
+        "temperature": 0.0,
+        "max_tokens": 80,
+        "response_format": _RESPONSE_FORMAT,
+        # Passed via extra_body so older SDKs (openai>=1.0) accept it
+        "extra_body": {"prompt_cache_key": _PROMPT_CACHE_KEY},
+    }
+
+
+async def _request_async(user_message: str) -> str:
+    """One AsyncOpenAI request; returns the raw reply."""
+    response = await async_chat_completions_with_retry(
+        get_async_openai(), **_request_kwargs(user_message),
+    )
+    return response.choices[0].message.content or ""
 
 
 def _parse_entity_response(raw: str) -> dict[str, Any]:
     """
-    Parse and validate the OpenAI response into an entity dict.
+    Parse the OpenAI response into an entity dict.
+
+    The request pins the reply to _RESPONSE_FORMAT's strict schema, so
+    the values are already in range; a zero amount is reported as None.
 
     Returns:
-        Validated entity dict with payment_commitment and amount_mentioned.
+        Entity dict with payment_commitment and amount_mentioned.
 
     Raises:
-        ValueError: If response is not valid.
+        ValueError: If the reply does not match the schema.
     """
     try:
-        parsed = json.loads(raw.strip())
-    except json.JSONDecodeError as exc:
-        raise ValueError(f"Entity response is not valid JSON: {raw!r}") from exc
-
-    if not isinstance(parsed, dict):
-        raise ValueError(f"Expected JSON object, got {type(parsed).__name__}")
-
-    payment = parsed.get("payment_commitment")
-    amount = parsed.get("amount_mentioned")
-
-    # Validate payment_commitment
-    if payment is not None and payment not in _VALID_PAYMENT_COMMITMENTS:
-        payment = None  # Graceful degradation for unexpected values
-
-    # Validate amount_mentioned — accept int, float, or numeric strings
-    if amount is not None:
-        if isinstance(amount, (int, float)):
-            amount = float(amount) if amount != 0 else None
-        elif isinstance(amount, str):
-            # Handle cases where LLM returns amount as a string
-            cleaned = amount.replace(",", "").replace(" ", "").strip()
-            try:
-                amount = float(cleaned)
-                if amount == 0:
-                    amount = None
-            except (ValueError, TypeError):
-                logger.warning("Could not parse amount string: %r", amount)
-                amount = None
-        else:
-            amount = None
+        parsed = json_loads(raw)
+        payment = parsed["payment_commitment"]
+        amount = parsed["amount_mentioned"]
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValueError(f"Entity response does not match schema: {raw!r}") from exc
 
     return {
         "payment_commitment": payment,
-        "amount_mentioned": amount,
+        "amount_mentioned": float(amount) if amount else None,
     }
 
 
@@ -195,11 +358,6 @@ def extract_entities(
                 "amount_mentioned": float | None,
             }
     """
-    _DEFAULT_ENTITIES = {
-        "payment_commitment": None,
-        "amount_mentioned": None,
-    }
-
     customer_texts = _filter_customer_utterances(utterances)
 
     if not customer_texts:
@@ -208,6 +366,13 @@ def extract_entities(
         )
         return dict(_DEFAULT_ENTITIES)
 
+    local, amount_hint = None, None
+    if not _combined.COMBINED_ENABLED:
+        local, amount_hint = _amount_prepass(customer_texts)
+        if local is not None:
+            logger.info("Entity extraction answered locally: %s", local)
+            return local
+
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         logger.warning(
@@ -216,30 +381,93 @@ def extract_entities(
         return dict(_DEFAULT_ENTITIES)
 
     try:
-        from openai import OpenAI
+        cache_key = None
+        if _combined.COMBINED_ENABLED:
+            # One call shared with detect_contradictions (memoized per texts)
+            raw_content = _combined.analyze(customer_texts)
+        else:
+            user_message = _build_user_message(customer_texts, amount_hint)
+
+            # Deterministic prompt (temperature 0) — reuse earlier answers
+            cache_key = _llm_cache.make_key("gpt-4o-mini", _SYSTEM_PROMPT, user_message)
+            cached = _llm_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Entity extraction cache hit: %s", cached)
+                return dict(cached)
+
+            if _raw_openai.RAW_ENABLED:
+                raw_content = _raw_openai.complete(**_request_kwargs(user_message))
+            else:
+                response = chat_completions_with_retry(
+                    _get_client(), **_request_kwargs(user_message),
+                )
+                raw_content = response.choices[0].message.content or ""
+
+        logger.debug("Raw entity response: %s", raw_content)
 
-        client = OpenAI(api_key=api_key)
+        entities = _parse_entity_response(raw_content)
+        if cache_key is not None:
+            _llm_cache.set(cache_key, dict(entities))
 
-        user_message = "CUSTOMER utterances from the call:\n" + "\n".join(
-            f"[{i+1}] {text}" for i, text in enumerate(customer_texts)
+        logger.info("Entity extraction complete: %s", entities)
+        return entities
+
+    except Exception as exc:
+        logger.warning(
+            "Entity extraction failed: %s — returning empty entities.", exc
         )
+        return dict(_DEFAULT_ENTITIES)
 
-        response = chat_completions_with_retry(
-            client,
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": _SYSTEM_PROMPT},
-                {"role": "user", "content": user_message},
-            ],
-            temperature=0.0,
-            max_tokens=80,
+
+async def extract_entities_async(
+    utterances: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Async variant of :func:`extract_entities`.
+
+    Concurrent callers are micro-batched (10 ms window, up to 32 requests)
+    and issued together under ENTITY_CONCURRENCY; callers with an
+    identical prompt in the same window share one API call. Failures
+    return empty entities, as in the sync function.
+    """
+    if _combined.COMBINED_ENABLED:
+        # The combined call is shared with the sync detect_contradictions
+        return await asyncio.to_thread(extract_entities, utterances)
+
+    customer_texts = _filter_customer_utterances(utterances)
+
+    if not customer_texts:
+        logger.warning(
+            "No CUSTOMER utterances found — returning empty entities."
+        )
+        return dict(_DEFAULT_ENTITIES)
+
+    local, amount_hint = _amount_prepass(customer_texts)
+    if local is not None:
+        logger.info("Entity extraction answered locally: %s", local)
+        return local
+
+    if not os.environ.get("OPENAI_API_KEY"):
+        logger.warning(
+            "API key not set — returning empty entities."
         )
+        return dict(_DEFAULT_ENTITIES)
 
-        raw_content = response.choices[0].message.content or ""
+    user_message = _build_user_message(customer_texts, amount_hint)
+    cache_key = _llm_cache.make_key("gpt-4o-mini", _SYSTEM_PROMPT, user_message)
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Entity extraction cache hit: %s", cached)
+        return dict(cached)
 
+    try:
+        raw_content = await _batchers.get().run(
+            cache_key, lambda: _request_async(user_message),
+        )
         logger.debug("Raw entity response: %s", raw_content)
 
         entities = _parse_entity_response(raw_content)
+        _llm_cache.set(cache_key, dict(entities))
 
         logger.info("Entity extraction complete: %s", entities)
         return entities
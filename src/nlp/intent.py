@@ -8,6 +8,11 @@ Responsibility:
     - Filter to CUSTOMER utterances only (per RULES.md §5)
     - Classify customer intent in a financial-call context using OpenAI API
     - Return intent label, confidence (0–1), and conditionality level
+    - Optionally answer unambiguous speech from keyword cues (no API call)
+    - Optionally send short speech with a trimmed system prompt
+    - Classify many calls concurrently (online) under an RPM/TPM budget
+    - Pack several calls into one prompt to share the system prompt
+    - Classify many calls at once through the OpenAI Batch API (offline)
 
 Per RULES.md §8.1 — Enum-based intent detection with confidence and conditionality.
 
@@ -28,15 +33,29 @@ This module does NOT:
     - Generate identifiers
 """
 
-import json
+import asyncio
+import io
 import logging
 import os
+import threading
+import time
+from collections import deque
 from enum import Enum
 from typing import Any
 
 from openai import OpenAI
 
-from src.openai_retry import chat_completions_with_retry
+from src.json_codec import dumps as json_dumps, loads as json_loads
+from src.nlp import _llm_cache
+from src.nlp._async_openai import get_async_openai
+from src.nlp._regex import compile_lower
+from src.nlp._utt_utils import filter_customer_texts as _filter_customer_utterances
+from src.nlp.obligation import _CONDITIONAL_PATTERN, _STRONG_PATTERN, _WEAK_PATTERN
+from src.openai_retry import (
+    async_chat_completions_with_retry,
+    chat_completions_with_retry,
+)
+from src.openai_transport import get_sync_client
 
 logger = logging.getLogger("voiceops.nlp.intent")
 
@@ -77,30 +96,106 @@ _DEFAULT_INTENT: dict[str, Any] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Keyword fast path (INTENT_FAST_PATH=1)
+# ---------------------------------------------------------------------------
+# Opt-in: speech with one unambiguous cue family and no hedging or
+# conditions is classified locally. Anything mixed goes to the model,
+# which stays the ground truth. Commitment cues are obligation.py's.
+
+FAST_PATH_ENABLED: bool = os.environ.get("INTENT_FAST_PATH", "0") == "1"
+
+# Matched against lower-cased text, like obligation.py's markers
+_REFUSAL_PATTERN: Any = compile_lower(
+    r"\b(?:I|we) (?:will not|won'?t|am not going to|are not going to|refuse to) pay\b"
+    r"|\bI refuse\b|\bnot paying\b|\bnever (?:going to )?pay\b"
+)
+_DISPUTE_PATTERN: Any = compile_lower(
+    r"\bI (?:never|did not|didn'?t) (?:take|took|borrow(?:ed)?|apply for)\b"
+    r"|\bnot my (?:loan|debt|account)\b|\bwrong (?:amount|charges?)\b"
+    r"|\bI do not owe\b|\bI don'?t owe\b"
+)
+
+
+def _fast_intent(customer_texts: list[str]) -> dict[str, Any] | None:
+    """
+    Classify from keyword cues alone, or return None to ask the model.
+
+    Exactly one of refusal / dispute / strong promise must be present,
+    with no hedging or conditional marker anywhere in the speech.
+    """
+    text = "\n".join(customer_texts).lower()
+    if _WEAK_PATTERN.search(text) or _CONDITIONAL_PATTERN.search(text):
+        return None
+
+    refusal = _REFUSAL_PATTERN.search(text) is not None
+    dispute = _DISPUTE_PATTERN.search(text) is not None
+    promise = _STRONG_PATTERN.search(text) is not None
+    if refusal + dispute + promise != 1:
+        return None
+
+    if refusal:
+        label, confidence = IntentLabel.REFUSAL, 0.9
+    elif dispute:
+        label, confidence = IntentLabel.DISPUTE, 0.85
+    else:
+        label, confidence = IntentLabel.REPAYMENT_PROMISE, 0.85
+    return {
+        "label": label.value,
+        "confidence": confidence,
+        "conditionality": Conditionality.LOW.value,
+    }
+
+
+# ---------------------------------------------------------------------------
+# OpenAI client (lazy-loaded singleton)
+# ---------------------------------------------------------------------------
+# One client per process so calls share its HTTP connection pool instead
+# of paying client setup and a TLS handshake on every classification.
+
+_client: OpenAI | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> OpenAI:
+    """Lazily create the shared OpenAI client (thread-safe)."""
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenAI(
+                    api_key=os.environ.get("OPENAI_API_KEY"),
+                    http_client=get_sync_client(),
+                )
+    return _client
+
+
 # ---------------------------------------------------------------------------
 # OpenAI prompt — financial-context intent classification
 # ---------------------------------------------------------------------------
 
-_SYSTEM_PROMPT: str = (
+# The prompt is assembled from sections so the short-input variant below
+# shares its wording with the full prompt instead of drifting from it.
+
+_PROMPT_ROLE: str = (
     "You are a financial call intent classifier. "
     "You analyze CUSTOMER speech from recorded financial calls "
     "(e.g., debt collection, loan inquiries, payment discussions). "
     "You must classify the primary intent of the customer's speech "
     "and assess how conditional their statements are.\n\n"
-    "RULES:\n"
-    "- You MUST return ONLY a valid JSON object with exactly three keys: "
-    '"label", "confidence", and "conditionality".\n'
-    '- "label" MUST be one of: "repayment_promise", "repayment_delay", '
-    '"refusal", "deflection", "information_seeking", "dispute", "unknown".\n'
-    '- "confidence" MUST be a float between 0.0 and 1.0 (inclusive), '
-    "representing how confident you are in the intent label.\n"
-    '- "conditionality" MUST be one of: "low", "medium", "high".\n'
+)
+
+_PROMPT_CONDITIONALITY: str = (
     "  - \"low\" means the customer's statement is unconditional and direct "
     '(e.g., "I will pay tomorrow").\n'
     '  - "medium" means the statement has some conditions or hedging '
     '(e.g., "I should be able to pay by Friday").\n'
     '  - "high" means the statement is heavily conditional, vague, or dependent '
     'on external factors (e.g., "If my salary comes, maybe I can pay").\n\n'
+)
+
+_PROMPT_DEFINITIONS: str = (
     "INTENT DEFINITIONS:\n"
     '- "repayment_promise": Customer explicitly commits to making a payment.\n'
     '- "repayment_delay": Customer acknowledges debt but requests more time.\n'
@@ -111,7 +206,21 @@ _SYSTEM_PROMPT: str = (
     "account details, or process.\n"
     '- "dispute": Customer challenges the validity of the debt or charges.\n'
     '- "unknown": Intent cannot be determined from the speech.\n\n'
-    "CONTEXT:\n"
+)
+
+_SYSTEM_PROMPT: str = (
+    _PROMPT_ROLE
+    + "RULES:\n"
+    "- You MUST return ONLY a valid JSON object with exactly three keys: "
+    '"label", "confidence", and "conditionality".\n'
+    '- "label" MUST be one of: "repayment_promise", "repayment_delay", '
+    '"refusal", "deflection", "information_seeking", "dispute", "unknown".\n'
+    '- "confidence" MUST be a float between 0.0 and 1.0 (inclusive), '
+    "representing how confident you are in the intent label.\n"
+    '- "conditionality" MUST be one of: "low", "medium", "high".\n'
+    + _PROMPT_CONDITIONALITY
+    + _PROMPT_DEFINITIONS
+    + "CONTEXT:\n"
     "- Interpret intent in the context of financial conversations "
     "(e.g., payment pressure, debt recovery, loan discussions).\n"
     "- Do NOT include any other keys, explanations, reasoning, or text.\n"
@@ -120,34 +229,56 @@ _SYSTEM_PROMPT: str = (
     '{"label": "repayment_delay", "confidence": 0.85, "conditionality": "medium"}\n'
 )
 
+# Opt-in (INTENT_MINI_PROMPT=1): customer speech shorter than
+# _MINI_PROMPT_MAX_CHARS is sent with the role, conditionality levels and
+# label definitions only. The output format rules and example are left
+# out; _RESPONSE_FORMAT enforces the format anyway.
+MINI_PROMPT_ENABLED: bool = os.environ.get("INTENT_MINI_PROMPT", "0") == "1"
+_MINI_PROMPT_MAX_CHARS: int = 200
+
+_SYSTEM_PROMPT_MINI: str = (
+    _PROMPT_ROLE
+    + "Return the label, your confidence in it (0.0–1.0) and the "
+    "conditionality:\n"
+    + _PROMPT_CONDITIONALITY
+    + _PROMPT_DEFINITIONS
+)
+
+# Output ceiling for one classification. The longest reply the schema
+# allows ("information_seeking" / "medium", two-decimal confidence) is
+# about 25 tokens; the rest is slack for a longer confidence literal.
+_MAX_OUTPUT_TOKENS: int = 40
+
+# Strict structured output: the API only returns objects matching this
+# schema, so malformed JSON and out-of-enum labels cannot come back.
+# Enums are sorted so the request prefix is stable across processes.
+_RESPONSE_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "intent_result",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "label": {"type": "string", "enum": sorted(_VALID_INTENT_LABELS)},
+                "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+                "conditionality": {
+                    "type": "string",
+                    "enum": sorted(_VALID_CONDITIONALITY),
+                },
+            },
+            "required": ["label", "confidence", "conditionality"],
+            "additionalProperties": False,
+        },
+    },
+}
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
-def _filter_customer_utterances(
-    utterances: list[dict[str, Any]],
-) -> list[str]:
-    """
-    Extract text from CUSTOMER utterances only.
-
-    Args:
-        utterances: Phase 4 output — list of utterance dicts with keys:
-            speaker, text, start_time, end_time.
-
-    Returns:
-        List of customer text strings (non-empty only).
-    """
-    customer_texts: list[str] = []
-    for utt in utterances:
-        if utt.get("speaker", "").upper() == "CUSTOMER":
-            text = utt.get("text", "").strip()
-            if text:
-                customer_texts.append(text)
-    return customer_texts
-
-
 def _build_user_message(customer_texts: list[str]) -> str:
     """
     Build the user message containing all CUSTOMER speech for analysis.
@@ -161,10 +292,37 @@ def _build_user_message(customer_texts: list[str]) -> str:
     return "\n".join(customer_texts)
 
 
+def _system_prompt_for(customer_texts: list[str]) -> str:
+    """Pick the system prompt for *customer_texts* (see INTENT_MINI_PROMPT)."""
+    if MINI_PROMPT_ENABLED and sum(map(len, customer_texts)) < _MINI_PROMPT_MAX_CHARS:
+        return _SYSTEM_PROMPT_MINI
+    return _SYSTEM_PROMPT
+
+
+def _request_body(
+    user_message: str,
+    system_prompt: str = _SYSTEM_PROMPT,
+) -> dict[str, Any]:
+    """Chat-completion parameters for one classification."""
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message},
+        ],
+        "temperature": 0.0,  # Deterministic output for identical inputs
+        "max_tokens": _MAX_OUTPUT_TOKENS,
+        "response_format": _RESPONSE_FORMAT,
+    }
+
+
 def _parse_intent_response(raw: str) -> dict[str, Any]:
     """
     Parse and validate the OpenAI response into an intent object.
 
+    Single-call replies are pinned to _RESPONSE_FORMAT, so the checks in
+    _validate_one only ever fire for packed replies and hand-fed input.
+
     Args:
         raw: Raw JSON string from OpenAI completion.
 
@@ -175,13 +333,23 @@ def _parse_intent_response(raw: str) -> dict[str, Any]:
         ValueError: If response is not valid or contains disallowed values.
     """
     try:
-        parsed = json.loads(raw.strip())
-    except json.JSONDecodeError as exc:
+        parsed = json_loads(raw)
+    except ValueError as exc:
         raise ValueError(f"Intent response is not valid JSON: {raw!r}") from exc
 
     if not isinstance(parsed, dict):
         raise ValueError(f"Expected JSON object, got {type(parsed).__name__}")
 
+    return _validate_one(parsed)
+
+
+def _validate_one(parsed: dict[str, Any]) -> dict[str, Any]:
+    """
+    Validate one decoded intent object (single or packed reply).
+
+    Raises:
+        ValueError: If a field is missing or holds a disallowed value.
+    """
     label = parsed.get("label")
     confidence = parsed.get("confidence")
     conditionality = parsed.get("conditionality")
@@ -226,6 +394,7 @@ def _parse_intent_response(raw: str) -> dict[str, Any]:
 
 def classify_intent(
     utterances: list[dict[str, Any]],
+    customer_texts: list[str] | None = None,
 ) -> dict[str, Any]:
     """
     Classify intent of CUSTOMER speech from Phase 4 output.
@@ -241,6 +410,10 @@ def classify_intent(
         utterances:
             Phase 4 output — list of utterance dicts (normalized, PII-redacted)
             with keys: speaker, text, start_time, end_time.
+        customer_texts:
+            CUSTOMER texts already extracted from *utterances* (shared
+            with derive_obligation_strength by the pipeline); filtered
+            here when omitted.
 
     Returns:
         Intent result dict:
@@ -257,7 +430,8 @@ def classify_intent(
         openai.OpenAIError: If the OpenAI API call fails.
     """
     # Step 1: Filter to CUSTOMER utterances only (per RULES.md §5)
-    customer_texts = _filter_customer_utterances(utterances)
+    if customer_texts is None:
+        customer_texts = _filter_customer_utterances(utterances)
 
     if not customer_texts:
         logger.warning(
@@ -265,6 +439,10 @@ def classify_intent(
         )
         return dict(_DEFAULT_INTENT)
 
+    if FAST_PATH_ENABLED and (fast := _fast_intent(customer_texts)) is not None:
+        logger.info("Intent classified from keyword cues: %s", fast)
+        return fast
+
     # Step 2: Build user message
     user_message = _build_user_message(customer_texts)
 
@@ -273,18 +451,18 @@ def classify_intent(
         len(customer_texts),
     )
 
-    # Step 3: Call OpenAI API
-    client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+    # Identical prompts at temperature 0 give identical answers — reuse
+    # an earlier validated result instead of a round-trip
+    system_prompt = _system_prompt_for(customer_texts)
+    cache_key = _llm_cache.make_key("gpt-4o-mini", system_prompt, user_message)
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Intent classification cache hit: %s", cached)
+        return dict(cached)
 
+    # Step 3: Call OpenAI API
     response = chat_completions_with_retry(
-        client,
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": _SYSTEM_PROMPT},
-            {"role": "user", "content": user_message},
-        ],
-        temperature=0.0,  # Deterministic output for identical inputs
-        max_tokens=80,
+        _get_client(), **_request_body(user_message, system_prompt),
     )
 
     raw_content = response.choices[0].message.content or ""
@@ -293,6 +471,7 @@ def classify_intent(
 
     # Step 4: Parse and validate
     intent = _parse_intent_response(raw_content)
+    _llm_cache.set(cache_key, dict(intent))
 
     logger.info(
         "Intent classification complete: label=%s, confidence=%.2f, conditionality=%s",
@@ -303,3 +482,443 @@ def classify_intent(
 
     # Step 5: Return intent object
     return intent
+
+
+# ---------------------------------------------------------------------------
+# Concurrent online classification (classify_intent_async)
+# ---------------------------------------------------------------------------
+# Each call is ~0.2–1.5 s of network wait, so N in flight give ~N× the
+# throughput until the account's RPM/TPM limits bind. A sliding one-minute
+# window keeps the fan-out under both; retries and exponential back-off
+# are src.openai_retry's (MAX_RETRIES + 1 attempts).
+
+# gpt-4o-mini tier-1 limits; 0 disables the respective check
+_MAX_RPM: int = int(os.environ.get("INTENT_MAX_RPM", "500"))
+_MAX_TPM: int = int(os.environ.get("INTENT_MAX_TPM", "200000"))
+
+# After a 429 every caller holds off this long before sending again
+_RATE_LIMIT_PAUSE: float = 15.0
+
+
+class _MinuteBudget:
+    """
+    Sliding 60-second window over request and token counts.
+
+    A request is admitted when both the requests and the (estimated)
+    tokens sent in the last minute stay within budget; otherwise the
+    caller sleeps until the oldest entry leaves the window. The lock only
+    guards the bookkeeping, never an await.
+    """
+
+    def __init__(self, max_rpm: int, max_tpm: int) -> None:
+        self._max_rpm = max_rpm
+        self._max_tpm = max_tpm
+        self._lock = threading.Lock()
+        self._window: deque[tuple[float, int]] = deque()  # (sent_at, tokens)
+        self._tokens = 0
+        self._paused_until = 0.0
+
+    def _reserve(self, tokens: int) -> float | None:
+        """Admit a request (returns None) or return the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+
+            while self._window and self._window[0][0] <= now - 60.0:
+                self._tokens -= self._window.popleft()[1]
+
+            rpm_ok = self._max_rpm <= 0 or len(self._window) < self._max_rpm
+            # A single request larger than the whole budget still goes
+            # through on an empty window rather than waiting forever
+            tpm_ok = (
+                self._max_tpm <= 0
+                or not self._window
+                or self._tokens + tokens <= self._max_tpm
+            )
+            if rpm_ok and tpm_ok:
+                self._window.append((now, tokens))
+                self._tokens += tokens
+                return None
+            return self._window[0][0] + 60.0 - now
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request of *tokens* fits the budget, then record it."""
+        while (wait := self._reserve(tokens)) is not None:
+            logger.debug("Intent budget: waiting %.2fs.", wait)
+            await asyncio.sleep(wait)
+
+    def report_rate_limit(self) -> None:
+        """Signal a 429; pause every caller for _RATE_LIMIT_PAUSE seconds."""
+        with self._lock:
+            self._paused_until = time.monotonic() + _RATE_LIMIT_PAUSE
+        logger.warning(
+            "Intent budget: 429 detected — pausing requests for %.0fs.",
+            _RATE_LIMIT_PAUSE,
+        )
+
+
+_budget = _MinuteBudget(max_rpm=_MAX_RPM, max_tpm=_MAX_TPM)
+
+
+def _estimate_tokens(body: dict[str, Any]) -> int:
+    """Rough TPM cost of one request: ~4 chars per prompt token plus max_tokens."""
+    prompt_chars = sum(len(m["content"]) for m in body["messages"])
+    return prompt_chars // 4 + body["max_tokens"]
+
+
+async def classify_intent_async(
+    utterances: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Async variant of :func:`classify_intent`.
+
+    Waits on the module's INTENT_MAX_RPM / INTENT_MAX_TPM budget before
+    each request, so many concurrent callers stay under the account
+    limits. Results, cache use and errors are as in the sync function.
+    """
+    customer_texts = _filter_customer_utterances(utterances)
+
+    if not customer_texts:
+        logger.warning(
+            "No CUSTOMER utterances found — returning default unknown intent."
+        )
+        return dict(_DEFAULT_INTENT)
+
+    if FAST_PATH_ENABLED and (fast := _fast_intent(customer_texts)) is not None:
+        logger.info("Intent classified from keyword cues: %s", fast)
+        return fast
+
+    user_message = _build_user_message(customer_texts)
+    system_prompt = _system_prompt_for(customer_texts)
+    cache_key = _llm_cache.make_key("gpt-4o-mini", system_prompt, user_message)
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Intent classification cache hit: %s", cached)
+        return dict(cached)
+
+    body = _request_body(user_message, system_prompt)
+    await _budget.acquire(_estimate_tokens(body))
+    response = await async_chat_completions_with_retry(
+        get_async_openai(),
+        on_rate_limit=_budget.report_rate_limit,
+        **body,
+    )
+    raw_content = response.choices[0].message.content or ""
+
+    logger.debug("Raw intent response: %s", raw_content)
+
+    intent = _parse_intent_response(raw_content)
+    _llm_cache.set(cache_key, dict(intent))
+
+    logger.info(
+        "Intent classification complete: label=%s, confidence=%.2f, conditionality=%s",
+        intent["label"],
+        intent["confidence"],
+        intent["conditionality"],
+    )
+    return intent
+
+
+async def classify_intents_many(
+    calls: list[list[dict[str, Any]]],
+    max_concurrent: int = 32,
+) -> list[dict[str, Any]]:
+    """
+    Classify intent for many calls concurrently.
+
+    At most *max_concurrent* requests are in flight; all of them share
+    the RPM/TPM budget of :func:`classify_intent_async`.
+
+    Args:
+        calls: One Phase 4 utterance list per call.
+        max_concurrent: Upper bound on simultaneous API requests.
+
+    Returns:
+        One intent dict per call, in input order.
+
+    Raises:
+        The first call's exception, once every call has finished (results
+        that did succeed are cached, so a re-run only repeats the failures).
+    """
+    if max_concurrent < 1:
+        raise ValueError(f"max_concurrent must be >= 1, got {max_concurrent}")
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _one(utterances: list[dict[str, Any]]) -> dict[str, Any]:
+        async with semaphore:
+            return await classify_intent_async(utterances)
+
+    results = await asyncio.gather(
+        *(_one(utterances) for utterances in calls), return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results  # type: ignore[return-value]
+
+
+# ---------------------------------------------------------------------------
+# Packed classification (several calls per prompt)
+# ---------------------------------------------------------------------------
+# The system prompt is most of a single request's input tokens; packing
+# K calls into one user message pays for it once per K calls.
+
+_PACKED_SYSTEM_PROMPT: str = _SYSTEM_PROMPT + (
+    "\nPACKED INPUT:\n"
+    "- The user message may contain several numbered blocks, each starting "
+    "with a line [[N]]. Each block is the CUSTOMER speech of a separate call.\n"
+    "- Classify every block independently and return ONLY a JSON array with "
+    'one object per block: {"id": N, "label": ..., "confidence": ..., '
+    '"conditionality": ...}. This replaces the single-object output above.\n'
+)
+
+# Output tokens budgeted per packed call
+_PACKED_TOKENS_PER_CALL: int = 40
+
+
+def _build_packed_message(blocks: list[str]) -> str:
+    """Number *blocks* as ``[[1]]``, ``[[2]]``, ... in one user message."""
+    parts = [
+        "Classify each block. Return JSON array of "
+        "{id,label,confidence,conditionality}."
+    ]
+    for number, block in enumerate(blocks, start=1):
+        parts.append(f"[[{number}]]\n{block}")
+    return "\n\n".join(parts)
+
+
+def _parse_packed_response(raw: str, count: int) -> dict[int, dict[str, Any]]:
+    """
+    Map block number (1-based) to its validated intent.
+
+    Entries that are malformed, invalid or out of range are left out;
+    the caller re-classifies the missing blocks one by one.
+
+    Raises:
+        ValueError: If the reply is not a JSON array.
+    """
+    try:
+        parsed = json_loads(raw.strip())
+    except ValueError as exc:
+        raise ValueError(f"Packed intent response is not valid JSON: {raw!r}") from exc
+
+    if not isinstance(parsed, list):
+        raise ValueError(f"Expected JSON array, got {type(parsed).__name__}")
+
+    results: dict[int, dict[str, Any]] = {}
+    for entry in parsed:
+        if not isinstance(entry, dict):
+            continue
+        number = entry.get("id")
+        if not isinstance(number, int) or not 1 <= number <= count:
+            continue
+        try:
+            results[number] = _validate_one(entry)
+        except ValueError as exc:
+            logger.warning("Packed intent entry %s invalid: %s", number, exc)
+    return results
+
+
+def classify_intents_packed(
+    calls: list[list[dict[str, Any]]],
+    k: int = 20,
+) -> list[dict[str, Any]]:
+    """
+    Classify intent for many calls, *k* calls per API request.
+
+    Calls without CUSTOMER speech get the default intent and cached
+    prompts are answered locally, as in :func:`classify_intent`. Blocks
+    the model drops or answers invalidly fall back to a single
+    :func:`classify_intent` call each.
+
+    Args:
+        calls: One Phase 4 utterance list per call.
+        k: Calls packed into one request.
+
+    Returns:
+        One intent dict per call, in input order.
+
+    Raises:
+        ValueError: If a fallback single classification is invalid.
+        openai.OpenAIError: If the OpenAI API call fails.
+    """
+    if k < 1:
+        raise ValueError(f"k must be >= 1, got {k}")
+
+    results: list[dict[str, Any] | None] = [None] * len(calls)
+    pending: list[tuple[int, str, str]] = []  # (index, user message, cache key)
+
+    for index, utterances in enumerate(calls):
+        customer_texts = _filter_customer_utterances(utterances)
+        if not customer_texts:
+            results[index] = dict(_DEFAULT_INTENT)
+            continue
+        if FAST_PATH_ENABLED and (fast := _fast_intent(customer_texts)) is not None:
+            results[index] = fast
+            continue
+
+        user_message = _build_user_message(customer_texts)
+        cache_key = _llm_cache.make_key(
+            "gpt-4o-mini", _system_prompt_for(customer_texts), user_message,
+        )
+        cached = _llm_cache.get(cache_key)
+        if cached is not None:
+            results[index] = dict(cached)
+            continue
+        pending.append((index, user_message, cache_key))
+
+    for start in range(0, len(pending), k):
+        chunk = pending[start:start + k]
+        logger.info("Classifying intent for %d packed call(s).", len(chunk))
+
+        response = chat_completions_with_retry(
+            _get_client(),
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": _PACKED_SYSTEM_PROMPT},
+                {"role": "user", "content": _build_packed_message(
+                    [message for _, message, _ in chunk]
+                )},
+            ],
+            temperature=0.0,
+            max_tokens=_PACKED_TOKENS_PER_CALL * len(chunk),
+        )
+        raw_content = response.choices[0].message.content or ""
+        logger.debug("Raw packed intent response: %s", raw_content)
+
+        try:
+            packed = _parse_packed_response(raw_content, len(chunk))
+        except ValueError as exc:
+            logger.warning("Packed intent response unusable: %s", exc)
+            packed = {}
+
+        for number, (index, _, cache_key) in enumerate(chunk, start=1):
+            intent = packed.get(number)
+            if intent is None:
+                # Dropped or invalid — classify this call on its own
+                results[index] = classify_intent(calls[index])
+                continue
+            _llm_cache.set(cache_key, dict(intent))
+            results[index] = intent
+
+    return results  # type: ignore[return-value]
+
+
+# ---------------------------------------------------------------------------
+# Offline batch classification (OpenAI Batch API)
+# ---------------------------------------------------------------------------
+
+# Seconds between batches.retrieve polls
+_BATCH_POLL_SECONDS: float = float(os.environ.get("INTENT_BATCH_POLL_SECONDS", "30"))
+
+_BATCH_FAILED_STATUSES: frozenset[str] = frozenset({"failed", "expired", "cancelled"})
+
+
+def classify_intent_batch(
+    calls: list[list[dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """
+    Classify intent for many calls through the OpenAI Batch API.
+
+    Meant for offline/bulk runs: the batch completes within OpenAI's 24h
+    window at half the online price and outside the online RPM limits.
+    Calls without CUSTOMER speech get the default intent and cached
+    prompts are answered locally; only the rest are uploaded.
+
+    Args:
+        calls: One Phase 4 utterance list per call.
+
+    Returns:
+        One intent dict per call, in input order.
+
+    Raises:
+        RuntimeError: If the batch ends as failed, expired or cancelled.
+        ValueError: If any request errored or returned an invalid reply
+            (valid results are cached, so a re-run only re-sends those).
+    """
+    results: list[dict[str, Any] | None] = [None] * len(calls)
+    pending: dict[str, tuple[int, str]] = {}  # custom_id -> (index, cache key)
+    lines: list[bytes] = []
+
+    for index, utterances in enumerate(calls):
+        customer_texts = _filter_customer_utterances(utterances)
+        if not customer_texts:
+            results[index] = dict(_DEFAULT_INTENT)
+            continue
+        if FAST_PATH_ENABLED and (fast := _fast_intent(customer_texts)) is not None:
+            results[index] = fast
+            continue
+
+        user_message = _build_user_message(customer_texts)
+        system_prompt = _system_prompt_for(customer_texts)
+        cache_key = _llm_cache.make_key("gpt-4o-mini", system_prompt, user_message)
+        cached = _llm_cache.get(cache_key)
+        if cached is not None:
+            results[index] = dict(cached)
+            continue
+
+        custom_id = str(index)
+        pending[custom_id] = (index, cache_key)
+        lines.append(json_dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _request_body(user_message, system_prompt),
+        }))
+
+    if not pending:
+        return results  # type: ignore[return-value]
+
+    logger.info(
+        "Submitting intent batch: %d request(s), %d served locally.",
+        len(pending), len(calls) - len(pending),
+    )
+
+    client = _get_client()
+    input_file = client.files.create(
+        file=("intent_batch.jsonl", io.BytesIO(b"\n".join(lines))),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+
+    while batch.status != "completed":
+        if batch.status in _BATCH_FAILED_STATUSES:
+            raise RuntimeError(f"Intent batch {batch.id} ended as {batch.status}")
+        time.sleep(_BATCH_POLL_SECONDS)
+        batch = client.batches.retrieve(batch.id)
+
+    failed: list[str] = []
+    if batch.output_file_id:
+        output = client.files.content(batch.output_file_id).text
+        for line in filter(None, output.splitlines()):
+            record = json_loads(line)
+            index, cache_key = pending.pop(record["custom_id"])
+            response = record.get("response") or {}
+            try:
+                if record.get("error") or response.get("status_code") != 200:
+                    raise ValueError(f"request failed: {record.get('error')}")
+                raw = response["body"]["choices"][0]["message"]["content"] or ""
+                intent = _parse_intent_response(raw)
+            except (ValueError, KeyError, IndexError, TypeError) as exc:
+                logger.warning("Intent batch item %s failed: %s", record["custom_id"], exc)
+                failed.append(record["custom_id"])
+                continue
+            _llm_cache.set(cache_key, dict(intent))
+            results[index] = intent
+
+    # Requests that errored before running only appear in the error file
+    failed.extend(pending)
+    if failed:
+        raise ValueError(
+            f"Intent batch {batch.id}: {len(failed)} request(s) failed "
+            f"(custom_ids {sorted(failed, key=int)[:10]})"
+        )
+
+    logger.info("Intent batch %s complete: %d call(s).", batch.id, len(calls))
+    return results  # type: ignore[return-value]
@@ -9,6 +9,8 @@ Responsibility:
     - Normalize common spoken contractions (gonna → going to, etc.)
     - Normalize whitespace (collapse runs, strip leading/trailing)
     - Preserve speaker labels, timing information, and original intent
+    - Optionally spread very long transcripts over worker processes
+      (src.nlp._procpool)
 
 Per RULES.md §6 — this is pipeline step 3 (text cleanup & normalization).
 
@@ -25,6 +27,9 @@ import logging
 import re
 from typing import Any
 
+from src.nlp._procpool import map_texts
+from src.nlp._regex import compile_ci, compile_lower
+
 logger = logging.getLogger("voiceops.nlp.normalizer")
 
 
@@ -51,13 +56,6 @@ _FILLER_WORDS: list[str] = [
     "uh huh",
 ]
 
-# Build a single compiled regex that matches any filler as a whole word.
-# (?i) for case-insensitive; \b for word boundaries.
-_FILLER_PATTERN: re.Pattern[str] = re.compile(
-    r"\b(?:" + "|".join(re.escape(f) for f in _FILLER_WORDS) + r")\b",
-    re.IGNORECASE,
-)
-
 
 # ---------------------------------------------------------------------------
 # Spoken-form → written-form normalization map
@@ -84,16 +82,24 @@ _SPOKEN_FORMS: dict[str, str] = {
     "outta": "out of",
 }
 
-# Build pattern:  \b(gonna|gotta|...)\b  — case-insensitive
-_SPOKEN_FORM_PATTERN: re.Pattern[str] = re.compile(
-    r"\b(" + "|".join(re.escape(k) for k in _SPOKEN_FORMS) + r")\b",
-    re.IGNORECASE,
+# Fillers and spoken forms in one whole-word, case-insensitive alternation,
+# so normalize_text scans the text once. No filler can match where a
+# spoken form starts, so this equals removing fillers first and then
+# replacing spoken forms. Compiled with RE2 when installed (_regex.py).
+_NORM_SOURCE: str = (
+    r"\b(?:" + "|".join(re.escape(f) for f in _FILLER_WORDS)
+    + r"|(" + "|".join(re.escape(k) for k in _SPOKEN_FORMS) + r"))\b"
 )
+# Matched against text.lower() (see normalize_text); the IGNORECASE
+# variant is only for the rare text whose lower-casing changes length.
+_NORM_PATTERN: Any = compile_lower(_NORM_SOURCE)
+_NORM_PATTERN_CI: Any = compile_ci(_NORM_SOURCE)
 
 
-def _replace_spoken_form(match: re.Match[str]) -> str:
-    """Return the written form for a matched spoken variant."""
-    return _SPOKEN_FORMS[match.group(0).lower()]
+def _replace_match(match: re.Match[str]) -> str:
+    """Drop a filler; return the written form for a spoken variant."""
+    spoken = match.group(1)
+    return "" if spoken is None else _SPOKEN_FORMS[spoken.lower()]
 
 
 # ---------------------------------------------------------------------------
@@ -119,16 +125,29 @@ def normalize_text(text: str) -> str:
     if not text or not text.strip():
         return text
 
-    # Step 1: Remove fillers
-    result = _FILLER_PATTERN.sub("", text)
-
-    # Step 2: Normalize spoken forms
-    result = _SPOKEN_FORM_PATTERN.sub(_replace_spoken_form, result)
-
-    # Step 3: Collapse whitespace and strip
-    result = re.sub(r"\s+", " ", result).strip()
-
-    return result
+    # Steps 1–2: Remove fillers and normalize spoken forms (one pass).
+    # Matching runs on the lower-cased text, case-sensitively; the kept
+    # stretches are copied from the original so its casing survives.
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        parts: list[str] = []
+        pos = 0
+        for match in _NORM_PATTERN.finditer(lowered):
+            start, end = match.span()
+            parts.append(text[pos:start])
+            spoken = match.group(1)
+            if spoken is not None:
+                parts.append(_SPOKEN_FORMS[spoken])
+            pos = end
+        parts.append(text[pos:])
+        result = "".join(parts)
+    else:
+        # Offsets would not line up (e.g. "İ" lower-cases to two chars)
+        result = _NORM_PATTERN_CI.sub(_replace_match, text)
+
+    # Step 3: Collapse whitespace and strip — str.split() splits on the
+    # same characters as \s and needs no regex pass
+    return " ".join(result.split())
 
 
 # ---------------------------------------------------------------------------
@@ -169,17 +188,18 @@ def normalize_utterances(
         logger.warning("Received empty utterance list — nothing to normalize.")
         return []
 
-    normalized: list[dict[str, Any]] = []
-    for utt in utterances:
-        # Bridge Phase 3 output format: choose the right text field
-        raw_text = _extract_text(utt)
+    # Bridge Phase 3 output format: choose the right text field
+    texts = map_texts(normalize_text, [_extract_text(utt) for utt in utterances])
 
-        normalized.append({
+    normalized: list[dict[str, Any]] = [
+        {
             "speaker": utt["speaker"],
-            "text": normalize_text(raw_text),
+            "text": text,
             "start_time": utt["start_time"],
             "end_time": utt["end_time"],
-        })
+        }
+        for utt, text in zip(utterances, texts)
+    ]
 
     logger.info(
         "Text normalization complete for %d utterances.", len(normalized)
@@ -29,10 +29,12 @@ This module does NOT:
 """
 
 import logging
-import re
 from enum import Enum
 from typing import Any
 
+from src.nlp._regex import compile_lower
+from src.nlp._utt_utils import filter_customer_texts
+
 logger = logging.getLogger("voiceops.nlp.obligation")
 
 
@@ -111,16 +113,12 @@ _CONDITIONAL_MARKERS: list[str] = [
     r"\bcondition\b",
 ]
 
-# Compile patterns for efficiency
-_STRONG_PATTERN: re.Pattern[str] = re.compile(
-    "|".join(_STRONG_MARKERS), re.IGNORECASE
-)
-_WEAK_PATTERN: re.Pattern[str] = re.compile(
-    "|".join(_WEAK_MARKERS), re.IGNORECASE
-)
-_CONDITIONAL_PATTERN: re.Pattern[str] = re.compile(
-    "|".join(_CONDITIONAL_MARKERS), re.IGNORECASE
-)
+# Compile patterns for efficiency (RE2 when installed, see _regex.py).
+# They are lower-cased and case-sensitive: text is lower-cased once before
+# matching, which is much faster than IGNORECASE case-folding.
+_STRONG_PATTERN: Any = compile_lower("|".join(_STRONG_MARKERS))
+_WEAK_PATTERN: Any = compile_lower("|".join(_WEAK_MARKERS))
+_CONDITIONAL_PATTERN: Any = compile_lower("|".join(_CONDITIONAL_MARKERS))
 
 
 # ---------------------------------------------------------------------------
@@ -143,69 +141,78 @@ _COMMITMENT_INTENTS: set[str] = {
 }
 
 
-def _count_marker_matches(text: str, pattern: re.Pattern[str]) -> int:
-    """Count the number of linguistic marker matches in text."""
-    return len(pattern.findall(text))
+def _count_marker_matches(text: str, pattern: Any) -> int:
+    """Count the number of linguistic marker matches in text (any case)."""
+    return len(pattern.findall(text.lower()))
 
 
 def _derive_from_commitment_intent(
     intent_label: str,
     conditionality: str,
-    customer_text: str,
+    utterances: list[dict[str, Any]],
+    customer_texts: list[str] | None = None,
 ) -> str:
     """
     Derive obligation strength for commitment-bearing intents.
 
     Logic:
         1. High conditionality → "conditional" (regardless of markers)
-        2. repayment_promise + low conditionality + strong markers → "strong"
-        3. repayment_promise + low conditionality (no strong markers) → "weak"
-        4. repayment_promise + medium conditionality → check markers:
+        2. repayment_delay + low conditionality → "weak"
+        3. repayment_delay + medium conditionality → "conditional"
+        4. repayment_promise + low conditionality + strong markers → "strong"
+        5. repayment_promise + low conditionality (no strong markers) → "weak"
+        6. repayment_promise + medium conditionality → check markers:
            - conditional markers present → "conditional"
            - strong markers > weak markers → "weak"
            - else → "conditional"
-        5. repayment_delay + low conditionality → "weak"
-        6. repayment_delay + medium conditionality → "conditional"
-        7. repayment_delay + high conditionality → "conditional"
 
     Args:
         intent_label: The classified intent (must be a commitment intent).
         conditionality: The conditionality level (low/medium/high).
-        customer_text: Concatenated customer utterances for marker analysis.
+        utterances: Phase 4 utterances for marker analysis.
+        customer_texts: Their CUSTOMER texts, if already extracted.
 
     Returns:
         Obligation strength value as string.
     """
-    strong_count = _count_marker_matches(customer_text, _STRONG_PATTERN)
-    weak_count = _count_marker_matches(customer_text, _WEAK_PATTERN)
-    conditional_count = _count_marker_matches(customer_text, _CONDITIONAL_PATTERN)
+    # Only cases 4–6 read the text: CUSTOMER texts are filtered and joined
+    # after the marker-free cases have returned, and presence checks stop
+    # at the first match. (The categories overlap — e.g. "tomorrow I will"
+    # / "I will try" — so one combined alternation would under-count them.)
 
     # High conditionality always maps to "conditional"
     if conditionality == "high":
         return ObligationStrength.CONDITIONAL.value
 
-    if intent_label == "repayment_promise":
+    if intent_label == "repayment_delay":
+        if conditionality == "low":
+            # Acknowledges debt, requests time — weak commitment
+            return ObligationStrength.WEAK.value
+
+        # medium conditionality for delay → conditional
+        return ObligationStrength.CONDITIONAL.value
+
+    if intent_label == "repayment_promise" and conditionality in ("low", "medium"):
+        if customer_texts is None:
+            customer_texts = filter_customer_texts(utterances)
+        # Space-joined: the conditional markers' ".*" must be able to span
+        # utterances (a "\n" join, as in the intent prompt, would stop it)
+        customer_text = " ".join(customer_texts).lower()
+
         if conditionality == "low":
             # Direct promise with low conditionality
-            if strong_count > 0:
+            if _STRONG_PATTERN.search(customer_text):
                 return ObligationStrength.STRONG.value
             # No strong markers but still a direct promise
             return ObligationStrength.WEAK.value
 
-        if conditionality == "medium":
-            # Medium conditionality — markers determine outcome
-            if conditional_count > 0:
-                return ObligationStrength.CONDITIONAL.value
-            if strong_count > weak_count:
-                return ObligationStrength.WEAK.value
+        # Medium conditionality — markers determine outcome
+        if _CONDITIONAL_PATTERN.search(customer_text):
             return ObligationStrength.CONDITIONAL.value
-
-    if intent_label == "repayment_delay":
-        if conditionality == "low":
-            # Acknowledges debt, requests time — weak commitment
+        strong_count = len(_STRONG_PATTERN.findall(customer_text))
+        weak_count = len(_WEAK_PATTERN.findall(customer_text))
+        if strong_count > weak_count:
             return ObligationStrength.WEAK.value
-
-        # medium conditionality for delay → conditional
         return ObligationStrength.CONDITIONAL.value
 
     # Fallback for any unhandled combination (should not reach here)
@@ -220,6 +227,7 @@ def _derive_from_commitment_intent(
 def derive_obligation_strength(
     intent_result: dict[str, Any],
     utterances: list[dict[str, Any]],
+    customer_texts: list[str] | None = None,
 ) -> str:
     """
     Derive obligation strength deterministically from intent classification
@@ -240,6 +248,11 @@ def derive_obligation_strength(
             Phase 4 output — list of utterance dicts (normalized, PII-redacted)
             with keys: speaker, text, start_time, end_time.
 
+        customer_texts:
+            CUSTOMER texts already extracted from *utterances* (e.g. by a
+            pipeline that also passes them to classify_intent); filtered
+            here when omitted.
+
     Returns:
         Obligation strength as string:
             "strong" | "weak" | "conditional" | "none"
@@ -257,18 +270,8 @@ def derive_obligation_strength(
 
     # Commitment intents — analyze customer text for fine-grained strength
     if intent_label in _COMMITMENT_INTENTS:
-        # Extract and concatenate customer text
-        customer_texts: list[str] = []
-        for utt in utterances:
-            if utt.get("speaker", "").upper() == "CUSTOMER":
-                text = utt.get("text", "").strip()
-                if text:
-                    customer_texts.append(text)
-
-        combined_text = " ".join(customer_texts)
-
         strength = _derive_from_commitment_intent(
-            intent_label, conditionality, combined_text
+            intent_label, conditionality, utterances, customer_texts
         )
 
         logger.info(
@@ -7,6 +7,8 @@ Responsibility:
     - Detect and redact personally identifiable information (PII) from text
     - Replace detected PII with safe tokens per RULES.md §7
     - Ensure no raw PII appears in any output
+    - Optionally spread very long transcripts over worker processes
+      (src.nlp._procpool)
 
 Per RULES.md §7 — PII redaction is MANDATORY before any storage, embedding,
 or RAG use.
@@ -18,6 +20,8 @@ Redaction tokens:
     <OTP>           — One-time passwords / verification codes
     <PHONE_NUMBER>  — Phone numbers
     <EMAIL>         — Email addresses
+    <REDACTED_NUMBER> — Card-length numbers failing the Luhn check
+                        (only with PII_CARD_LUHN=1)
 
 This module does NOT:
     - Perform text normalization (handled by normalizer.py)
@@ -29,9 +33,13 @@ This module does NOT:
 """
 
 import logging
+import os
 import re
 from typing import Any
 
+from src.nlp._procpool import map_texts
+from src.nlp._regex import compile_ci, compile_cs
+
 logger = logging.getLogger("voiceops.nlp.pii_redactor")
 
 
@@ -39,31 +47,41 @@ logger = logging.getLogger("voiceops.nlp.pii_redactor")
 # PII detection patterns
 # ---------------------------------------------------------------------------
 # Patterns are applied in a specific order: more specific patterns first to
-# avoid partial matches by broader patterns.
+# avoid partial matches by broader patterns. They are compiled with RE2
+# when it is installed (see src.nlp._regex).
 
 # Email — standard email regex; applied first since it contains digits that
 # could otherwise match phone/OTP patterns.
-_EMAIL_PATTERN: re.Pattern[str] = re.compile(
+_EMAIL_PATTERN: Any = compile_cs(
     r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}",
 )
 
 # Credit / Debit card numbers:
 #   - 13–19 digits, optionally separated by spaces or hyphens in groups
 #   - Common formats: 4 groups of 4, or variations
-_CREDIT_CARD_PATTERN: re.Pattern[str] = re.compile(
+_CREDIT_CARD_PATTERN: Any = compile_cs(
     r"\b"
     r"(?:\d[\s\-]?){12,18}\d"  # 13–19 digits with optional separators
     r"\b",
 )
 
+# Opt-in (PII_CARD_LUHN=1): only card-pattern matches that pass the Luhn
+# check are labelled <CREDIT_CARD>; the rest (misheard card numbers, long
+# account numbers spoken without context) become <REDACTED_NUMBER>, so no
+# digits are ever left in clear text.
+LUHN_CARDS_ENABLED: bool = os.environ.get("PII_CARD_LUHN", "0") == "1"
+
+# Luhn value of a doubled digit: 2d, minus 9 when that has two digits
+_LUHN_DOUBLED: tuple[int, ...] = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
 # Aadhaar number: 12 digits, optionally separated by spaces or hyphens
 # in groups of 4 (e.g., 1234 5678 9012)
-_AADHAAR_PATTERN: re.Pattern[str] = re.compile(
+_AADHAAR_PATTERN: Any = compile_cs(
     r"\b\d{4}[\s\-]?\d{4}[\s\-]?\d{4}\b",
 )
 
 # SSN: 9 digits in format XXX-XX-XXXX or XXX XX XXXX
-_SSN_PATTERN: re.Pattern[str] = re.compile(
+_SSN_PATTERN: Any = compile_cs(
     r"\b\d{3}[\s\-]\d{2}[\s\-]\d{4}\b",
 )
 
@@ -71,46 +89,107 @@ _SSN_PATTERN: re.Pattern[str] = re.compile(
 #   - International: +91 98765 43210, +1-555-123-4567
 #   - Domestic: (555) 123-4567, 555-123-4567, 98765 43210
 #   - 10-digit Indian numbers: 10 consecutive digits starting with 6-9
-_PHONE_PATTERNS: list[re.Pattern[str]] = [
+_PHONE_PATTERNS: list[Any] = [
     # International format with country code
-    re.compile(
+    compile_cs(
         r"\+\d{1,3}[\s\-]?\(?\d{1,5}\)?[\s\-]?\d{1,5}[\s\-]?\d{1,5}"
     ),
     # Parenthesized area code: (555) 123-4567
-    re.compile(
+    compile_cs(
         r"\(\d{3,5}\)[\s\-]?\d{3,5}[\s\-]?\d{3,5}"
     ),
     # 10-digit Indian mobile: starts with 6-9
-    re.compile(
+    compile_cs(
         r"\b[6-9]\d{4}[\s\-]?\d{5}\b"
     ),
     # Hyphenated / spaced 10-digit: 555-123-4567
-    re.compile(
+    compile_cs(
         r"\b\d{3}[\s\-]\d{3}[\s\-]\d{4}\b"
     ),
 ]
 
 # Bank account numbers: 9–18 digits (most Indian bank accounts are 9–18 digits)
-# Context-aware: look for keywords like "account", "a/c", "acct" nearby
-_BANK_ACCOUNT_CONTEXT_PATTERN: re.Pattern[str] = re.compile(
-    r"(?:account|a/c|acct|acc)[\s\-.:;#]*(?:number|no|num|#)?[\s\-.:;#]*"
-    r"(?:is|was|:)?\s*"
-    r"(\d[\d\s\-]{7,17}\d)",
-    re.IGNORECASE,
+# Context-aware: look for keywords like "account", "a/c", "acct" nearby.
+# The context patterns capture the context words (group 1), which the
+# replacement keeps; only the digits are redacted. (A callback returning
+# the group is faster than an r"\1<TOKEN>" template, which CPython < 3.12
+# expands in Python.)
+_BANK_ACCOUNT_CONTEXT_PATTERN: Any = compile_ci(
+    r"((?:account|a/c|acct|acc)[\s\-.:;#]*(?:number|no|num|#)?[\s\-.:;#]*"
+    r"(?:is|was|:)?\s*)"
+    r"\d[\d\s\-]{7,17}\d",
 )
 
 # OTP: 4-6 digit code with contextual keywords
-_OTP_CONTEXT_PATTERN: re.Pattern[str] = re.compile(
-    r"(?:otp|one[\s\-]?time[\s\-]?password|verification[\s\-]?code|"
-    r"pin|code|cvv)[\s\-.:;#]*(?:is|was|:)?\s*(\d{4,6})\b",
-    re.IGNORECASE,
+_OTP_CONTEXT_PATTERN: Any = compile_ci(
+    r"((?:otp|one[\s\-]?time[\s\-]?password|verification[\s\-]?code|"
+    r"pin|code|cvv)[\s\-.:;#]*(?:is|was|:)?\s*)\d{4,6}\b",
 )
 
 # Reverse OTP: digit first, then context keyword
-_OTP_REVERSE_PATTERN: re.Pattern[str] = re.compile(
-    r"\b(\d{4,6})\s+(?:is|was)\s+(?:the\s+)?(?:otp|one[\s\-]?time[\s\-]?password|"
-    r"verification[\s\-]?code|pin|code)\b",
-    re.IGNORECASE,
+_OTP_REVERSE_PATTERN: Any = compile_ci(
+    r"\b\d{4,6}(\s+(?:is|was)\s+(?:the\s+)?(?:otp|one[\s\-]?time[\s\-]?password|"
+    r"verification[\s\-]?code|pin|code)\b)",
+)
+
+# Without "@" (email), every pattern above needs at least 4 digits (the
+# shortest is an OTP or a "+1 2 3 4" phone number) except the bank-account
+# pattern, which needs 2 ("a/c 1 - - 5"). Text with fewer than 2 digits
+# cannot contain PII and is returned as is; text with 2 or 3 only runs
+# the bank-account pass, the only one that can match.
+#
+# The passes are not fused into one alternation: each one re-scans the
+# previous one's output (a leftover digit run after a token is matched
+# again), and a single leftmost-first scan would let a later pattern that
+# starts earlier win. Both would leave PII unredacted.
+_MIN_PII_DIGITS: int = 4
+_MIN_BANK_ACCOUNT_DIGITS: int = 2
+_ASCII_DIGITS: bytes = b"0123456789"
+
+
+def _ascii_digit_count(text: str) -> int | None:
+    """
+    Cheap probe: the number of digits in *text*, or None when every pass
+    must run (an "@", or non-ASCII text — re's \d also matches non-ASCII
+    digits).
+    """
+    if "@" in text or not text.isascii():
+        return None
+    raw = text.encode("ascii")
+    return len(raw) - len(raw.translate(None, _ASCII_DIGITS))
+
+
+# ASCII-only text (almost every English utterance) is matched with re.ASCII
+# copies of the patterns, which skip Unicode class lookups and run ~1.5x
+# faster. On ASCII text they match identically except that \s no longer
+# matches the \x1c–\x1f separator controls, so text containing one of
+# those keeps the Unicode patterns. RE2 patterns are ASCII-classed already
+# and are shared as is.
+_ASCII_SEPARATORS_PATTERN: re.Pattern[str] = re.compile("[\x1c-\x1f]")
+
+
+def _ascii_variant(pattern: Any) -> Any:
+    """re.ASCII copy of an ``re`` *pattern*; other patterns are returned as is."""
+    if isinstance(pattern, re.Pattern):
+        flags = (pattern.flags & re.IGNORECASE) | re.ASCII
+        return re.compile(pattern.pattern, flags)
+    return pattern
+
+
+# (email, otp, otp_reverse, bank_account, card, ssn, aadhaar, phones)
+_UNICODE_PATTERNS: tuple[Any, ...] = (
+    _EMAIL_PATTERN,
+    _OTP_CONTEXT_PATTERN,
+    _OTP_REVERSE_PATTERN,
+    _BANK_ACCOUNT_CONTEXT_PATTERN,
+    _CREDIT_CARD_PATTERN,
+    _SSN_PATTERN,
+    _AADHAAR_PATTERN,
+    _PHONE_PATTERNS,
+)
+_ASCII_PATTERNS: tuple[Any, ...] = (
+    *map(_ascii_variant, _UNICODE_PATTERNS[:-1]),
+    [_ascii_variant(pattern) for pattern in _PHONE_PATTERNS],
 )
 
 
@@ -119,6 +198,26 @@ _OTP_REVERSE_PATTERN: re.Pattern[str] = re.compile(
 # ---------------------------------------------------------------------------
 
 
+def _bank_account_token(m: re.Match[str]) -> str:
+    """Bank-account callback: keep the context words, redact the digits."""
+    return m.group(1) + "<BANK_ACCOUNT>"
+
+
+def _luhn_ok(digits: str) -> bool:
+    """True if the decimal string *digits* passes the Luhn checksum."""
+    total = 0
+    for i, ch in enumerate(reversed(digits)):
+        digit = int(ch)
+        total += _LUHN_DOUBLED[digit] if i & 1 else digit
+    return total % 10 == 0
+
+
+def _redact_card(m: re.Match[str]) -> str:
+    """Card-pattern callback: label Luhn-valid numbers as cards."""
+    digits = "".join(ch for ch in m.group(0) if ch.isdecimal())
+    return "<CREDIT_CARD>" if _luhn_ok(digits) else "<REDACTED_NUMBER>"
+
+
 def redact_pii(text: str) -> str:
     """
     Detect and redact PII from a text string.
@@ -142,36 +241,42 @@ def redact_pii(text: str) -> str:
     if not text or not text.strip():
         return text
 
-    # 1. Emails
-    result = _EMAIL_PATTERN.sub("<EMAIL>", text)
+    digits = _ascii_digit_count(text)
+    if digits is not None and digits < _MIN_PII_DIGITS:
+        if digits < _MIN_BANK_ACCOUNT_DIGITS:
+            return text
+        return _BANK_ACCOUNT_CONTEXT_PATTERN.sub(_bank_account_token, text)
 
-    # 2. OTPs (context-aware — must run before generic digit patterns)
-    result = _OTP_CONTEXT_PATTERN.sub(
-        lambda m: m.group(0)[: m.start(1) - m.start(0)] + "<OTP>",
-        result,
+    ascii_safe = (
+        text.isascii() and _ASCII_SEPARATORS_PATTERN.search(text) is None
     )
-    result = _OTP_REVERSE_PATTERN.sub(
-        lambda m: "<OTP>" + m.group(0)[m.end(1) - m.start(0) :],
-        result,
+    email, otp, otp_reverse, bank_account, card, ssn, aadhaar, phones = (
+        _ASCII_PATTERNS if ascii_safe else _UNICODE_PATTERNS
     )
 
+    # 1. Emails
+    result = email.sub("<EMAIL>", text)
+
+    # 2. OTPs (context-aware — must run before generic digit patterns)
+    result = otp.sub(lambda m: m.group(1) + "<OTP>", result)
+    result = otp_reverse.sub(lambda m: "<OTP>" + m.group(1), result)
+
     # 3. Bank account numbers (context-dependent — before generic digit patterns)
-    result = _BANK_ACCOUNT_CONTEXT_PATTERN.sub(
-        lambda m: m.group(0)[: m.start(1) - m.start(0)] + "<BANK_ACCOUNT>",
-        result,
-    )
+    result = bank_account.sub(_bank_account_token, result)
 
     # 4. Credit / debit card numbers (13–19 digits)
-    result = _CREDIT_CARD_PATTERN.sub("<CREDIT_CARD>", result)
+    result = card.sub(
+        _redact_card if LUHN_CARDS_ENABLED else "<CREDIT_CARD>", result,
+    )
 
     # 5. SSN (XXX-XX-XXXX)
-    result = _SSN_PATTERN.sub("<GOVT_ID>", result)
+    result = ssn.sub("<GOVT_ID>", result)
 
     # 6. Aadhaar (12 digits in groups of 4)
-    result = _AADHAAR_PATTERN.sub("<GOVT_ID>", result)
+    result = aadhaar.sub("<GOVT_ID>", result)
 
     # 7. Phone numbers (multiple patterns, applied sequentially)
-    for pattern in _PHONE_PATTERNS:
+    for pattern in phones:
         result = pattern.sub("<PHONE_NUMBER>", result)
 
     return result
@@ -202,14 +307,17 @@ def redact_utterances(
         logger.warning("Received empty utterance list — nothing to redact.")
         return []
 
-    redacted: list[dict[str, Any]] = []
-    for utt in utterances:
-        redacted.append({
+    texts = map_texts(redact_pii, [utt["text"] for utt in utterances])
+
+    redacted: list[dict[str, Any]] = [
+        {
             "speaker": utt["speaker"],
-            "text": redact_pii(utt["text"]),
+            "text": text,
             "start_time": utt["start_time"],
             "end_time": utt["end_time"],
-        })
+        }
+        for utt, text in zip(utterances, texts)
+    ]
 
     logger.info(
         "PII redaction complete for %d utterances.", len(redacted)
@@ -30,12 +30,15 @@ This module does NOT:
     - Store data or call RAG
 """
 
-import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from src.json_codec import JSONDecodeError, loads as json_loads
 from src.openai_retry import chat_completions_with_retry
+from src.openai_transport import get_sync_client
 
 logger = logging.getLogger("voiceops.nlp.role_splitter")
 
@@ -49,6 +52,12 @@ VALID_SPEAKERS = {"AGENT", "CUSTOMER"}
 # to avoid token limits. Larger conversations are batched.
 _MAX_BATCH_SIZE = 40
 
+# Batches are independent requests, so long transcripts issue up to this
+# many at once over the shared connection pool instead of one by one.
+_MAX_CONCURRENT_BATCHES: int = int(
+    os.environ.get("ROLE_SPLITTER_CONCURRENCY", "8")
+)
+
 
 # ---------------------------------------------------------------------------
 # OpenAI prompt — semantic role attribution
@@ -152,11 +161,18 @@ def attribute_roles(
 
     texts = [seg["text"].strip() for seg in english_segments]
 
-    # Process in batches if needed
+    # Process in batches if needed — concurrently, results in batch order
+    batches = [
+        texts[batch_start : batch_start + _MAX_BATCH_SIZE]
+        for batch_start in range(0, len(texts), _MAX_BATCH_SIZE)
+    ]
+    if len(batches) == 1 or _MAX_CONCURRENT_BATCHES <= 1:
+        batch_results = map(_attribute_batch, batches)
+    else:
+        batch_results = _get_pool().map(_attribute_batch, batches)
+
     all_results: list[dict[str, Any]] = []
-    for batch_start in range(0, len(texts), _MAX_BATCH_SIZE):
-        batch = texts[batch_start : batch_start + _MAX_BATCH_SIZE]
-        batch_result = _attribute_batch(batch)
+    for batch_result in batch_results:
         all_results.extend(batch_result)
 
     logger.info(
@@ -166,6 +182,47 @@ def attribute_roles(
     return all_results
 
 
+# ---------------------------------------------------------------------------
+# OpenAI client and batch pool (lazy-loaded singletons)
+# ---------------------------------------------------------------------------
+
+_client: Any = None
+_client_lock = threading.Lock()
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_client() -> Any:
+    """Lazily create the shared OpenAI client (thread-safe)."""
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from openai import OpenAI
+
+                _client = OpenAI(
+                    api_key=os.environ.get("OPENAI_API_KEY"),
+                    http_client=get_sync_client(),
+                )
+    return _client
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Lazily create the batch thread pool (thread-safe)."""
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(
+                    max_workers=_MAX_CONCURRENT_BATCHES,
+                    thread_name_prefix="voiceops-roles",
+                )
+    return _pool
+
+
 # ---------------------------------------------------------------------------
 # OpenAI role attribution
 # ---------------------------------------------------------------------------
@@ -194,9 +251,7 @@ def _attribute_batch(texts: list[str]) -> list[dict[str, Any]]:
         ]
 
     try:
-        from openai import OpenAI
-
-        client = OpenAI(api_key=api_key)
+        client = _get_client()
 
         # Build numbered utterance list for the prompt
         numbered_lines = "\n".join(
@@ -275,8 +330,8 @@ def _parse_role_response(
     cleaned = cleaned.strip()
 
     try:
-        parsed = json.loads(cleaned)
-    except json.JSONDecodeError as exc:
+        parsed = json_loads(cleaned)
+    except JSONDecodeError as exc:
         logger.warning("Failed to parse role attribution JSON: %s", exc)
         return []
 
@@ -290,6 +345,9 @@ def _parse_role_response(
             continue
 
         speaker = item.get("speaker", "CUSTOMER")
+        if isinstance(speaker, str):
+            # Normalized once here so downstream filters compare exactly
+            speaker = speaker.strip().upper()
         if speaker not in VALID_SPEAKERS:
             # Default to CUSTOMER if invalid label returned
             speaker = "CUSTOMER"
@@ -153,6 +153,8 @@ def _finalize_output(
 
     for utt in structured:
         speaker = utt.get("speaker", "CUSTOMER")
+        if isinstance(speaker, str):
+            speaker = speaker.strip().upper()
         if speaker not in valid_speakers:
             speaker = "CUSTOMER"
 
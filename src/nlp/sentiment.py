@@ -32,6 +32,7 @@ from typing import Any
 
 from openai import OpenAI
 
+from src.nlp._utt_utils import filter_customer_texts as _filter_customer_utterances
 from src.openai_retry import chat_completions_with_retry
 
 logger = logging.getLogger("voiceops.nlp.sentiment")
@@ -92,28 +93,6 @@ _SYSTEM_PROMPT: str = (
 # ---------------------------------------------------------------------------
 
 
-def _filter_customer_utterances(
-    utterances: list[dict[str, Any]],
-) -> list[str]:
-    """
-    Extract text from CUSTOMER utterances only.
-
-    Args:
-        utterances: Phase 4 output — list of utterance dicts with keys:
-            speaker, text, start_time, end_time.
-
-    Returns:
-        List of customer text strings (non-empty only).
-    """
-    customer_texts: list[str] = []
-    for utt in utterances:
-        if utt.get("speaker", "").upper() == "CUSTOMER":
-            text = utt.get("text", "").strip()
-            if text:
-                customer_texts.append(text)
-    return customer_texts
-
-
 def _build_user_message(customer_texts: list[str]) -> str:
     """
     Build the user message containing all CUSTOMER speech for analysis.
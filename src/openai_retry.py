@@ -19,15 +19,19 @@ Usage in any phase module::
         max_tokens=80,
     )
 
+``async_chat_completions_with_retry`` is the same loop for an
+``openai.AsyncOpenAI`` client, backing off with ``asyncio.sleep``.
+
 This module does NOT:
     - Create or manage OpenAI client instances
     - Change any analytical behaviour of the pipeline
     - Store data or generate identifiers
 """
 
+import asyncio
 import logging
 import time
-from typing import Any
+from typing import Any, Callable
 
 logger = logging.getLogger("voiceops.openai_retry")
 
@@ -70,6 +74,14 @@ def _is_retryable(exc: Exception) -> bool:
     return False
 
 
+def _is_rate_limit(exc: Exception) -> bool:
+    """Return True if the exception is an HTTP 429."""
+    return (
+        type(exc).__name__ == "RateLimitError"
+        or getattr(exc, "status_code", None) == 429
+    )
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -77,6 +89,9 @@ def _is_retryable(exc: Exception) -> bool:
 
 def chat_completions_with_retry(
     client: Any,
+    *,
+    on_rate_limit: Callable[[], None] | None = None,
+    on_success: Callable[[], None] | None = None,
     **kwargs: Any,
 ) -> Any:
     """
@@ -88,6 +103,9 @@ def chat_completions_with_retry(
 
     Args:
         client:  An instantiated ``openai.OpenAI`` client.
+        on_rate_limit: Called on every 429 seen, including ones that are
+                 retried, so a caller's limiter adapts during back-off.
+        on_success: Called once when an attempt succeeds.
         **kwargs: Passed directly to ``client.chat.completions.create()``.
 
     Returns:
@@ -96,14 +114,36 @@ def chat_completions_with_retry(
     Raises:
         The last exception if all retries are exhausted.
     """
+    return call_with_retry(
+        lambda: client.chat.completions.create(**kwargs),
+        on_rate_limit=on_rate_limit,
+        on_success=on_success,
+    )
+
+
+def call_with_retry(
+    fn: Callable[[], Any],
+    *,
+    on_rate_limit: Callable[[], None] | None = None,
+    on_success: Callable[[], None] | None = None,
+) -> Any:
+    """
+    Call ``fn()`` with the same retry policy as
+    :func:`chat_completions_with_retry`.
+
+    For request functions other than the SDK's (e.g. a raw HTTP POST);
+    their exceptions are classified by type name and ``status_code``.
+    """
     last_exc: Exception | None = None
     delay = BASE_DELAY
 
     for attempt in range(MAX_RETRIES + 1):
         try:
-            return client.chat.completions.create(**kwargs)
+            response = fn()
         except Exception as exc:
             last_exc = exc
+            if on_rate_limit is not None and _is_rate_limit(exc):
+                on_rate_limit()
 
             if not _is_retryable(exc):
                 logger.warning(
@@ -126,6 +166,72 @@ def chat_completions_with_retry(
                     MAX_RETRIES + 1,
                     exc,
                 )
+        else:
+            if on_success is not None:
+                on_success()
+            return response
+
+    # All retries exhausted
+    raise last_exc  # type: ignore[misc]
+
+
+async def async_chat_completions_with_retry(
+    client: Any,
+    *,
+    on_rate_limit: Callable[[], None] | None = None,
+    on_success: Callable[[], None] | None = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Async counterpart of :func:`chat_completions_with_retry`.
+
+    Args:
+        client:  An instantiated ``openai.AsyncOpenAI`` client.
+        on_rate_limit, on_success: As for the sync function.
+        **kwargs: Passed directly to ``client.chat.completions.create()``.
+
+    Returns:
+        The OpenAI ChatCompletion response object.
+
+    Raises:
+        The last exception if all retries are exhausted.
+    """
+    last_exc: Exception | None = None
+    delay = BASE_DELAY
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = await client.chat.completions.create(**kwargs)
+        except Exception as exc:
+            last_exc = exc
+            if on_rate_limit is not None and _is_rate_limit(exc):
+                on_rate_limit()
+
+            if not _is_retryable(exc):
+                logger.warning(
+                    "Processing failed with non-retryable error: %s", exc,
+                )
+                raise
+
+            if attempt < MAX_RETRIES:
+                logger.info(
+                    "Processing data and extracting information (attempt %d/%d) — retrying in %.1fs",
+                    attempt + 1,
+                    MAX_RETRIES + 1,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * BACKOFF_FACTOR, MAX_DELAY)
+            else:
+                logger.error(
+                    "Processing failed after %d attempts: %s",
+                    MAX_RETRIES + 1,
+                    exc,
+                )
+        else:
+            if on_success is not None:
+                on_success()
+            return response
 
     # All retries exhausted
     raise last_exc  # type: ignore[misc]
@@ -0,0 +1,99 @@
+"""
+src/openai_transport.py
+========================
+Shared HTTP transport for OpenAI clients — VoiceOps
+
+Provides one process-wide ``httpx.Client``, and one ``httpx.AsyncClient``
+per running event loop, that every OpenAI client (SDK or raw) is built on,
+so all NLP modules share a single connection pool and TLS session instead
+of one pool per module. Async connections are bound to the loop that
+opened them, so each ``asyncio.run()`` gets its own async client.
+
+With the optional ``h2`` package installed the clients speak HTTP/2 and
+multiplex concurrent requests over one connection; otherwise they fall
+back to a pool of HTTP/1.1 keep-alive connections.
+
+Usage::
+
+    from src.openai_transport import get_sync_client
+
+    client = OpenAI(api_key=..., http_client=get_sync_client())
+
+Retries are left to src.openai_retry (the transport itself never retries).
+
+This module does NOT:
+    - Authenticate or build requests
+    - Retry failed requests
+    - Change any analytical behaviour of the pipeline
+"""
+
+import asyncio
+import threading
+
+import httpx
+
+try:
+    import h2  # noqa: F401 — only probed, httpx imports it for http2
+except ImportError:  # optional — HTTP/1.1 keep-alive pool otherwise
+    h2 = None
+
+HTTP2_AVAILABLE: bool = h2 is not None
+
+# One multiplexed connection carries every stream under HTTP/2; HTTP/1.1
+# needs a connection per in-flight request.
+_LIMITS = (
+    httpx.Limits(max_connections=1, max_keepalive_connections=1)
+    if HTTP2_AVAILABLE
+    else httpx.Limits(max_connections=64, max_keepalive_connections=32)
+)
+_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+# ---------------------------------------------------------------------------
+# Shared clients (lazy-loaded singletons)
+# ---------------------------------------------------------------------------
+
+_sync_client: httpx.Client | None = None
+_async_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+_lock = threading.Lock()
+
+
+def get_sync_client() -> httpx.Client:
+    """Return the process-wide ``httpx.Client`` (thread-safe)."""
+    global _sync_client
+
+    if _sync_client is None:
+        with _lock:
+            if _sync_client is None:
+                _sync_client = httpx.Client(
+                    timeout=_TIMEOUT,
+                    # retries=0: connection retries are src.openai_retry's job
+                    transport=httpx.HTTPTransport(
+                        http2=HTTP2_AVAILABLE, limits=_LIMITS, retries=0,
+                    ),
+                )
+    return _sync_client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the ``httpx.AsyncClient`` of the running event loop.
+
+    Clients of loops that have since closed are dropped; their connections
+    cannot be used (or closed) from another loop.
+    """
+    loop = asyncio.get_running_loop()
+
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            for stale in [other for other in _async_clients if other.is_closed()]:
+                del _async_clients[stale]
+            client = _async_clients[loop] = httpx.AsyncClient(
+                timeout=_TIMEOUT,
+                # retries=0: connection retries are src.openai_retry's job
+                transport=httpx.AsyncHTTPTransport(
+                    http2=HTTP2_AVAILABLE, limits=_LIMITS, retries=0,
+                ),
+            )
+    return client
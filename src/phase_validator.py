@@ -40,6 +40,11 @@ class PhaseVerificationError(Exception):
         self.message = message
         super().__init__(f"Phase {phase} verification failed: {message}")
 
+    def __reduce__(self):
+        # Rebuild from (phase, message) so the error survives pickling
+        # across a process-pool boundary.
+        return (self.__class__, (self.phase, self.message))
+
 
 # =====================================================================
 # Phase 2 — STT Output Verification
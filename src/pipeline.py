@@ -34,6 +34,9 @@ Per RULES.md §11 — Section Ownership by Phase
 """
 
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 # ---------------------------------------------------------------------------
@@ -67,10 +70,12 @@ from src.nlp.sentiment import analyze_sentiment
 # ---------------------------------------------------------------------------
 # Phase 6 imports
 # ---------------------------------------------------------------------------
+from src.nlp._utt_utils import filter_customer_texts
 from src.nlp.intent import classify_intent
 from src.nlp.obligation import derive_obligation_strength
 from src.nlp.contradictions import detect_contradictions
 from src.nlp.entity_extractor import extract_entities
+from src.nlp import _combined
 
 # ---------------------------------------------------------------------------
 # Phase 7 imports
@@ -101,6 +106,80 @@ from src.phase_validator import (
 logger = logging.getLogger("voiceops.pipeline")
 
 
+# =====================================================================
+# Phase 6 overlap — the three OpenAI calls of Phase 6 (intent,
+# contradictions, entities) only read phase4_output, so they are issued
+# concurrently and their network round-trips overlap. Set
+# PIPELINE_PARALLEL_PHASE6=0 to run them one after another.
+# =====================================================================
+
+PARALLEL_PHASE6: bool = os.environ.get("PIPELINE_PARALLEL_PHASE6", "1") == "1"
+
+# Three calls per pipeline run; several runs may share the pool
+_PHASE6_WORKERS: int = int(os.environ.get("PIPELINE_PHASE6_WORKERS", "12"))
+
+_phase6_pool: ThreadPoolExecutor | None = None
+_phase6_pool_lock = threading.Lock()
+
+
+def _get_phase6_pool() -> ThreadPoolExecutor:
+    """Lazy-initialise the Phase 6 thread pool (thread-safe)."""
+    global _phase6_pool
+
+    if _phase6_pool is None:
+        with _phase6_pool_lock:
+            if _phase6_pool is None:
+                _phase6_pool = ThreadPoolExecutor(
+                    max_workers=_PHASE6_WORKERS,
+                    thread_name_prefix="voiceops-phase6",
+                )
+    return _phase6_pool
+
+
+def _run_phase6_calls(
+    phase4_output: list[dict[str, Any]],
+    customer_texts: list[str],
+) -> tuple[dict[str, Any], bool, dict[str, Any]]:
+    """
+    Run intent classification, contradiction detection and entity
+    extraction, concurrently when PARALLEL_PHASE6 is set.
+
+    With NLP_COMBINED_CALL, contradictions and entities share one reply
+    through the LLM cache, so they stay sequential in one task (run
+    concurrently, both would miss the cache and issue the call).
+
+    Errors propagate unchanged, intent's first.
+    """
+    if not PARALLEL_PHASE6:
+        return (
+            classify_intent(phase4_output, customer_texts),
+            detect_contradictions(phase4_output),
+            extract_entities(phase4_output),
+        )
+
+    pool = _get_phase6_pool()
+    intent_future = pool.submit(classify_intent, phase4_output, customer_texts)
+    if _combined.COMBINED_ENABLED:
+        def _contradictions_then_entities() -> tuple[bool, dict[str, Any]]:
+            return (
+                detect_contradictions(phase4_output),
+                extract_entities(phase4_output),
+            )
+
+        combined_future = pool.submit(_contradictions_then_entities)
+        intent = intent_future.result()
+        contradictions_detected, entities = combined_future.result()
+        return intent, contradictions_detected, entities
+
+    contradictions_future = pool.submit(detect_contradictions, phase4_output)
+    entities_future = pool.submit(extract_entities, phase4_output)
+    return (
+        intent_future.result(),
+        contradictions_future.result(),
+        entities_future.result(),
+    )
+
+
 # =====================================================================
 # Risk signal mapping — derives audio_trust_flags and behavioral_flags
 # from Phase 7 key_risk_factors and upstream signals
@@ -231,7 +310,26 @@ def run_pipeline(audio_bytes: bytes, filename: str) -> dict[str, Any]:
         PhaseVerificationError: Any phase output fails verification.
         RuntimeError: Critical pipeline failure.
     """
+    normalized_audio, audio_quality = run_preprocess(audio_bytes, filename)
+    return run_post(normalized_audio, audio_quality)
+
+
+def run_preprocess(audio_bytes: bytes, filename: str) -> tuple[bytes, dict[str, str]]:
+    """
+    Phase 1 only — the CPU-bound audio work.
+
+    Kept separate from run_post so callers can execute it in a worker
+    process (arguments and results are plain bytes / dicts and pickle
+    cheaply) while the I/O-bound phases stay on a thread.
+
+    Returns:
+        (normalized_audio, audio_quality)
 
+    Raises:
+        AudioValidationError: Phase 1 validation failure.
+        AudioNormalizationError: Phase 1 normalization failure.
+        PhaseVerificationError: Audio quality output fails verification.
+    """
     # ==================================================================
     # PHASE 1 — Audio Normalization + Quality Analysis
     # ==================================================================
@@ -244,7 +342,24 @@ def run_pipeline(audio_bytes: bytes, filename: str) -> dict[str, Any]:
     verify_audio_quality(audio_quality)
 
     logger.info("Phase 1 complete: audio normalized, quality analyzed.")
+    return normalized_audio, audio_quality
+
+
+def run_post(normalized_audio: bytes, audio_quality: dict[str, str]) -> dict[str, Any]:
+    """
+    Phases 2 → 8 — STT, LLM analysis, risk scoring and final assembly.
+
+    Args:
+        normalized_audio: Phase 1 output (mono 16 kHz WAV bytes).
+        audio_quality: Verified Phase 1 audio quality signals.
+
+    Returns:
+        Final structured JSON dict matching the locked schema.
 
+    Raises:
+        PhaseVerificationError: Any phase output fails verification.
+        RuntimeError: Critical pipeline failure.
+    """
     # ==================================================================
     # PHASE 2 — Speech-to-Text (STT ONLY)
     # ==================================================================
@@ -330,17 +445,19 @@ def run_pipeline(audio_bytes: bytes, filename: str) -> dict[str, Any]:
     logger.info("PHASE 6: Intent, Obligation, Contradictions, Entities")
     logger.info("=" * 60)
 
-    # Intent classification (OpenAI)
-    intent = classify_intent(phase4_output)
+    # CUSTOMER texts are extracted once for intent and obligation
+    customer_texts = filter_customer_texts(phase4_output)
 
-    # Obligation strength (DETERMINISTIC — no LLM)
-    obligation_strength = derive_obligation_strength(intent, phase4_output)
-
-    # Contradiction detection (OpenAI)
-    contradictions_detected = detect_contradictions(phase4_output)
+    # Intent classification, contradiction detection, entity
+    # extraction (OpenAI — issued concurrently)
+    intent, contradictions_detected, entities = _run_phase6_calls(
+        phase4_output, customer_texts,
+    )
 
-    # Entity extraction (OpenAI)
-    entities = extract_entities(phase4_output)
+    # Obligation strength (DETERMINISTIC — no LLM)
+    obligation_strength = derive_obligation_strength(
+        intent, phase4_output, customer_texts,
+    )
 
     verify_phase6(intent, obligation_strength, contradictions_detected, entities)
 
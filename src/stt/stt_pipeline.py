@@ -34,9 +34,10 @@ import io
 import logging
 import os
 import wave
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 
-from src.audio.chunker import chunk_audio
+from src.audio.chunker import chunk_audio_iter
 from src.stt.deepgram_client import transcribe_chunk as deepgram_transcribe_chunk
 from src.stt.sarvam_client import transcribe_chunk as sarvam_transcribe_chunk
 from src.stt.language_detector import detect_language
@@ -120,8 +121,9 @@ def transcribe(audio_bytes: bytes) -> list[dict]:
                 "Chunking was DISABLED but forced ON for Sarvam AI route "
                 "(Sarvam has per-request size limits)."
             )
-        chunks = chunk_audio(audio_bytes)
-        logger.info("Audio chunked into %d segment(s).", len(chunks))
+        # Lazy: transcription of early chunks starts while later chunks
+        # are still being built.
+        chunks = chunk_audio_iter(audio_bytes)
     else:
         logger.info(
             "Chunking DISABLED (ENABLE_CHUNKING=false). "
@@ -133,10 +135,11 @@ def transcribe(audio_bytes: bytes) -> list[dict]:
     # Step 3: Parallel transcription via routed STT provider
     # ------------------------------------------------------------------
     chunk_results = _transcribe_chunks_parallel(chunks, lang_result)
+    logger.info("Audio chunked into %d segment(s).", len(chunk_results))
 
     # Count results — silent chunks (skipped by VAD) are not failures
     silent_count = sum(1 for cr in chunk_results if cr.get("skipped_silent"))
-    speech_chunks = len(chunks) - silent_count
+    speech_chunks = len(chunk_results) - silent_count
     succeeded = sum(
         1 for cr in chunk_results
         if cr["transcript"] is not None and not cr.get("skipped_silent")
@@ -202,12 +205,15 @@ def _wrap_full_audio_as_chunk(audio_bytes: bytes) -> dict:
 
 
 def _transcribe_chunks_parallel(
-    chunks: list[dict],
+    chunks: Iterable[dict],
     lang_result,
 ) -> list[dict]:
     """
     Send all chunks to the appropriate STT provider in parallel.
 
+    *chunks* may be a lazy iterator; each chunk is submitted as soon as it
+    is produced.
+
     Routing:
         - Indian / Hinglish (lang_result.is_indian) → Sarvam AI
         - Else → Deepgram Nova-3
@@ -221,8 +227,6 @@ def _transcribe_chunks_parallel(
 
     Failed chunks get transcript=None (logged, not raised).
     """
-    results: list[dict] = [None] * len(chunks)  # type: ignore[list-item]
-
     def _transcribe_one(chunk: dict) -> dict:
         cid = chunk["chunk_id"]
 
@@ -270,15 +274,11 @@ def _transcribe_chunks_parallel(
                 "skipped_silent": False,
             }
 
-    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(chunks))) as executor:
-        futures = {
-            executor.submit(_transcribe_one, chunk): chunk["chunk_id"]
-            for chunk in chunks
-        }
-        for future in as_completed(futures):
-            result = future.result()
-            results[result["chunk_id"]] = result
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(_transcribe_one, chunk) for chunk in chunks]
+        results = [future.result() for future in futures]
 
+    results.sort(key=lambda r: r["chunk_id"])
     return results
 
 
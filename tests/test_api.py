@@ -0,0 +1,204 @@
+"""
+tests/test_api.py
+==================
+API Layer Tests — POST /api/v1/analyze-call
+
+Tests verify:
+    1. Upload bytes reach run_pipeline unchanged
+    2. Unsupported types (415) and oversized uploads (413) are rejected
+       before the body is read
+    3. Pipeline exceptions map to the documented HTTP status codes
+    4. Identical uploads are served from the result cache
+    5. Webhook batches respect the configured size limit
+    6. Webhook reply body is only read for 2xx JSON responses
+    7. The app lifespan opens and closes the shared HTTP session
+
+All tests are OFFLINE — run_pipeline is mocked, no audio processing.
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi.testclient import TestClient
+
+import src.api.upload as upload
+from src.audio.normalizer import AudioValidationError
+
+
+_FAKE_OUTPUT = {"call_context": {"call_language": "en"}}
+
+
+class TestAnalyzeCallUpload(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(upload.app)
+        upload._result_cache.clear()
+
+    @patch("src.api.upload.WEBHOOK_URL", None)
+    @patch("src.api.upload.UPLOAD_READ_CHUNK_BYTES", 7)
+    @patch("src.api.upload.run_pipeline", return_value=_FAKE_OUTPUT)
+    def test_upload_is_read_in_chunks_and_forwarded(self, mock_pipeline):
+        payload = bytes(range(256)) * 3
+        resp = self.client.post(
+            "/api/v1/analyze-call",
+            files={"audio_file": ("call.wav", payload, "audio/wav")},
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), _FAKE_OUTPUT)
+        forwarded, filename = mock_pipeline.call_args[0]
+        self.assertEqual(bytes(forwarded), payload)
+        self.assertEqual(filename, "call.wav")
+
+    @patch("src.api.upload.WEBHOOK_URL", None)
+    @patch(
+        "src.api.upload.run_pipeline",
+        side_effect=AudioValidationError("Audio file is empty."),
+    )
+    def test_validation_error_maps_to_422(self, _mock_pipeline):
+        resp = self.client.post(
+            "/api/v1/analyze-call",
+            files={"audio_file": ("call.wav", b"RIFF", "audio/wav")},
+        )
+        self.assertEqual(resp.status_code, 422)
+
+    @patch("src.api.upload.WEBHOOK_URL", None)
+    @patch("src.api.upload.RESULT_CACHE_SIZE", 128)
+    @patch("src.api.upload.run_pipeline", return_value=_FAKE_OUTPUT)
+    def test_identical_upload_hits_result_cache(self, mock_pipeline):
+        files = {"audio_file": ("call.wav", b"same-audio", "audio/wav")}
+        first = self.client.post("/api/v1/analyze-call", files=files)
+        second = self.client.post("/api/v1/analyze-call", files=files)
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(mock_pipeline.call_count, 1)
+
+    @patch("src.api.upload.WEBHOOK_URL", None)
+    @patch("src.api.upload.run_pipeline", return_value=_FAKE_OUTPUT)
+    def test_result_cache_off_by_default(self, mock_pipeline):
+        files = {"audio_file": ("call.wav", b"same-audio", "audio/wav")}
+        self.client.post("/api/v1/analyze-call", files=files)
+        self.client.post("/api/v1/analyze-call", files=files)
+        self.assertEqual(mock_pipeline.call_count, 2)
+
+    @patch("src.api.upload.run_pipeline", return_value=_FAKE_OUTPUT)
+    def test_unsupported_extension_rejected_with_415(self, mock_pipeline):
+        resp = self.client.post(
+            "/api/v1/analyze-call",
+            files={"audio_file": ("notes.txt", b"hello", "text/plain")},
+        )
+        self.assertEqual(resp.status_code, 415)
+        mock_pipeline.assert_not_called()
+
+    @patch("src.api.upload.run_pipeline", return_value=_FAKE_OUTPUT)
+    def test_non_audio_content_type_rejected_with_415(self, mock_pipeline):
+        resp = self.client.post(
+            "/api/v1/analyze-call",
+            files={"audio_file": ("call.wav", b"RIFF", "image/png")},
+        )
+        self.assertEqual(resp.status_code, 415)
+        mock_pipeline.assert_not_called()
+
+    @patch("src.api.upload.WEBHOOK_URL", None)
+    @patch("src.api.upload.run_pipeline", return_value=_FAKE_OUTPUT)
+    def test_octet_stream_content_type_accepted(self, _mock_pipeline):
+        resp = self.client.post(
+            "/api/v1/analyze-call",
+            files={"audio_file": ("call.mp3", b"ID3", "application/octet-stream")},
+        )
+        self.assertEqual(resp.status_code, 200)
+
+    @patch("src.api.upload.MAX_UPLOAD_BYTES", 100)
+    @patch("src.api.upload.run_pipeline", return_value=_FAKE_OUTPUT)
+    def test_oversized_upload_rejected_with_413(self, mock_pipeline):
+        resp = self.client.post(
+            "/api/v1/analyze-call",
+            files={"audio_file": ("call.wav", b"x" * 1000, "audio/wav")},
+        )
+        self.assertEqual(resp.status_code, 413)
+        mock_pipeline.assert_not_called()
+
+    @patch("src.api.upload.MAX_UPLOAD_BYTES", 100)
+    @patch("src.api.upload.UPLOAD_READ_CHUNK_BYTES", 16)
+    def test_streaming_read_enforces_limit_without_content_length(self):
+        fake_file = MagicMock()
+        fake_file.read = AsyncMock(side_effect=[b"x" * 16] * 10 + [b""])
+        with self.assertRaises(upload.HTTPException) as ctx:
+            asyncio.run(upload._read_upload(fake_file))
+        self.assertEqual(ctx.exception.status_code, 413)
+
+
+class TestWebhookBatching(unittest.TestCase):
+
+    @patch("src.api.upload.WEBHOOK_BATCH_SIZE", 3)
+    @patch("src.api.upload.WEBHOOK_BATCH_TIMEOUT_SECONDS", 0.05)
+    def test_batch_is_capped_at_batch_size(self):
+        async def run():
+            queue = asyncio.Queue()
+            for i in range(5):
+                queue.put_nowait({"n": i})
+            first = await upload._collect_webhook_batch(queue)
+            second = await upload._collect_webhook_batch(queue)
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual([item["n"] for item in first], [0, 1, 2])
+        self.assertEqual([item["n"] for item in second], [3, 4])
+
+
+def _fake_session(status: int, content_type: str, body: dict | None = None):
+    """aiohttp-like session whose post() yields a canned response."""
+    resp = MagicMock()
+    resp.status = status
+    resp.headers = {"Content-Type": content_type} if content_type else {}
+    resp.json = AsyncMock(return_value=body)
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=resp)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    session = MagicMock()
+    session.post.return_value = ctx
+    return session, resp
+
+
+class TestWebhookReply(unittest.TestCase):
+
+    def _deliver(self, session):
+        with patch("src.api.upload.WEBHOOK_URL", "http://hook.test"), \
+                patch("src.api.upload._get_http_session", return_value=session):
+            return asyncio.run(upload._deliver(dict(_FAKE_OUTPUT)))
+
+    def test_json_reply_is_returned(self):
+        session, resp = _fake_session(200, "application/json; charset=utf-8", {"ok": True})
+        result = self._deliver(session)
+        self.assertEqual(result.body, b'{"ok":true}')
+
+    def test_empty_reply_body_is_not_read(self):
+        session, resp = _fake_session(204, "")
+        result = self._deliver(session)
+        resp.json.assert_not_called()
+        resp.release.assert_called_once()
+        self.assertIn(b"call_context", result.body)
+
+    def test_error_status_body_is_not_read(self):
+        session, resp = _fake_session(500, "application/json", {"error": "x"})
+        self._deliver(session)
+        resp.json.assert_not_called()
+
+
+class TestLifespan(unittest.TestCase):
+
+    @patch("src.api.upload.VAD_WARMUP", False)
+    @patch("src.api.upload.CPU_POOL_SIZE", 0)
+    def test_http_session_opened_and_closed(self):
+        with TestClient(upload.app):
+            session = upload.app.state.http
+            self.assertFalse(session.closed)
+        self.assertTrue(session.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+"""
+tests/test_chunker.py
+======================
+Phase 1 Tests — VAD-aware audio chunker
+
+Tests verify:
+    1. Short audio is returned as a single chunk (energy gate only)
+    2. Long audio is split with overlap and every chunk is a valid WAV
+    3. Per-chunk speech flags line up with their chunks
+    4. Silence gaps / speech flags derived from a cached VAD timeline
+    5. Energy pre-filter short-circuits Silero for obvious cases, including
+       whole long clips that are silent
+    6. Startup warm-up never raises
+
+All tests are OFFLINE — Silero VAD is mocked, audio is synthetic.
+"""
+
+import io
+import os
+import sys
+import unittest
+import wave
+from unittest.mock import patch
+
+import numpy as np
+
+# Ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.audio.chunker import chunk_audio, chunk_audio_iter
+from src.audio.vad import (
+    chunk_has_speech,
+    chunk_has_speech_from_frames,
+    compute_vad_frames,
+    find_silence_gaps_from_frames,
+    speech_segments_from_frames,
+    warmup_vad,
+)
+
+
+# ===================================================================
+# Test fixtures
+# ===================================================================
+
+def _make_wav(seconds: float, sample_rate: int = 16000) -> bytes:
+    """Mono 16-bit WAV containing a 220 Hz tone."""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    pcm = (0.3 * np.sin(2 * np.pi * 220 * t) * 32767).astype(np.int16)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm.tobytes())
+    return buf.getvalue()
+
+
+def _timeline(seconds: float, speech_until: float, window: int = 512) -> np.ndarray:
+    """VAD probability timeline: speech up to *speech_until*, silence after."""
+    n_windows = -(-int(seconds * 16000) // window)
+    probs = np.zeros(n_windows, dtype=np.float32)
+    probs[: int(speech_until * 16000) // window] = 0.9
+    return probs
+
+
+def _wav_frames(wav_bytes: bytes) -> int:
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+        return wf.getnframes()
+
+
+# ===================================================================
+# chunk_audio
+# ===================================================================
+
+
+class TestChunkAudio(unittest.TestCase):
+
+    @patch("src.audio.chunker.compute_vad_frames")
+    def test_short_audio_single_chunk(self, mock_frames):
+        wav = _make_wav(10.0)
+        chunks = chunk_audio(wav)
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(chunks[0]["offset"], 0.0)
+        self.assertEqual(chunks[0]["duration"], 10.0)
+        self.assertIs(chunks[0]["audio_bytes"], wav)
+        self.assertTrue(chunks[0]["has_speech"])
+        mock_frames.assert_not_called()
+
+    def test_short_silent_audio_flagged_without_vad(self):
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(16000)
+            wf.writeframes(b"\x00\x00" * 16000)
+        chunks = chunk_audio(buf.getvalue())
+        self.assertFalse(chunks[0]["has_speech"])
+
+    @patch("src.audio.chunker.compute_vad_frames", return_value=_timeline(100.0, 100.0))
+    def test_long_audio_hard_splits_with_overlap(self, _mock_frames):
+        chunks = chunk_audio(_make_wav(100.0), overlap=2.5)
+        self.assertEqual([c["chunk_id"] for c in chunks], [0, 1, 2])
+        self.assertEqual([c["offset"] for c in chunks], [0.0, 32.5, 67.5])
+        self.assertEqual([c["duration"] for c in chunks], [35.0, 37.5, 32.5])
+        for c in chunks:
+            self.assertEqual(_wav_frames(c["audio_bytes"]), int(c["duration"] * 16000))
+
+    @patch("src.audio.chunker.compute_vad_frames", return_value=_timeline(100.0, 67.6))
+    def test_speech_flags_follow_chunk_order(self, _mock_frames):
+        # The last chunk (67.5 s – 100 s) holds only 0.1 s of speech
+        chunks = chunk_audio(_make_wav(100.0), overlap=2.5)
+        self.assertEqual([c["has_speech"] for c in chunks], [True, True, False])
+
+    @patch("src.audio.chunker.compute_vad_frames", return_value=_timeline(100.0, 100.0))
+    def test_iter_yields_chunks_lazily(self, _mock_frames):
+        it = chunk_audio_iter(_make_wav(100.0), overlap=2.5)
+        first = next(it)
+        self.assertEqual((first["chunk_id"], first["offset"]), (0, 0.0))
+        self.assertEqual([c["chunk_id"] for c in it], [1, 2])
+
+
+class TestVadTimeline(unittest.TestCase):
+
+    def test_segments_follow_hysteresis(self):
+        probs = np.array([0.0, 0.9, 0.9, 0.3, 0.9, 0.0, 0.0, 0.0], dtype=np.float32)
+        # 0.3 sits between the offset (0.20) and onset (0.35) thresholds
+        segments = speech_segments_from_frames(
+            probs, min_speech_duration_ms=0, min_silence_duration_ms=0,
+        )
+        self.assertEqual(segments, [{"start": 512, "end": 2560}])
+
+    def test_silence_gaps_bracket_speech(self):
+        probs = _timeline(10.0, 4.0)
+        gaps = find_silence_gaps_from_frames(probs, 160000)
+        self.assertEqual(gaps, [(int(4.0 * 16000) // 512 * 512, 160000)])
+
+    def test_all_silence_is_one_gap(self):
+        probs = np.zeros(100, dtype=np.float32)
+        self.assertEqual(find_silence_gaps_from_frames(probs, 51200), [(0, 51200)])
+
+    def test_chunk_speech_flag_uses_minimum_duration(self):
+        probs = _timeline(10.0, 4.0)
+        self.assertTrue(chunk_has_speech_from_frames(probs, 0, 80000))
+        self.assertFalse(chunk_has_speech_from_frames(probs, 62000, 160000))
+        self.assertFalse(chunk_has_speech_from_frames(probs, 70000, 160000))
+
+
+class TestEnergyGate(unittest.TestCase):
+
+    @patch("src.audio.vad.detect_speech_segments")
+    def test_silence_skips_model(self, mock_detect):
+        self.assertFalse(chunk_has_speech(np.zeros(16000, dtype=np.float32)))
+        mock_detect.assert_not_called()
+
+    @patch("src.audio.vad.detect_speech_segments")
+    def test_loud_voiced_signal_skips_model(self, mock_detect):
+        t = np.arange(16000, dtype=np.float32) / 16000
+        tone = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+        self.assertTrue(chunk_has_speech(tone))
+        mock_detect.assert_not_called()
+
+    @patch("src.audio.vad.detect_speech_segments", return_value=[])
+    def test_ambiguous_signal_falls_back_to_model(self, mock_detect):
+        rng = np.random.default_rng(0)
+        noise = (0.02 * rng.standard_normal(16000)).astype(np.float32)
+        self.assertFalse(chunk_has_speech(noise))
+        mock_detect.assert_called_once()
+
+    @patch("src.audio.vad._load_vad_model")
+    def test_silent_clip_timeline_skips_model(self, mock_load):
+        frames = compute_vad_frames(np.zeros(1600, dtype=np.float32), skip_silent=True)
+        self.assertEqual(len(frames), 4)
+        self.assertFalse(frames.any())
+        mock_load.assert_not_called()
+
+    @patch("src.audio.vad._load_vad_model")
+    def test_long_silent_audio_skips_model(self, mock_load):
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(16000)
+            wf.writeframes(b"\x00\x00" * 16000 * 60)
+        chunks = chunk_audio(buf.getvalue())
+        self.assertGreater(len(chunks), 1)
+        self.assertFalse(any(c["has_speech"] for c in chunks))
+        mock_load.assert_not_called()
+
+
+class TestVadWarmup(unittest.TestCase):
+
+    @patch("src.audio.vad.compute_vad_frames")
+    def test_runs_model_on_one_second(self, mock_frames):
+        self.assertTrue(warmup_vad())
+        self.assertEqual(len(mock_frames.call_args.args[0]), 16000)
+
+    @patch("src.audio.vad.compute_vad_frames", side_effect=RuntimeError("torch is required"))
+    def test_failure_is_swallowed(self, _mock_frames):
+        self.assertFalse(warmup_vad())
+
+
+if __name__ == "__main__":
+    unittest.main()
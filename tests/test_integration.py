@@ -15,6 +15,7 @@ All tests are OFFLINE — no LLM, no API, no audio processing.
 """
 
 import os
+import pickle
 import sys
 import unittest
 from unittest.mock import patch, MagicMock
@@ -39,6 +40,7 @@ from src.pipeline import (
     _derive_behavioral_flags,
     _derive_speaker_analysis,
     _bridge_phase3_to_phase4,
+    _run_phase6_calls,
 )
 
 
@@ -312,6 +314,13 @@ class TestVerifyPhase8(unittest.TestCase):
 
 class TestVerifyAudioQuality(unittest.TestCase):
 
+    def test_error_survives_pickling(self):
+        # Phase 1 may run in a worker process; its errors must round-trip
+        err = PhaseVerificationError("1", "noise_level invalid")
+        clone = pickle.loads(pickle.dumps(err))
+        self.assertEqual((clone.phase, clone.message), ("1", "noise_level invalid"))
+        self.assertEqual(str(clone), str(err))
+
     def test_valid_quality(self):
         verify_audio_quality(_valid_audio_quality())
 
@@ -619,5 +628,38 @@ class TestFullPipelineMock(unittest.TestCase):
         mock_summary.assert_called_once()
 
 
+class TestRunPhase6Calls(unittest.TestCase):
+    """The Phase 6 OpenAI calls return the same results in either mode."""
+
+    def _run(self, parallel, combined):
+        with patch("src.pipeline.PARALLEL_PHASE6", parallel), \
+                patch("src.pipeline._combined.COMBINED_ENABLED", combined), \
+                patch("src.pipeline.classify_intent",
+                      return_value={"label": "refusal"}) as mock_intent, \
+                patch("src.pipeline.detect_contradictions",
+                      return_value=True), \
+                patch("src.pipeline.extract_entities",
+                      return_value={"payment_commitment": None}):
+            result = _run_phase6_calls([], ["no"])
+        mock_intent.assert_called_once_with([], ["no"])
+        return result
+
+    def test_modes_agree(self):
+        expected = ({"label": "refusal"}, True, {"payment_commitment": None})
+        for parallel in (False, True):
+            for combined in (False, True):
+                self.assertEqual(self._run(parallel, combined), expected)
+
+    def test_error_propagates(self):
+        with patch("src.pipeline.PARALLEL_PHASE6", True), \
+                patch("src.pipeline.classify_intent",
+                      side_effect=ValueError("bad intent")), \
+                patch("src.pipeline.detect_contradictions",
+                      return_value=False), \
+                patch("src.pipeline.extract_entities", return_value={}):
+            with self.assertRaises(ValueError):
+                _run_phase6_calls([], [])
+
+
 if __name__ == "__main__":
     unittest.main()
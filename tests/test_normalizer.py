@@ -0,0 +1,99 @@
+"""
+tests/test_normalizer.py
+=========================
+Phase 1 Tests — Audio normalizer
+
+Tests verify:
+    1. Extension validation (case-insensitive, missing extension)
+    2. WAV output is mono 16 kHz and byte-identical to pydub's export
+
+All tests are OFFLINE — audio is synthetic, no ffmpeg required for WAV.
+"""
+
+import io
+import os
+import sys
+import unittest
+import wave
+
+import numpy as np
+from pydub import AudioSegment
+
+# Ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.audio.normalizer import (
+    AudioValidationError,
+    _extract_extension,
+    normalize,
+    validate_extension,
+)
+
+
+# ===================================================================
+# Test fixtures
+# ===================================================================
+
+def _stereo_wav(seconds: float = 1.0, sample_rate: int = 44100) -> bytes:
+    rng = np.random.default_rng(0)
+    pcm = (3000 * rng.standard_normal(int(seconds * sample_rate) * 2)).astype(np.int16)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(2)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm.tobytes())
+    return buf.getvalue()
+
+
+# ===================================================================
+# Extension validation
+# ===================================================================
+
+
+class TestExtension(unittest.TestCase):
+
+    def test_extract_extension(self):
+        self.assertEqual(_extract_extension("Call.WAV"), ".wav")
+        self.assertEqual(_extract_extension("archive.tar.mp3"), ".mp3")
+        self.assertEqual(_extract_extension("noext"), "")
+
+    def test_rejects_unsupported(self):
+        with self.assertRaises(AudioValidationError):
+            validate_extension("notes.txt")
+
+    def test_rejects_missing_filename(self):
+        with self.assertRaises(AudioValidationError):
+            validate_extension("")
+
+
+# ===================================================================
+# normalize
+# ===================================================================
+
+
+class TestNormalize(unittest.TestCase):
+
+    def test_wav_output_matches_pydub_export(self):
+        raw = _stereo_wav()
+        out = normalize(raw, "call.wav")
+
+        expected = io.BytesIO()
+        (
+            AudioSegment.from_file(io.BytesIO(raw), format="wav")
+            .set_channels(1)
+            .set_frame_rate(16000)
+            .export(expected, format="wav")
+        )
+        self.assertEqual(out, expected.getvalue())
+
+        with wave.open(io.BytesIO(out), "rb") as wf:
+            self.assertEqual((wf.getnchannels(), wf.getframerate()), (1, 16000))
+
+    def test_empty_file_rejected(self):
+        with self.assertRaises(AudioValidationError):
+            normalize(b"", "call.wav")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,11 +17,18 @@ Test categories:
        - Full Phase 6 pipeline with realistic scenarios
 """
 
+import asyncio
 import json
 import os
+import re
 import sys
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+try:
+    import tiktoken
+except ImportError:  # optional — only the token-budget test needs it
+    tiktoken = None
 
 # Ensure project root is on sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -33,15 +40,34 @@ from src.nlp.intent import (
     _parse_intent_response,
     _build_user_message as intent_build_msg,
     classify_intent,
+    classify_intent_batch,
+    classify_intents_many,
+    classify_intents_packed,
+    _fast_intent,
+    _MinuteBudget,
+    _MAX_OUTPUT_TOKENS,
     _DEFAULT_INTENT,
     _VALID_INTENT_LABELS,
     _VALID_CONDITIONALITY,
 )
 from src.nlp.contradictions import (
+    _AdaptiveRateLimiter,
+    _ShardedRateLimiter,
     _filter_customer_utterances as contra_filter,
     _parse_contradiction_response,
     _build_user_message as contra_build_msg,
     detect_contradictions,
+    detect_contradictions_async,
+)
+from src.nlp import _async_openai, _llm_cache
+from src.nlp._async_openai import LoopLocal, get_async_openai
+from src.nlp._batcher import Batcher
+from src.nlp._combined import analyze as analyze_combined
+from src.nlp.entity_extractor import (
+    _amount_prepass,
+    _parse_entity_response,
+    extract_entities,
+    extract_entities_async,
 )
 from src.nlp.obligation import (
     ObligationStrength,
@@ -51,6 +77,8 @@ from src.nlp.obligation import (
     _WEAK_PATTERN,
     _CONDITIONAL_PATTERN,
 )
+from src.nlp._regex import compile_ci, compile_cs, compile_lower
+from src.openai_transport import get_async_client
 
 
 # ===================================================================
@@ -235,6 +263,85 @@ class TestContradictionResponseParser(unittest.TestCase):
             _parse_contradiction_response('{"contradictions_detected": null}')
 
 
+class TestEntityResponseParser(unittest.TestCase):
+    """Test _parse_entity_response."""
+
+    def test_valid_response(self):
+        result = _parse_entity_response(
+            '{"payment_commitment": "next_week", "amount_mentioned": 400000}'
+        )
+        self.assertEqual(
+            result, {"payment_commitment": "next_week", "amount_mentioned": 400000.0},
+        )
+
+    def test_zero_amount_is_none(self):
+        result = _parse_entity_response(
+            '{"payment_commitment": null, "amount_mentioned": 0}'
+        )
+        self.assertIsNone(result["amount_mentioned"])
+
+    def test_missing_key_raises(self):
+        with self.assertRaises(ValueError):
+            _parse_entity_response('{"payment_commitment": null}')
+
+    def test_invalid_json_raises(self):
+        with self.assertRaises(ValueError):
+            _parse_entity_response("not json")
+
+
+@patch("src.nlp.entity_extractor.AMOUNT_PREPASS_ENABLED", True)
+class TestAmountPrepass(unittest.TestCase):
+    """Test the opt-in local regex amount pre-pass."""
+
+    def test_single_amount_answered_locally(self):
+        local, hint = _amount_prepass(["My outstanding is 2.3 lakh"])
+        self.assertEqual(local, {"payment_commitment": None, "amount_mentioned": 230000.0})
+        self.assertIsNone(hint)
+
+    def test_commitment_words_become_hint(self):
+        local, hint = _amount_prepass(["I will pay 50 thousand tomorrow"])
+        self.assertIsNone(local)
+        self.assertEqual(hint, 50000.0)
+
+    def test_several_amounts_left_to_model(self):
+        self.assertEqual(_amount_prepass(["It is 2 lakh 50 thousand"]), (None, None))
+
+    def test_no_amount(self):
+        self.assertEqual(_amount_prepass(["What is this about?"]), (None, None))
+
+    def test_commitments_become_hints(self):
+        for text, amount in [
+            ("I'll give you 50 thousand on Monday", 50000.0),
+            ("Main kal 20 hazaar de dunga", 20000.0),
+            ("Salary aane pe 10 thousand bhej dunga", 10000.0),
+            ("I can do 5k by friday", 5000.0),
+        ]:
+            with self.subTest(text=text):
+                self.assertEqual(_amount_prepass([text]), (None, amount))
+
+    def test_other_digits_become_hint(self):
+        local, hint = _amount_prepass(
+            ["My outstanding is 2 lakh", "and my EMI is 12000 monthly"],
+        )
+        self.assertIsNone(local)
+        self.assertEqual(hint, 200000.0)
+
+    def test_disabled_returns_no_answer(self):
+        with patch("src.nlp.entity_extractor.AMOUNT_PREPASS_ENABLED", False):
+            self.assertEqual(
+                _amount_prepass(["My outstanding is 2.3 lakh"]), (None, None),
+            )
+
+    @patch("src.nlp.entity_extractor.OpenAI")
+    def test_extract_entities_skips_api(self, mock_openai_cls):
+        utts = [{"speaker": "CUSTOMER", "text": "The balance is 1.5 crore", "start_time": 0, "end_time": 1}]
+        self.assertEqual(
+            extract_entities(utts),
+            {"payment_commitment": None, "amount_mentioned": 15000000.0},
+        )
+        mock_openai_cls.assert_not_called()
+
+
 class TestCustomerUtteranceFiltering(unittest.TestCase):
     """Test that only CUSTOMER utterances are extracted."""
 
@@ -264,6 +371,15 @@ class TestCustomerUtteranceFiltering(unittest.TestCase):
         ]
         self.assertEqual(intent_filter(utts), ["real text"])
 
+    def test_missing_speaker_or_text_skipped(self):
+        utts = [
+            {"text": "no speaker", "start_time": 0, "end_time": 1},
+            {"speaker": None, "text": "null speaker", "start_time": 1, "end_time": 2},
+            {"speaker": "CUSTOMER", "text": None, "start_time": 2, "end_time": 3},
+            {"speaker": "CUSTOMER", "text": "   ", "start_time": 3, "end_time": 4},
+        ]
+        self.assertEqual(intent_filter(utts), [])
+
     def test_contradiction_filter_same_behavior(self):
         """Both modules share the same filtering logic."""
         a = intent_filter(UTTERANCES_PROMISE_STRONG)
@@ -285,6 +401,51 @@ class TestUserMessageBuilding(unittest.TestCase):
         self.assertIn("3. third", msg)
 
 
+    def test_contradiction_repeats_collapsed(self):
+        msg = contra_build_msg(["yes", "I will pay", "yes", "yes"])
+        self.assertEqual(msg, "1. yes (said 3x)\n2. I will pay")
+
+
+    def test_oversized_list_clamped_to_edges(self):
+        from src.nlp._utt_utils import clamp_texts
+
+        texts = [f"line {i}" for i in range(100)]
+        clamped = clamp_texts(texts, max_utterances=10)
+        self.assertEqual(clamped[:5], texts[:5])
+        self.assertEqual(clamped[-5:], texts[-5:])
+        self.assertEqual(clamped[5], "… [90 omitted] …")
+
+        long_texts = ["x" * 1000] * 3 + [f"y{i}" for i in range(3)]
+        self.assertEqual(len(clamp_texts(long_texts, max_chars=1500)), 3)
+        short = texts[:3]
+        self.assertIs(clamp_texts(short), short)
+
+
+class TestCompileCi(unittest.TestCase):
+    """Test the RE2-or-re pattern compiler."""
+
+    def test_case_insensitive(self):
+        pattern = compile_ci(r"\bI will pay\b|\bfor sure\b")
+        self.assertEqual(len(pattern.findall("i WILL pay, For Sure")), 2)
+
+    def test_case_sensitive_variant(self):
+        pattern = compile_cs(r"[A-Z]{2,}")
+        self.assertEqual(pattern.findall("ab CD ef"), ["CD"])
+
+    def test_lower_variant_matches_lowered_text(self):
+        pattern = compile_lower(r"\bI will pay\b")
+        self.assertIsNotNone(pattern.search("OK, I WILL PAY.".lower()))
+        self.assertIsNone(pattern.search("OK, I WILL PAY."))
+
+    def test_lower_variant_rejects_upper_case_escape(self):
+        with self.assertRaises(ValueError):
+            compile_lower(r"\bpay\S+")
+
+    @patch("src.nlp._regex.re2", None)
+    def test_falls_back_to_re(self):
+        self.assertIsInstance(compile_ci(r"\bmaybe\b"), re.Pattern)
+
+
 class TestObligationStrengthDeterministic(unittest.TestCase):
     """Test obligation derivation logic — all branches."""
 
@@ -317,6 +478,45 @@ class TestObligationStrengthDeterministic(unittest.TestCase):
         result = derive_obligation_strength(intent, UTTERANCES_PROMISE_STRONG)
         self.assertEqual(result, "strong")
 
+    # --- marker-free cases never touch the text ---
+
+    @patch("src.nlp.obligation.filter_customer_texts")
+    def test_high_and_delay_skip_text_analysis(self, mock_filter):
+        for intent in (
+            {"label": "repayment_promise", "confidence": 0.8, "conditionality": "high"},
+            {"label": "repayment_delay", "confidence": 0.8, "conditionality": "low"},
+        ):
+            derive_obligation_strength(intent, UTTERANCES_DELAY_CONDITIONAL)
+        mock_filter.assert_not_called()
+
+    # --- conditional markers may span utterances ---
+
+    def test_promise_medium_conditional_across_utterances(self):
+        intent = {"label": "repayment_promise", "confidence": 0.8, "conditionality": "medium"}
+        result = derive_obligation_strength(
+            intent, [], customer_texts=["When my salary", "comes I will pay, for sure."],
+        )
+        self.assertEqual(result, "conditional")
+
+    # --- pre-filtered CUSTOMER texts are used as given ---
+
+    def test_promise_low_with_prefiltered_texts(self):
+        intent = {"label": "repayment_promise", "confidence": 0.9, "conditionality": "low"}
+        result = derive_obligation_strength(
+            intent, UTTERANCES_AGENT_ONLY, customer_texts=["I will pay tomorrow."],
+        )
+        self.assertEqual(result, "strong")
+
+    # --- overlapping markers are each counted ---
+
+    def test_promise_medium_overlapping_markers(self):
+        # "tomorrow I will" (strong) overlaps "I will try" (weak): 1 vs 1
+        intent = {"label": "repayment_promise", "confidence": 0.8, "conditionality": "medium"}
+        utts = [
+            {"speaker": "CUSTOMER", "text": "Okay, tomorrow I will try.", "start_time": 0, "end_time": 2},
+        ]
+        self.assertEqual(derive_obligation_strength(intent, utts), "conditional")
+
     # --- repayment_promise + low conditionality + no strong markers → weak ---
 
     def test_promise_low_no_strong_markers(self):
@@ -438,6 +638,15 @@ class TestLinguisticMarkerPatterns(unittest.TestCase):
 class TestClassifyIntentWithMock(unittest.TestCase):
     """Test classify_intent with mocked OpenAI API."""
 
+    def setUp(self):
+        # Identical utterances with different mocked replies must not be
+        # served from the response cache
+        _llm_cache.clear()
+        self.addCleanup(_llm_cache.clear)
+        patcher = patch("src.nlp.intent._client", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def _mock_openai_response(self, content: str):
         """Create a mock OpenAI response."""
         mock_message = MagicMock()
@@ -502,9 +711,402 @@ class TestClassifyIntentWithMock(unittest.TestCase):
         self.assertIn("I am not going to pay", user_msg)
 
 
+    @patch("src.nlp.intent.MINI_PROMPT_ENABLED", True)
+    @patch("src.nlp.intent.OpenAI")
+    def test_short_speech_uses_mini_prompt(self, mock_openai_cls):
+        create = mock_openai_cls.return_value.chat.completions.create
+        create.return_value = self._mock_openai_response(
+            '{"label": "deflection", "confidence": 0.7, "conditionality": "low"}'
+        )
+
+        classify_intent(UTTERANCES_DEFLECTION)
+        classify_intent(UTTERANCES_PROMISE_STRONG + UTTERANCES_DELAY_CONDITIONAL * 3)
+
+        short_prompt = create.call_args_list[0].kwargs["messages"][0]["content"]
+        long_prompt = create.call_args_list[1].kwargs["messages"][0]["content"]
+        self.assertLess(len(short_prompt), len(long_prompt))
+        self.assertIn("INTENT DEFINITIONS", short_prompt)
+        self.assertNotIn("EXAMPLE OUTPUT", short_prompt)
+
+    @patch("src.nlp.intent.OpenAI")
+    def test_request_pins_strict_schema(self, mock_openai_cls):
+        create = mock_openai_cls.return_value.chat.completions.create
+        create.return_value = self._mock_openai_response(
+            '{"label": "refusal", "confidence": 0.8, "conditionality": "low"}'
+        )
+
+        classify_intent(UTTERANCES_REFUSAL)
+
+        response_format = create.call_args.kwargs["response_format"]
+        self.assertEqual(response_format["type"], "json_schema")
+        schema = response_format["json_schema"]["schema"]
+        self.assertTrue(response_format["json_schema"]["strict"])
+        self.assertEqual(set(schema["properties"]["label"]["enum"]), _VALID_INTENT_LABELS)
+        self.assertEqual(set(schema["required"]), {"label", "confidence", "conditionality"})
+
+    @patch("src.nlp.intent.OpenAI")
+    def test_repeat_call_served_from_cache(self, mock_openai_cls):
+        mock_client = mock_openai_cls.return_value
+        mock_client.chat.completions.create.return_value = self._mock_openai_response(
+            '{"label": "refusal", "confidence": 0.8, "conditionality": "low"}'
+        )
+
+        first = classify_intent(UTTERANCES_REFUSAL)
+        first["label"] = "mutated"
+        second = classify_intent(UTTERANCES_REFUSAL)
+
+        self.assertEqual(second["label"], "refusal")
+        mock_client.chat.completions.create.assert_called_once()
+
+
+@unittest.skipUnless(tiktoken, "tiktoken not installed")
+class TestIntentOutputBudget(unittest.TestCase):
+    """max_tokens must fit every reply the response schema allows."""
+
+    def test_longest_reply_fits(self):
+        encoding = tiktoken.encoding_for_model("gpt-4o-mini")
+        longest = max(
+            len(encoding.encode(json.dumps({
+                "label": label,
+                "confidence": 0.85,
+                "conditionality": conditionality,
+            })))
+            for label in _VALID_INTENT_LABELS
+            for conditionality in _VALID_CONDITIONALITY
+        )
+        self.assertLessEqual(longest, _MAX_OUTPUT_TOKENS)
+
+
+class TestFastIntent(unittest.TestCase):
+    """Test the opt-in keyword fast path for intent."""
+
+    def test_strong_promise_classified_locally(self):
+        result = _fast_intent(intent_filter(UTTERANCES_PROMISE_STRONG))
+        self.assertEqual(result["label"], "repayment_promise")
+        self.assertEqual(result["conditionality"], "low")
+
+    def test_plain_refusal_classified_locally(self):
+        result = _fast_intent(["No. I won't pay anything."])
+        self.assertEqual(result["label"], "refusal")
+
+    def test_conditional_speech_goes_to_model(self):
+        self.assertIsNone(_fast_intent(intent_filter(UTTERANCES_DELAY_CONDITIONAL)))
+
+    def test_mixed_cues_go_to_model(self):
+        # Refusal and dispute cues together
+        self.assertIsNone(_fast_intent(intent_filter(UTTERANCES_REFUSAL)))
+
+    def test_no_cues_go_to_model(self):
+        self.assertIsNone(_fast_intent(intent_filter(UTTERANCES_DEFLECTION)))
+
+    @patch("src.nlp.intent.FAST_PATH_ENABLED", True)
+    @patch("src.nlp.intent._get_client")
+    def test_classify_intent_skips_api_when_enabled(self, mock_get_client):
+        result = classify_intent(UTTERANCES_PROMISE_STRONG)
+        self.assertEqual(result["label"], "repayment_promise")
+        mock_get_client.assert_not_called()
+
+
+class TestClassifyIntentBatch(unittest.TestCase):
+    """Test classify_intent_batch with a mocked Batch API."""
+
+    def setUp(self):
+        _llm_cache.clear()
+        self.addCleanup(_llm_cache.clear)
+        patcher = patch("src.nlp.intent._client", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _output_line(custom_id: str, content: str) -> str:
+        return json.dumps({
+            "custom_id": custom_id,
+            "response": {
+                "status_code": 200,
+                "body": {"choices": [{"message": {"content": content}}]},
+            },
+            "error": None,
+        })
+
+    def _mock_client(self, mock_openai_cls, output: str, status: str = "completed"):
+        client = mock_openai_cls.return_value
+        client.batches.create.return_value = MagicMock(
+            id="batch_1", status="in_progress", output_file_id=None,
+        )
+        client.batches.retrieve.return_value = MagicMock(
+            id="batch_1", status=status, output_file_id="file_out",
+        )
+        client.files.content.return_value.text = output
+        return client
+
+    @patch("src.nlp.intent.time.sleep")
+    @patch("src.nlp.intent.OpenAI")
+    def test_results_in_input_order(self, mock_openai_cls, _sleep):
+        # Output file lines arrive out of order
+        client = self._mock_client(mock_openai_cls, "\n".join([
+            self._output_line("2", '{"label": "refusal", "confidence": 0.8, "conditionality": "low"}'),
+            self._output_line("0", '{"label": "repayment_promise", "confidence": 0.9, "conditionality": "low"}'),
+        ]))
+
+        results = classify_intent_batch(
+            [UTTERANCES_PROMISE_STRONG, UTTERANCES_AGENT_ONLY, UTTERANCES_REFUSAL]
+        )
+
+        self.assertEqual([r["label"] for r in results],
+                         ["repayment_promise", "unknown", "refusal"])
+        upload = client.files.create.call_args.kwargs
+        self.assertEqual(upload["purpose"], "batch")
+        lines = upload["file"][1].getvalue().splitlines()
+        self.assertEqual([json.loads(l)["custom_id"] for l in lines], ["0", "2"])
+        self.assertEqual(json.loads(lines[0])["url"], "/v1/chat/completions")
+        client.batches.create.assert_called_once()
+        self.assertEqual(client.batches.create.call_args.kwargs["completion_window"], "24h")
+
+    @patch("src.nlp.intent.OpenAI")
+    def test_cached_calls_skip_upload(self, mock_openai_cls):
+        client = mock_openai_cls.return_value
+        client.chat.completions.create.return_value.choices = [
+            MagicMock(message=MagicMock(
+                content='{"label": "refusal", "confidence": 0.8, "conditionality": "low"}'
+            ))
+        ]
+        classify_intent(UTTERANCES_REFUSAL)
+
+        results = classify_intent_batch([UTTERANCES_REFUSAL, UTTERANCES_AGENT_ONLY])
+
+        self.assertEqual(results[0]["label"], "refusal")
+        self.assertEqual(results[1], _DEFAULT_INTENT)
+        client.files.create.assert_not_called()
+
+    @patch("src.nlp.intent.time.sleep")
+    @patch("src.nlp.intent.OpenAI")
+    def test_failed_batch_raises(self, mock_openai_cls, _sleep):
+        self._mock_client(mock_openai_cls, "", status="expired")
+        with self.assertRaises(RuntimeError):
+            classify_intent_batch([UTTERANCES_REFUSAL])
+
+    @patch("src.nlp.intent.time.sleep")
+    @patch("src.nlp.intent.OpenAI")
+    def test_invalid_item_raises_but_caches_valid(self, mock_openai_cls, _sleep):
+        client = self._mock_client(mock_openai_cls, "\n".join([
+            self._output_line("0", '{"label": "repayment_promise", "confidence": 0.9, "conditionality": "low"}'),
+            self._output_line("1", "not json"),
+        ]))
+
+        with self.assertRaises(ValueError):
+            classify_intent_batch([UTTERANCES_PROMISE_STRONG, UTTERANCES_REFUSAL])
+
+        # The valid item is answered from cache on the next run
+        self.assertEqual(classify_intent(UTTERANCES_PROMISE_STRONG)["label"], "repayment_promise")
+        client.chat.completions.create.assert_not_called()
+
+
+class TestClassifyIntentsPacked(unittest.TestCase):
+    """Test packed multi-call intent classification."""
+
+    def setUp(self):
+        _llm_cache.clear()
+        self.addCleanup(_llm_cache.clear)
+        patcher = patch("src.nlp.intent._client", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _reply(content: str) -> MagicMock:
+        choice = MagicMock()
+        choice.message.content = content
+        return MagicMock(choices=[choice])
+
+    @patch("src.nlp.intent.MINI_PROMPT_ENABLED", True)
+    @patch("src.nlp.intent.OpenAI")
+    def test_shares_cache_with_single_call_for_short_speech(self, mock_openai_cls):
+        create = mock_openai_cls.return_value.chat.completions.create
+        create.return_value = self._reply(
+            '{"label": "deflection", "confidence": 0.7, "conditionality": "low"}'
+        )
+
+        single = classify_intent(UTTERANCES_DEFLECTION)
+        packed = classify_intents_packed([UTTERANCES_DEFLECTION])
+
+        self.assertEqual(packed, [single])
+        create.assert_called_once()
+
+    @patch("src.nlp.intent.OpenAI")
+    def test_one_request_per_k_calls(self, mock_openai_cls):
+        create = mock_openai_cls.return_value.chat.completions.create
+        create.side_effect = [
+            self._reply(json.dumps([
+                {"id": 2, "label": "refusal", "confidence": 0.8, "conditionality": "low"},
+                {"id": 1, "label": "repayment_promise", "confidence": 0.9, "conditionality": "low"},
+            ])),
+            self._reply(json.dumps([
+                {"id": 1, "label": "dispute", "confidence": 0.7, "conditionality": "medium"},
+            ])),
+        ]
+        calls = [
+            UTTERANCES_PROMISE_STRONG,
+            UTTERANCES_AGENT_ONLY,
+            UTTERANCES_REFUSAL,
+            [{"speaker": "CUSTOMER", "text": "This charge is wrong"}],
+        ]
+
+        results = classify_intents_packed(calls, k=2)
+
+        self.assertEqual([r["label"] for r in results],
+                         ["repayment_promise", "unknown", "refusal", "dispute"])
+        self.assertEqual(create.call_count, 2)
+        first = create.call_args_list[0].kwargs
+        self.assertIn("[[1]]", first["messages"][1]["content"])
+        self.assertIn("[[2]]", first["messages"][1]["content"])
+        self.assertEqual(first["max_tokens"], 80)
+
+    @patch("src.nlp.intent.OpenAI")
+    def test_dropped_block_falls_back_to_single_call(self, mock_openai_cls):
+        create = mock_openai_cls.return_value.chat.completions.create
+        create.side_effect = [
+            self._reply(json.dumps([
+                {"id": 1, "label": "repayment_promise", "confidence": 0.9, "conditionality": "low"},
+                {"id": 2, "label": "not_a_label", "confidence": 0.9, "conditionality": "low"},
+            ])),
+            self._reply('{"label": "refusal", "confidence": 0.8, "conditionality": "low"}'),
+        ]
+
+        results = classify_intents_packed([UTTERANCES_PROMISE_STRONG, UTTERANCES_REFUSAL])
+
+        self.assertEqual([r["label"] for r in results], ["repayment_promise", "refusal"])
+        self.assertEqual(create.call_count, 2)
+
+    def test_invalid_k_raises(self):
+        with self.assertRaises(ValueError):
+            classify_intents_packed([UTTERANCES_REFUSAL], k=0)
+
+
+class TestClassifyIntentsMany(unittest.TestCase):
+    """Test the concurrent intent fan-out and its RPM/TPM budget."""
+
+    def setUp(self):
+        _llm_cache.clear()
+        self.addCleanup(_llm_cache.clear)
+        _async_openai._clients.clear()
+        self.addCleanup(_async_openai._clients.clear)
+        for target, value in (
+            ("src.nlp.intent._budget", _MinuteBudget(max_rpm=0, max_tpm=0)),
+        ):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @patch("src.nlp._async_openai.AsyncOpenAI")
+    def test_concurrency_bounded_and_order_kept(self, mock_async_cls):
+        in_flight = peak = 0
+        replies = {
+            "I will pay": "repayment_promise",
+            "I am not going to pay": "refusal",
+        }
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            user_msg = kwargs["messages"][1]["content"]
+            label = next(v for k, v in replies.items() if k in user_msg)
+            reply = MagicMock()
+            reply.message.content = json.dumps(
+                {"label": label, "confidence": 0.9, "conditionality": "low"}
+            )
+            return MagicMock(choices=[reply])
+
+        mock_async_cls.return_value.chat.completions.create = create
+        calls = [
+            [{"speaker": "CUSTOMER", "text": f"I will pay {i}"}] if i % 2 == 0
+            else [{"speaker": "CUSTOMER", "text": f"I am not going to pay {i}"}]
+            for i in range(8)
+        ] + [UTTERANCES_AGENT_ONLY]
+
+        results = asyncio.run(classify_intents_many(calls, max_concurrent=3))
+
+        self.assertEqual(
+            [r["label"] for r in results],
+            ["repayment_promise", "refusal"] * 4 + ["unknown"],
+        )
+        self.assertEqual(peak, 3)
+
+    def test_rpm_window_makes_caller_wait(self):
+        budget = _MinuteBudget(max_rpm=2, max_tpm=0)
+        self.assertIsNone(budget._reserve(10))
+        self.assertIsNone(budget._reserve(10))
+        wait = budget._reserve(10)
+        self.assertGreater(wait, 59.0)
+
+    def test_tpm_window_admits_oversized_request_when_empty(self):
+        budget = _MinuteBudget(max_rpm=0, max_tpm=100)
+        self.assertIsNone(budget._reserve(500))
+        self.assertIsNotNone(budget._reserve(1))
+
+    def test_rate_limit_pauses_callers(self):
+        budget = _MinuteBudget(max_rpm=0, max_tpm=0)
+        budget.report_rate_limit()
+        self.assertGreater(budget._reserve(1), 14.0)
+
+
 class TestDetectContradictionsWithMock(unittest.TestCase):
     """Test detect_contradictions with mocked OpenAI API."""
 
+    def setUp(self):
+        # Drop the cached client and replies so each test's patched
+        # OpenAI is actually called
+        patcher = patch("src.nlp.contradictions._client", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        _llm_cache.clear()
+        self.addCleanup(_llm_cache.clear)
+
+    @patch("src.nlp.contradictions.HEURISTIC_SKIP_ENABLED", True)
+    @patch("src.nlp.contradictions.OpenAI")
+    def test_heuristic_skip(self, mock_openai_cls):
+        mock_client = mock_openai_cls.return_value
+        mock_client.chat.completions.create.return_value = self._mock_openai_response(
+            '{"contradictions_detected": true}'
+        )
+        # "never ... loan" vs "already paid" is a candidate pair
+        self.assertTrue(detect_contradictions(UTTERANCES_CONTRADICTION))
+        # Nothing negated — no call
+        self.assertFalse(detect_contradictions(UTTERANCES_PROMISE_STRONG))
+        mock_client.chat.completions.create.assert_called_once()
+
+    @patch("src.nlp.contradictions.STREAM_ENABLED", True)
+    @patch("src.nlp.contradictions.OpenAI")
+    def test_stream_stops_at_verdict(self, mock_openai_cls):
+        def chunk(text):
+            c = MagicMock()
+            c.choices[0].delta.content = text
+            return c
+
+        stream = MagicMock()
+        stream.__iter__.return_value = iter(
+            [chunk('{"contradictions'), chunk('_detected": '), chunk("false"), chunk("}")]
+        )
+        mock_openai_cls.return_value.chat.completions.create.return_value = stream
+
+        self.assertFalse(detect_contradictions(UTTERANCES_CONTRADICTION))
+        stream.close.assert_called_once()
+        _, kwargs = mock_openai_cls.return_value.chat.completions.create.call_args
+        self.assertTrue(kwargs["stream"])
+
+    @patch("src.nlp.contradictions.OpenAI")
+    def test_identical_prompt_served_from_cache(self, mock_openai_cls):
+        mock_client = mock_openai_cls.return_value
+        mock_client.chat.completions.create.return_value = self._mock_openai_response(
+            '{"contradictions_detected": true}'
+        )
+        self.assertTrue(detect_contradictions(UTTERANCES_CONTRADICTION))
+        with patch("src.nlp.contradictions._rate_limiter") as mock_limiter:
+            self.assertTrue(detect_contradictions(UTTERANCES_CONTRADICTION))
+            mock_limiter.acquire.assert_not_called()
+        mock_client.chat.completions.create.assert_called_once()
+
     def _mock_openai_response(self, content: str):
         mock_message = MagicMock()
         mock_message.content = content
@@ -553,6 +1155,37 @@ class TestDetectContradictionsWithMock(unittest.TestCase):
         self.assertFalse(result)
         mock_openai_cls.return_value.chat.completions.create.assert_not_called()
 
+    @patch("src.nlp.contradictions.OpenAI")
+    def test_short_prompt_example_pair_reaches_model(self, mock_openai_cls):
+        # The system prompt's own examples are under 60 characters in total
+        mock_client = MagicMock()
+        mock_openai_cls.return_value = mock_client
+        mock_client.chat.completions.create.return_value = self._mock_openai_response(
+            '{"contradictions_detected": true}'
+        )
+        for first, second in [
+            ("I will pay tomorrow", "I have no money at all"),
+            ("I never got a loan", "I paid half already"),
+        ]:
+            with self.subTest(first=first):
+                _llm_cache.clear()
+                utts = [
+                    {"speaker": "CUSTOMER", "text": first, "start_time": 0, "end_time": 1},
+                    {"speaker": "CUSTOMER", "text": second, "start_time": 1, "end_time": 2},
+                ]
+                self.assertTrue(detect_contradictions(utts))
+        self.assertEqual(mock_client.chat.completions.create.call_count, 2)
+
+    @patch("src.nlp.contradictions.OpenAI")
+    def test_repeated_utterance_skips_model(self, mock_openai_cls):
+        text = "I will transfer the full outstanding amount by Friday evening."
+        utts = [
+            {"speaker": "CUSTOMER", "text": text, "start_time": 0, "end_time": 4},
+            {"speaker": "CUSTOMER", "text": text, "start_time": 4, "end_time": 8},
+        ]
+        self.assertFalse(detect_contradictions(utts))
+        mock_openai_cls.return_value.chat.completions.create.assert_not_called()
+
     @patch("src.nlp.contradictions.OpenAI")
     def test_only_customer_text_sent(self, mock_openai_cls):
         mock_client = MagicMock()
@@ -573,9 +1206,330 @@ class TestDetectContradictionsWithMock(unittest.TestCase):
         self.assertIn("I already paid most of it", user_msg)
 
 
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    """Test the sync and async token-bucket acquire paths."""
+
+    def test_burst_is_served_without_waiting(self):
+        limiter = _AdaptiveRateLimiter(max_rpm=60, burst=3)
+        with patch("src.nlp.contradictions.time.sleep") as mock_sleep:
+            for _ in range(3):
+                limiter.acquire()
+        mock_sleep.assert_not_called()
+
+    def test_concurrent_acquires_consume_exactly(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        limiter = _AdaptiveRateLimiter(max_rpm=1, burst=200)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: limiter.acquire(), range(200)))
+        self.assertLess(limiter._tokens, 1.0)
+
+    def test_sharded_limiter_splits_budget(self):
+        limiter = _ShardedRateLimiter(max_rpm=60, burst=8, shards=4)
+        self.assertEqual(len(limiter.shards), 4)
+        self.assertTrue(all(shard._burst == 2 for shard in limiter.shards))
+        self.assertTrue(all(shard._base_interval == 4.0 for shard in limiter.shards))
+
+        limiter.report_rate_limit()
+        self.assertTrue(all(shard._interval == 8.0 for shard in limiter.shards))
+
+        # Successes are global too: every shard recovers
+        for _ in range(10):
+            limiter.report_success()
+        self.assertTrue(all(shard._interval == 4.0 for shard in limiter.shards))
+
+    def test_sharded_limiter_total_burst_not_exceeded(self):
+        for burst, shards in [(5, 4), (3, 8), (8, 4)]:
+            limiter = _ShardedRateLimiter(max_rpm=60, burst=burst, shards=shards)
+            self.assertEqual(sum(shard._burst for shard in limiter.shards), burst)
+
+    def test_sharded_limiter_spreads_threads(self):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        limiter = _ShardedRateLimiter(max_rpm=60, burst=400, shards=4)
+        barrier = threading.Barrier(8)
+
+        def acquire(_):
+            barrier.wait()  # keep all 8 worker threads alive at once
+            limiter.acquire()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(acquire, range(8)))
+        used = [shard for shard in limiter.shards if shard._tokens < shard._burst]
+        self.assertGreater(len(used), 1)
+
+    def test_sharded_limiter_spreads_coroutines(self):
+        limiter = _ShardedRateLimiter(max_rpm=240, burst=4, shards=4)
+
+        async def run():
+            with patch("src.nlp.contradictions.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+                await asyncio.gather(*(limiter.acquire_async() for _ in range(4)))
+            return mock_sleep
+
+        mock_sleep = asyncio.run(run())
+        mock_sleep.assert_not_awaited()
+        self.assertTrue(all(shard._tokens < 1.0 for shard in limiter.shards))
+
+    @patch.dict(os.environ, {"CONTRADICTION_MAX_RPM": "0"})
+    def test_zero_rpm_disables_throttling(self):
+        from src.nlp.contradictions import _NullRateLimiter, _build_rate_limiter
+
+        self.assertIsInstance(_build_rate_limiter(), _NullRateLimiter)
+
+    def test_acquire_async_sleeps_on_the_loop(self):
+        limiter = _AdaptiveRateLimiter(max_rpm=60, burst=1)
+
+        async def run():
+            await limiter.acquire_async()
+            with patch("src.nlp.contradictions.asyncio.sleep", new=AsyncMock()) as mock_sleep, \
+                    patch("src.nlp.contradictions.time.sleep") as mock_time_sleep:
+                await limiter.acquire_async()
+            return mock_sleep, mock_time_sleep
+
+        mock_sleep, mock_time_sleep = asyncio.run(run())
+        mock_sleep.assert_awaited_once()
+        self.assertAlmostEqual(mock_sleep.await_args.args[0], 1.0, delta=0.05)
+        mock_time_sleep.assert_not_called()
+
+
+class TestRetryLimiterHooks(unittest.TestCase):
+    """Test that 429s inside the retry loop reach the limiter immediately."""
+
+    @patch("src.openai_retry.time.sleep")
+    def test_each_429_and_success_reported(self, _mock_sleep):
+        from src.openai_retry import chat_completions_with_retry
+
+        class RateLimitError(Exception):
+            status_code = 429
+
+        client = MagicMock()
+        client.chat.completions.create.side_effect = [
+            RateLimitError("429"), RateLimitError("429"), "ok",
+        ]
+        on_rate_limit, on_success = MagicMock(), MagicMock()
+
+        result = chat_completions_with_retry(
+            client, on_rate_limit=on_rate_limit, on_success=on_success, model="m",
+        )
+        self.assertEqual(result, "ok")
+        self.assertEqual(on_rate_limit.call_count, 2)
+        on_success.assert_called_once()
+        client.chat.completions.create.assert_called_with(model="m")
+
+
+class TestRawOpenAI(unittest.TestCase):
+    """Test the raw httpx chat-completions path."""
+
+    @patch("src.openai_retry.time.sleep")
+    def test_retries_429_and_merges_extra_body(self, _mock_sleep):
+        import httpx
+        from src.nlp import _raw_openai
+
+        seen = []
+
+        def handler(request):
+            seen.append(json.loads(request.content))
+            if len(seen) == 1:
+                return httpx.Response(429, text="slow down")
+            return httpx.Response(200, json={
+                "choices": [{"message": {"content": '{"contradictions_detected": false}'}}],
+            })
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        on_rate_limit = MagicMock()
+        with patch("src.nlp._raw_openai.get_sync_client", return_value=client):
+            content = _raw_openai.complete(
+                on_rate_limit=on_rate_limit,
+                model="gpt-4o-mini",
+                messages=[],
+                extra_body={"prompt_cache_key": "k"},
+            )
+
+        self.assertEqual(content, '{"contradictions_detected": false}')
+        self.assertEqual(len(seen), 2)
+        self.assertEqual(seen[0]["prompt_cache_key"], "k")
+        self.assertNotIn("extra_body", seen[0])
+        on_rate_limit.assert_called_once()
+
+
+class TestCombinedCustomerAnalysis(unittest.TestCase):
+    """NLP_COMBINED_CALL: contradictions + entities share one OpenAI call."""
+
+    def setUp(self):
+        _llm_cache.clear()
+        self.addCleanup(_llm_cache.clear)
+        for target, value in (
+            ("src.nlp._combined.COMBINED_ENABLED", True),
+            ("src.nlp._combined._client", None),
+        ):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+    @patch("src.nlp.contradictions.OpenAI")
+    @patch("src.nlp._combined.OpenAI")
+    def test_single_call_serves_both(self, mock_combined_cls, mock_contra_cls):
+        mock_client = mock_combined_cls.return_value
+        reply = MagicMock()
+        reply.message.content = (
+            '{"contradictions_detected": true, '
+            '"payment_commitment": "tomorrow", "amount_mentioned": 50000}'
+        )
+        mock_client.chat.completions.create.return_value = MagicMock(choices=[reply])
+
+        self.assertTrue(detect_contradictions(UTTERANCES_CONTRADICTION))
+        entities = extract_entities(UTTERANCES_CONTRADICTION)
+
+        self.assertEqual(
+            entities, {"payment_commitment": "tomorrow", "amount_mentioned": 50000.0},
+        )
+        mock_client.chat.completions.create.assert_called_once()
+        mock_contra_cls.return_value.chat.completions.create.assert_not_called()
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+    @patch("src.nlp._combined.OpenAI")
+    def test_truncated_reply_not_cached(self, mock_combined_cls):
+        mock_client = mock_combined_cls.return_value
+        reply = MagicMock()
+        reply.message.content = '{"contradictions_detected": true, "payment_comm'
+        mock_client.chat.completions.create.return_value = MagicMock(choices=[reply])
+
+        analyze_combined(["I will pay tomorrow"])
+        analyze_combined(["I will pay tomorrow"])
+
+        self.assertEqual(mock_client.chat.completions.create.call_count, 2)
+
+
+class TestExtractEntitiesWithMock(unittest.TestCase):
+    """Test extract_entities with a mocked OpenAI client."""
+
+    def setUp(self):
+        _llm_cache.clear()
+        self.addCleanup(_llm_cache.clear)
+        patcher = patch("src.nlp.entity_extractor._client", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+    @patch("src.nlp.entity_extractor.OpenAI")
+    def test_client_reused_across_calls(self, mock_openai_cls):
+        reply = MagicMock()
+        reply.message.content = '{"payment_commitment": "today", "amount_mentioned": null}'
+        mock_client = mock_openai_cls.return_value
+        mock_client.chat.completions.create.return_value = MagicMock(choices=[reply])
+
+        extract_entities(UTTERANCES_CONTRADICTION)
+        _llm_cache.clear()
+        entities = extract_entities(UTTERANCES_CONTRADICTION)
+
+        self.assertEqual(entities, {"payment_commitment": "today", "amount_mentioned": None})
+        mock_openai_cls.assert_called_once()
+        self.assertEqual(mock_client.chat.completions.create.call_count, 2)
+
+
+class TestAsyncBatching(unittest.TestCase):
+    """Test the async variants and their micro-batcher."""
+
+    def setUp(self):
+        _llm_cache.clear()
+        self.addCleanup(_llm_cache.clear)
+        _async_openai._clients.clear()
+        self.addCleanup(_async_openai._clients.clear)
+        for target, value in (
+            ("src.nlp.contradictions._rate_limiter", _AdaptiveRateLimiter(max_rpm=6000, burst=10)),
+        ):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _async_reply(content: str) -> AsyncMock:
+        reply = MagicMock()
+        reply.message.content = content
+        return AsyncMock(return_value=MagicMock(choices=[reply]))
+
+    @patch("src.nlp._async_openai.AsyncOpenAI")
+    def test_identical_concurrent_calls_share_one_request(self, mock_async_cls):
+        create = self._async_reply('{"contradictions_detected": true}')
+        mock_async_cls.return_value.chat.completions.create = create
+
+        async def run():
+            return await asyncio.gather(
+                *(detect_contradictions_async(UTTERANCES_CONTRADICTION) for _ in range(3)),
+                detect_contradictions_async(UTTERANCES_PROMISE_STRONG),
+            )
+
+        self.assertEqual(asyncio.run(run()), [True, True, True, True])
+        self.assertEqual(create.await_count, 2)
+
+    @patch("src.nlp._async_openai.AsyncOpenAI")
+    def test_async_short_speech_skips_call(self, mock_async_cls):
+        self.assertFalse(asyncio.run(detect_contradictions_async(UTTERANCES_SINGLE_CUSTOMER)))
+        mock_async_cls.assert_not_called()
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+    @patch("src.nlp._async_openai.AsyncOpenAI")
+    def test_entities_async(self, mock_async_cls):
+        mock_async_cls.return_value.chat.completions.create = self._async_reply(
+            '{"payment_commitment": "tomorrow", "amount_mentioned": 500}'
+        )
+        entities = asyncio.run(extract_entities_async(UTTERANCES_PROMISE_STRONG))
+        self.assertEqual(entities, {"payment_commitment": "tomorrow", "amount_mentioned": 500.0})
+
+    @patch("src.nlp._async_openai.AsyncOpenAI")
+    def test_each_event_loop_gets_its_own_client(self, mock_async_cls):
+        mock_async_cls.side_effect = lambda **kwargs: MagicMock()
+
+        async def clients():
+            return get_async_openai(), get_async_openai(), get_async_client()
+
+        first = asyncio.run(clients())
+        second = asyncio.run(clients())
+
+        self.assertIs(first[0], first[1])
+        self.assertIsNot(first[0], second[0])
+        self.assertIsNot(first[2], second[2])
+        self.assertEqual(mock_async_cls.call_count, 2)
+
+    def test_loop_local_drops_closed_loops(self):
+        values = LoopLocal(object)
+
+        async def get():
+            return values.get()
+
+        asyncio.run(get())
+        asyncio.run(get())
+        self.assertEqual(len(values._values), 1)
+
+    def test_batcher_error_reaches_every_caller(self):
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        async def run():
+            batcher = Batcher(max_wait_ms=1)
+            return await asyncio.gather(
+                batcher.run("k", failing), batcher.run("k", failing),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+        self.assertEqual(len(calls), 1)
+
+
 class TestPhase6OutputStructure(unittest.TestCase):
     """Verify combined Phase 6 output matches the required schema."""
 
+    def setUp(self):
+        _llm_cache.clear()
+        self.addCleanup(_llm_cache.clear)
+
+    @patch("src.nlp.contradictions._client", None)
     @patch("src.nlp.intent.OpenAI")
     @patch("src.nlp.contradictions.OpenAI")
     def test_full_output_structure(self, mock_contra_cls, mock_intent_cls):
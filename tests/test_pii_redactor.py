@@ -0,0 +1,154 @@
+"""
+tests/test_pii_redactor.py
+===========================
+Phase 6 Tests — PII redaction
+
+Tests verify:
+    1. Every PII class redacts to the same output as the original
+       pass-by-pass implementation (card, Aadhaar, SSN, phone, OTP
+       forward/reverse, bank account with context, email)
+    2. The digit probe never skips text that can still contain PII
+       (3-digit text, "@"-only text, sparse bank accounts)
+    3. ASCII control separators (\\x1c-\\x1f) keep the Unicode patterns
+    4. PII_CARD_LUHN=1 never leaves part of a card-length number in clear
+    5. redact_utterances gives identical results with the process pool on
+
+All tests are OFFLINE and deterministic.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.nlp import _procpool
+from src.nlp.pii_redactor import redact_pii, redact_utterances
+
+
+# ===================================================================
+# Expected outputs — captured from the original pass-by-pass redactor
+# ===================================================================
+
+_CASES = [
+    ("My card is 4111 1111 1111 1111 thanks", "My card is <CREDIT_CARD> thanks"),
+    ("Aadhaar 1234 5678 9012 please", "Aadhaar <GOVT_ID> please"),
+    ("SSN is 123-45-6789", "SSN is <GOVT_ID>"),
+    ("Call me on +91 98765 43210", "Call me on <PHONE_NUMBER>"),
+    ("Call me on 98765 43210", "Call me on <PHONE_NUMBER>"),
+    ("Office (022) 2345-6789", "Office <PHONE_NUMBER>"),
+    ("Dial 555-123-4567 now", "Dial <PHONE_NUMBER> now"),
+    ("The OTP is 482910", "The OTP is <OTP>"),
+    ("verification code: 4821", "verification code: <OTP>"),
+    ("4821 is the code", "<OTP> is the code"),
+    ("my account number is 123456789012", "my account number is <BANK_ACCOUNT>"),
+    ("a/c no. 98765-43210-11", "a/c no. <BANK_ACCOUNT>"),
+    ("write to ravi.k@bank.co.in", "write to <EMAIL>"),
+    ("no pii here", "no pii here"),
+]
+
+
+class TestRedactPii(unittest.TestCase):
+    """Output is unchanged from the pass-by-pass implementation."""
+
+    def test_known_outputs(self):
+        for text, expected in _CASES:
+            with self.subTest(text=text):
+                self.assertEqual(redact_pii(text), expected)
+
+    def test_empty_text(self):
+        self.assertEqual(redact_pii(""), "")
+
+
+class TestDigitProbe(unittest.TestCase):
+    """The fast skip must never hide a match."""
+
+    def test_three_digit_text_unchanged(self):
+        self.assertEqual(redact_pii("I can pay 500"), "I can pay 500")
+
+    def test_ordinal_unchanged(self):
+        self.assertEqual(redact_pii("I will pay on the 15th"), "I will pay on the 15th")
+
+    def test_at_sign_only_unchanged(self):
+        self.assertEqual(redact_pii("ping me @ravi"), "ping me @ravi")
+
+    def test_email_without_digits_redacted(self):
+        self.assertEqual(redact_pii("mail a@b.co"), "mail <EMAIL>")
+
+    def test_short_bank_number_unchanged(self):
+        self.assertEqual(redact_pii("account number 12"), "account number 12")
+
+    def test_sparse_bank_account_redacted(self):
+        # Only 3 digits, but \x1f lets the bank pattern span the gap.
+        self.assertEqual(redact_pii("a/c 1 - \x1f 6 5"), "a/c <BANK_ACCOUNT>")
+
+    def test_two_digit_bank_account_with_separators(self):
+        # Same output as the original implementation for sparse digits.
+        self.assertEqual(redact_pii("a/c 1 - - 5"), "a/c 1 - - 5")
+
+
+class TestControlSeparators(unittest.TestCase):
+    """\\x1c-\\x1f are whitespace to the Unicode patterns only."""
+
+    def test_file_separator_in_bank_account(self):
+        self.assertEqual(
+            redact_pii("a/c 786\x1c0982251153312768"), "a/c <BANK_ACCOUNT>8"
+        )
+
+    def test_separator_before_otp(self):
+        self.assertEqual(
+            redact_pii("code\t\x1c\t9620\tno"), "code\t\x1c\t<OTP>\tno"
+        )
+
+
+class TestLuhnCards(unittest.TestCase):
+    """PII_CARD_LUHN=1 relabels card matches, never leaks digits."""
+
+    def test_disabled_redacts_any_card_length_number(self):
+        self.assertEqual(
+            redact_pii("card 4539 5787 6362 1487"), "card <CREDIT_CARD>"
+        )
+
+    @patch("src.nlp.pii_redactor.LUHN_CARDS_ENABLED", True)
+    def test_valid_card_redacted_as_card(self):
+        self.assertEqual(
+            redact_pii("card 4539 5787 6362 1486"), "card <CREDIT_CARD>"
+        )
+
+    @patch("src.nlp.pii_redactor.LUHN_CARDS_ENABLED", True)
+    def test_invalid_card_redacted_whole(self):
+        self.assertEqual(
+            redact_pii("card 4539 5787 6362 1487"), "card <REDACTED_NUMBER>"
+        )
+
+
+class TestRedactUtterancesPool(unittest.TestCase):
+    """Worker processes give the same result, in order."""
+
+    def tearDown(self):
+        if _procpool._pool is not None:
+            _procpool._pool.shutdown()
+            _procpool._pool = None
+
+    @patch("src.nlp._procpool._PARALLEL_MIN_TEXTS", 4)
+    @patch("src.nlp._procpool._WORKERS", 2)
+    def test_pool_matches_in_process(self):
+        texts = [text for text, _ in _CASES] * 3
+        utterances = [
+            {"speaker": "customer", "text": text, "start_time": i, "end_time": i + 1}
+            for i, text in enumerate(texts)
+        ]
+        result = redact_utterances(utterances)
+
+        self.assertIsNotNone(_procpool._pool)
+        self.assertEqual(
+            [utt["text"] for utt in result],
+            [expected for _, expected in _CASES] * 3,
+        )
+        self.assertEqual([utt["start_time"] for utt in result], list(range(len(texts))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+"""
+tests/test_quality.py
+======================
+Phase 1 Tests — Audio quality heuristics
+
+Tests verify:
+    1. Noise level classification from the low-energy frame floor
+    2. Call stability from zero-crossing-rate variability
+    3. Speech naturalness flags unnaturally regular pitch
+    4. Optional compiled kernels agree with the NumPy path
+    5. Degenerate / undecodable input falls back to neutral defaults
+
+All tests are OFFLINE — audio is synthetic.
+"""
+
+import io
+import os
+import sys
+import unittest
+import wave
+from unittest.mock import patch
+
+import numpy as np
+
+# Ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.audio import _quality_kernels
+from src.audio.quality import (
+    analyze_audio_quality,
+    _wav_to_float32,
+    _estimate_call_stability,
+    _estimate_noise_level,
+    _estimate_speech_naturalness,
+    _frame_stats,
+    _frame_zero_crossings,
+    _parse_pcm_wav,
+    _wav_to_float32_pcm16,
+)
+
+
+# ===================================================================
+# Test fixtures
+# ===================================================================
+
+def _noise(seconds: float, amplitude: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return (amplitude * rng.standard_normal(int(seconds * 16000))).astype(np.float32)
+
+
+def _rms(pcm: np.ndarray) -> np.ndarray:
+    return _frame_stats(pcm)[0]
+
+
+def _zcr(pcm: np.ndarray) -> np.ndarray:
+    return _frame_stats(pcm)[1]
+
+
+def _to_wav(pcm: np.ndarray) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes((np.clip(pcm, -1.0, 1.0) * 32767).astype(np.int16).tobytes())
+    return buf.getvalue()
+
+
+# ===================================================================
+# Noise level
+# ===================================================================
+
+
+class TestNoiseLevel(unittest.TestCase):
+
+    def test_quiet_floor_is_low(self):
+        self.assertEqual(_estimate_noise_level(_rms(_noise(5.0, 0.005))), "low")
+
+    def test_moderate_floor_is_medium(self):
+        self.assertEqual(_estimate_noise_level(_rms(_noise(5.0, 0.05))), "medium")
+
+    def test_loud_floor_is_high(self):
+        self.assertEqual(_estimate_noise_level(_rms(_noise(5.0, 0.2))), "high")
+
+    def test_floor_ignores_loud_frames(self):
+        # 20% quiet frames dominate the estimate even if the rest is loud
+        pcm = np.concatenate([_noise(1.0, 0.005), _noise(4.0, 0.3, seed=1)])
+        self.assertEqual(_estimate_noise_level(_rms(pcm)), "low")
+
+    def test_too_short_is_medium(self):
+        self.assertEqual(_estimate_noise_level(_rms(_noise(0.1, 0.3))), "medium")
+
+
+# ===================================================================
+# Call stability
+# ===================================================================
+
+
+class TestCallStability(unittest.TestCase):
+
+    def test_steady_noise_is_high(self):
+        self.assertEqual(_estimate_call_stability(_zcr(_noise(5.0, 0.1))), "high")
+
+    def test_dropouts_lower_stability(self):
+        # Alternating 100 ms of noise and digital silence → ZCR swings 0 ↔ ~0.5
+        pcm = _noise(6.0, 0.1).reshape(-1, 1600)
+        pcm[1::2] = 0.0
+        self.assertEqual(_estimate_call_stability(_zcr(pcm.ravel())), "medium")
+
+    def test_all_silence_is_low(self):
+        silence = np.zeros(16000, dtype=np.float32)
+        self.assertEqual(_estimate_call_stability(_zcr(silence)), "low")
+
+    def test_frame_stats_drop_partial_frame(self):
+        rms, zcr = _frame_stats(_noise(1.05, 0.1))
+        self.assertEqual((len(rms), len(zcr)), (10, 10))
+
+    def test_packed_zero_crossings_match_bool_diff(self):
+        # Frame sizes that are and are not multiples of 8 bits
+        for frame_size in (1600, 13):
+            frames = _noise(1.0, 0.1)[: 4 * frame_size].reshape(4, frame_size)
+            expected = np.count_nonzero(np.diff(np.signbit(frames), axis=1), axis=1)
+            np.testing.assert_array_equal(_frame_zero_crossings(frames), expected)
+            with patch("src.audio.quality._bitwise_count", None):
+                np.testing.assert_array_equal(_frame_zero_crossings(frames), expected)
+
+
+# ===================================================================
+# Speech naturalness
+# ===================================================================
+
+
+class TestSpeechNaturalness(unittest.TestCase):
+
+    def test_steady_tone_is_suspicious(self):
+        t = np.arange(5 * 16000) / 16000
+        tone = (0.3 * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+        self.assertEqual(_estimate_speech_naturalness(tone), "suspicious")
+
+    def test_noise_is_normal(self):
+        self.assertEqual(_estimate_speech_naturalness(_noise(5.0, 0.3)), "normal")
+
+
+# ===================================================================
+# Optional compiled kernels (run as plain Python without numba)
+# ===================================================================
+
+
+class TestQualityKernels(unittest.TestCase):
+
+    @patch("src.audio._quality_kernels.NUMBA_AVAILABLE", False)
+    def test_frame_rms_zcr_matches_numpy(self):
+        pcm = _noise(0.5, 0.1)
+        rms, zcr = _quality_kernels.frame_rms_zcr(pcm, 400)
+        ref_rms, ref_zcr = _frame_stats(pcm, 400)
+        np.testing.assert_allclose(rms, ref_rms, rtol=1e-5)
+        np.testing.assert_allclose(zcr, ref_zcr)
+
+    def test_autocorr_peak_matches_argmax(self):
+        window = _noise(1.0, 0.3)[:1200]
+        autocorr = np.correlate(window, window, mode="full")[len(window) - 1 :]
+        expected = int(np.argmax(autocorr[32:200]))
+        self.assertEqual(_quality_kernels.autocorr_peak(window, 32, 200), expected)
+
+
+# ===================================================================
+# analyze_audio_quality
+# ===================================================================
+
+
+class TestAnalyzeAudioQuality(unittest.TestCase):
+
+    def test_returns_all_keys(self):
+        result = analyze_audio_quality(_to_wav(_noise(3.0, 0.01)))
+        self.assertEqual(
+            set(result), {"noise_level", "call_stability", "speech_naturalness"},
+        )
+
+    def test_decodes_to_unit_range(self):
+        samples = np.array([0, 16384, -32768, 32767], dtype=np.int16)
+        pcm = _wav_to_float32(_to_wav(samples / 32767.0))
+        self.assertEqual(pcm.dtype, np.float32)
+        self.assertEqual(len(pcm), 4)
+        self.assertAlmostEqual(float(pcm[2]), -32767 / 32768.0, places=6)
+
+    def test_riff_parser_skips_extra_chunks(self):
+        wav = _to_wav(_noise(0.01, 0.1))
+        # Insert a word-aligned LIST chunk (odd payload + pad) before "data"
+        extra = b"LIST" + (3).to_bytes(4, "little") + b"abc\x00"
+        data_at = wav.index(b"data")
+        patched = bytearray(wav[:data_at] + extra + wav[data_at:])
+        patched[4:8] = (len(patched) - 8).to_bytes(4, "little")
+        offset, size, sampwidth = _parse_pcm_wav(bytes(patched))
+        self.assertEqual((offset, size, sampwidth), (data_at + len(extra) + 8, 320, 2))
+        np.testing.assert_array_equal(
+            _wav_to_float32(bytes(patched)), _wav_to_float32(wav),
+        )
+
+    def test_pcm16_fast_path_matches_general_decoder(self):
+        wav = _to_wav(_noise(0.5, 0.1))
+        np.testing.assert_array_equal(_wav_to_float32_pcm16(wav), _wav_to_float32(wav))
+
+    def test_pcm16_fast_path_declines_other_layouts(self):
+        wav = _to_wav(_noise(0.01, 0.1))
+        data_at = wav.index(b"data")
+        extra = b"LIST" + (4).to_bytes(4, "little") + b"abcd"
+        self.assertIsNone(_wav_to_float32_pcm16(wav[:data_at] + extra + wav[data_at:]))
+        self.assertIsNone(_wav_to_float32_pcm16(b"RIFF"))
+
+    def test_riff_parser_rejects_non_pcm(self):
+        wav = bytearray(_to_wav(_noise(0.01, 0.1)))
+        wav[20:22] = (3).to_bytes(2, "little")  # WAVE_FORMAT_IEEE_FLOAT
+        self.assertIsNone(_parse_pcm_wav(bytes(wav)))
+        self.assertIsNone(_parse_pcm_wav(b"not a wav"))
+
+    @patch("src.audio.quality.soundfile", None)
+    @patch("src.audio.quality._parse_pcm_wav", return_value=None)
+    def test_wave_fallback_matches_fast_path(self, _mock_parse):
+        wav = _to_wav(_noise(0.1, 0.1))
+        expected = np.frombuffer(wav[44:], dtype=np.int16) / np.float32(32768.0)
+        np.testing.assert_array_equal(_wav_to_float32(wav), expected)
+
+    def test_undecodable_audio_returns_defaults(self):
+        result = analyze_audio_quality(b"not a wav")
+        self.assertEqual(result["noise_level"], "medium")
+        self.assertEqual(result["call_stability"], "medium")
+        self.assertEqual(result["speech_naturalness"], "normal")
+
+
+if __name__ == "__main__":
+    unittest.main()